@@ -1,3 +1,13 @@
-from . import _version
+def __getattr__(name):
+    """
+    Resolve `__version__` lazily, so that importing the package doesn't
+    run any `git` subprocess in source checkouts.
+    """
+    if name == "__version__":
+        from . import _version
 
-__version__ = _version.get_versions()["version"]
+        version = _version.get_versions()["version"]
+        globals()["__version__"] = version
+        return version
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,93 @@
+"""
+In-process cache of the Census sync runs that reached a terminal state.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional
+
+
+class SyncRunCache:
+    """
+    Thread-safe, size-bounded LRU cache of Census Sync Run API responses.
+
+    A sync run that completed or failed never changes, so its response can be
+    served from memory on subsequent reads. Clients only store responses of sync
+    runs in a terminal state: the cached responses are shared between callers
+    and must be treated as read-only.
+
+    Args:
+        maxsize: Maximum number of sync runs to keep; the least recently used
+            one is evicted when the cache is full. Defaults to `1024`.
+
+    Example:
+        ```python
+        from prefect_census.cache import SyncRunCache
+        from prefect_census.census_client import CensusClient
+
+        cache = SyncRunCache(maxsize=10_000)
+        client = CensusClient(credentials=credentials, sync_run_cache=cache)
+        client.get_sync_run(sync_run_id=1234)
+        client.get_sync_run(sync_run_id=1234)
+        print(cache.hits, cache.misses)
+        ```
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._responses: "OrderedDict[int, Dict]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cached responses.
+        """
+        return len(self._responses)
+
+    def get(self, sync_run_id: int) -> Optional[Dict]:
+        """
+        Returns the cached response of a sync run, if any.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+
+        Returns:
+            The cached JSON response of the Census Sync Run API, or `None`.
+        """
+        with self._lock:
+            response = self._responses.get(sync_run_id)
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._responses.move_to_end(sync_run_id)
+
+            return response
+
+    def put(self, sync_run_id: int, response: Dict) -> None:
+        """
+        Store the response of a sync run, evicting the least recently used
+        sync run if the cache is full.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            response: The JSON response of the Census Sync Run API.
+        """
+        with self._lock:
+            self._responses[sync_run_id] = response
+            self._responses.move_to_end(sync_run_id)
+            if len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all the cached responses and reset the counters.
+        """
+        with self._lock:
+            self._responses.clear()
+            self.hits = 0
+            self.misses = 0
@@ -1,137 +1,1014 @@
 """
-An object that can be used to interact with Census APIs.
+Objects that can be used to interact with Census APIs.
+
+This module doesn't depend on Prefect, so that it can be imported quickly
+by scripts that only need to call Census APIs: clients can be created
+with a plain access token instead of a `CensusCredentials` block.
 """
-from time import sleep
-from typing import Dict, Optional
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from threading import Lock
+from time import monotonic, perf_counter, sleep
+from types import SimpleNamespace, TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout, Timeout
+from typing_extensions import Protocol
+
+from prefect_census.cache import SyncRunCache
+from prefect_census.codecs import JSONCodec, get_default_codec
+from prefect_census.exceptions import (
+    CensusAPIFailureException,
+    CensusSyncRunFailedException,
+    CensusSyncRunTimeoutException,
+)
+from prefect_census.metrics import MetricsSink
+from prefect_census.models import SyncRun, SyncTriggerResult, parse_timestamp
+from prefect_census.polling import ExponentialBackoffPolling, PollingStrategy
+from prefect_census.rate_limiter import TokenBucket, get_shared_rate_limiter
+from prefect_census.retries import RetryPolicy
+from prefect_census.singleflight import AsyncSingleFlight, SingleFlight
 
-from prefect_census.credentials import CensusCredentials
-from prefect_census.exceptions import CensusAPIFailureException
+if TYPE_CHECKING:
+    import httpx
 
+    from prefect_census.webhooks import SyncRunWebhookReceiver
 
-class CensusClient:
+
+class _SecretLike(Protocol):
     """
-    Class that represents a Census client that can be used
-    to interact with Census APIs.
+    A secret value, like a `pydantic.SecretStr`.
+    """
+
+    def get_secret_value(self) -> str:
+        """
+        Returns the secret value.
+        """
+        ...
+
+
+class _HasAccessToken(Protocol):
+    """
+    Census credentials, like the `CensusCredentials` block.
+    """
+
+    @property
+    def access_token(self) -> Union[str, _SecretLike]:
+        """
+        The Census access token, either a string or a secret.
+        """
+        ...
+
+
+# A Census access token, or an object with an `access_token` attribute,
+# either a string or a `pydantic.SecretStr`, like the `CensusCredentials` block
+CensusCredentialsLike = Union[str, _HasAccessToken]
+
+# Statuses of the sync runs that will not change anymore
+TERMINAL_SYNC_RUN_STATUSES = frozenset({"completed", "failed"})
+
+# Seconds without API calls after which a client shared by the process
+# is released, see `CensusClient.for_credentials`
+SHARED_CLIENT_IDLE_TIMEOUT = 300.0
+
+_shared_clients: Dict[Tuple, "CensusClient"] = {}
+_shared_clients_lock = Lock()
+
+
+def _get_access_token(credentials: CensusCredentialsLike) -> str:
+    """
+    Returns the access token of Census credentials.
+
+    Args:
+        credentials: Census credentials, or a plain access token.
+
+    Returns:
+        The Census access token.
+    """
+    if isinstance(credentials, str):
+        return credentials
+
+    access_token = credentials.access_token
+    if isinstance(access_token, str):
+        return access_token
+    return access_token.get_secret_value()
+
+
+def _get_credentials_fingerprint(credentials: CensusCredentialsLike) -> str:
+    """
+    Returns a fingerprint of the access token of Census credentials, that can be
+    used to identify them without keeping the token itself around.
+
+    Args:
+        credentials: Census credentials, or a plain access token.
+
+    Returns:
+        The SHA-256 hex digest of the access token.
+    """
+    return hashlib.sha256(_get_access_token(credentials).encode()).hexdigest()
+
+
+def close_shared_clients() -> None:
+    """
+    Close and release all the clients shared by the process,
+    see `CensusClient.for_credentials`.
+    """
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+
+    for client in clients:
+        client.close()
+
+
+class _BaseCensusClient:
+    """
+    Base class that holds the logic shared by the synchronous
+    and the asynchronous Census clients.
     """
 
     # Census API base url
-    __CENSUS_API_URL = "https://app.getcensus.com/api"
+    _CENSUS_API_URL = "https://app.getcensus.com/api"
 
     # Census API version
-    __CENSUS_API_VERSION = "v1"
+    _CENSUS_API_VERSION = "v1"
+
+    def __init__(
+        self,
+        credentials: CensusCredentialsLike,
+        polling_strategy: Optional[PollingStrategy] = None,
+        requests_per_second: Optional[float] = None,
+        burst_size: int = 1,
+        retry_policy: Optional[RetryPolicy] = None,
+        connect_timeout: float = 10,
+        read_timeout: float = 60,
+        sync_run_cache: Optional[SyncRunCache] = None,
+        json_codec: Optional[JSONCodec] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        base_url: Optional[str] = None,
+        typed_responses: bool = False,
+        webhook_receiver: Optional["SyncRunWebhookReceiver"] = None,
+    ) -> None:
+        if polling_strategy is None and webhook_receiver is not None:
+            polling_strategy = webhook_receiver.polling_strategy
 
-    def __init__(self, credentials: CensusCredentials) -> None:
         self.credentials = credentials
+        self.typed_responses = typed_responses
+        self._last_used_at = monotonic()
+        self.webhook_receiver = webhook_receiver
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.metrics_sink = metrics_sink or MetricsSink()
+        self.json_codec = json_codec or get_default_codec()
+        self.sync_run_cache = sync_run_cache
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.polling_strategy = polling_strategy or ExponentialBackoffPolling()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter: Optional[TokenBucket] = None
+        if requests_per_second is not None:
+            self.rate_limiter = get_shared_rate_limiter(
+                key=self._get_credentials_fingerprint(),
+                requests_per_second=requests_per_second,
+                burst_size=burst_size,
+            )
 
-    def __get_base_url(self) -> str:
+    def _get_base_url(self) -> str:
         """
         Returns Census API base url.
         Returns:
             Census base URL.
         """
-        return f"{self.__CENSUS_API_URL}/{self.__CENSUS_API_VERSION}"
+        if self.base_url is not None:
+            return self.base_url
+        return f"{self._CENSUS_API_URL}/{self._CENSUS_API_VERSION}"
 
-    def __get_sync_run_url(self, sync_run_id: int) -> str:
+    def _get_sync_run_url(self, sync_run_id: int) -> str:
         """
         Return the URL of the sync run given its identifier
 
         Returns:
             Census Sync Run URL
         """
-        return f"{self.__get_base_url()}/sync_runs/{sync_run_id}"
+        return f"{self._get_base_url()}/sync_runs/{sync_run_id}"
 
-    def __get_trigger_sync_run_url(self, sync_id: int) -> str:
+    def _get_trigger_sync_run_url(self, sync_id: int) -> str:
         """
         Return the URL to trigger a sync given its identifier
 
         Returns:
             Census Trigger Sync URL
         """
-        return f"{self.__get_base_url()}/syncs/{sync_id}/trigger"
+        return f"{self._get_base_url()}/syncs/{sync_id}/trigger"
+
+    def _get_syncs_url(self) -> str:
+        """
+        Return the URL to list the syncs of the workspace
+
+        Returns:
+            Census List Syncs URL
+        """
+        return f"{self._get_base_url()}/syncs"
+
+    def _get_sync_runs_url(self, sync_id: int) -> str:
+        """
+        Return the URL to list the runs of a sync given its identifier
+
+        Returns:
+            Census List Sync Runs URL
+        """
+        return f"{self._get_base_url()}/syncs/{sync_id}/sync_runs"
+
+    def _get_access_token(self) -> str:
+        """
+        Returns the access token used to authenticate against Census APIs.
+
+        Returns:
+            The Census access token.
+        """
+        return _get_access_token(self.credentials)
+
+    def _get_credentials_fingerprint(self) -> str:
+        """
+        Returns a fingerprint of the access token, that can be used to identify
+        the credentials without keeping the token itself around.
+
+        Returns:
+            The SHA-256 hex digest of the access token.
+        """
+        return _get_credentials_fingerprint(self.credentials)
+
+    @staticmethod
+    def _check_api_response(
+        status_code: int, reason: str, data: Optional[Dict]
+    ) -> Dict:
+        """
+        Check that the API call succeeded.
+
+        Args:
+            status_code: The HTTP status code of the response.
+            reason: The HTTP reason phrase of the response.
+            data: The decoded JSON body of the response.
+
+        Raises:
+            `CensusAPIFailureException` if the response code is not 200
+                or if the API responded with an error.
+
+        Returns:
+            The API JSON response.
+        """
+        if status_code != 200:
+            err = f"There was an error while calling Census API: {reason}"
+            raise CensusAPIFailureException(err)
+
+        if data["status"] == "error":
+            err = data["message"]
+            msg = f"Census API responded with error: {err}"
+            raise CensusAPIFailureException(msg)
+
+        return data
+
+    @staticmethod
+    def _check_sync_run(response: Dict) -> Dict:
+        """
+        Check that the sync run did not fail.
+
+        Args:
+            response: The JSON response of the Census Sync Run API.
+
+        Raises:
+            `CensusSyncRunFailedException` if the sync run failed.
+
+        Returns:
+            The JSON response of the Census Sync Run API.
+        """
+        if response["data"]["status"] == "failed":
+            err = response["data"]["error_message"]
+            msg = f"Census API failure: {err}"
+            raise CensusSyncRunFailedException(msg, response=response)
+
+        return response
+
+    @staticmethod
+    def _get_trigger_sync_run_params(force_full_sync: bool) -> Optional[Dict]:
+        """
+        Returns the query parameters of the Census Trigger Sync Run API.
+
+        Args:
+            force_full_sync: Whether the sync should run in full refresh mode or not.
+
+        Returns:
+            The query parameters, if any.
+        """
+        return {"force_full_sync": force_full_sync} if force_full_sync else None
+
+    @staticmethod
+    def _get_batch_error_response(exc: Exception) -> Dict:
+        """
+        Returns the result reported for a sync that could not be triggered
+        as part of a batch, shaped like a Census API error response.
+
+        Args:
+            exc: The exception raised while triggering the sync.
+
+        Returns:
+            A JSON-like error response.
+        """
+        return {"status": "error", "message": str(exc)}
+
+    def _to_sync_run(self, response: Dict) -> Union[Dict, SyncRun]:
+        """
+        Returns the response of the Census Sync Run API as a `SyncRun`
+        if the client returns typed responses.
+
+        Args:
+            response: The JSON response of the API.
+
+        Returns:
+            The sync run, or the JSON response itself.
+        """
+        return SyncRun.from_response(response) if self.typed_responses else response
+
+    def _to_sync_trigger_result(self, response: Dict) -> Union[Dict, SyncTriggerResult]:
+        """
+        Returns the response of the Census Trigger Sync Run API, or an error
+        response, as a `SyncTriggerResult` if the client returns typed responses.
+
+        Args:
+            response: The JSON response of the API, or the error response.
+
+        Returns:
+            The trigger result, or the response itself.
+        """
+        if not self.typed_responses:
+            return response
+        return SyncTriggerResult.from_response(response)
+
+    def _get_cached_sync_run(self, sync_run_id: int) -> Optional[Dict]:
+        """
+        Returns the cached response of a sync run, if the client has a cache.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+
+        Returns:
+            The cached JSON response of the Census Sync Run API, or `None`.
+        """
+        if self.sync_run_cache is None:
+            return None
+        return self.sync_run_cache.get(sync_run_id)
+
+    def _cache_sync_run(self, sync_run_id: int, response: Dict) -> None:
+        """
+        Store the response of a sync run in the cache of the client, if any,
+        provided that the sync run reached a terminal state.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            response: The JSON response of the Census Sync Run API.
+        """
+        if (
+            self.sync_run_cache is not None
+            and response["data"]["status"] in TERMINAL_SYNC_RUN_STATUSES
+        ):
+            self.sync_run_cache.put(sync_run_id, response)
+
+    def _get_endpoint_label(self, api_url: str) -> str:
+        """
+        Returns the path of an API, with identifiers replaced by `{id}`, to label
+        metrics without creating a series per sync or sync run.
+
+        Args:
+            api_url: The URL of the API.
+
+        Returns:
+            The API path, e.g. `/syncs/{id}/trigger`.
+        """
+        path = api_url[len(self._get_base_url()) :]
+        return "/".join(
+            "{id}" if segment.isdigit() else segment for segment in path.split("/")
+        )
+
+    def _record_request(
+        self,
+        http_method: str,
+        endpoint: str,
+        started_at: float,
+        status_code: Optional[int] = None,
+    ) -> None:
+        """
+        Report an HTTP request to the metrics sink.
+
+        Args:
+            http_method: The HTTP method of the request.
+            endpoint: The API path, as returned by `_get_endpoint_label`.
+            started_at: The `time.perf_counter` instant the request was sent.
+            status_code: The HTTP status code of the response, or `None`
+                if no response was received.
+        """
+        self.metrics_sink.observe_request(
+            http_method=http_method,
+            endpoint=endpoint,
+            status="error" if status_code is None else str(status_code),
+            duration=perf_counter() - started_at,
+        )
+
+    def _record_retry(self, http_method: str, endpoint: str, delay: float) -> None:
+        """
+        Report the retry of an API call, and the wait before it, to the metrics sink.
+
+        Args:
+            http_method: The HTTP method of the API call.
+            endpoint: The API path, as returned by `_get_endpoint_label`.
+            delay: The number of seconds to wait before the retry.
+        """
+        self.metrics_sink.increment_retries(http_method=http_method, endpoint=endpoint)
+        self.metrics_sink.observe_sleep(reason="retry", duration=delay)
+
+    @contextmanager
+    def _record_sync_run_wait(self) -> Iterator[SimpleNamespace]:
+        """
+        Context manager that reports the wait for a sync run to the metrics sink
+        when it ends, however it ends.
+
+        Returns:
+            A namespace whose `polls` attribute must be incremented
+                at each status check.
+        """
+        wait = SimpleNamespace(polls=0)
+        started_at = perf_counter()
+        outcome = "error"
+        try:
+            yield wait
+            outcome = "completed"
+        except CensusSyncRunTimeoutException:
+            outcome = "timeout"
+            raise
+        except CensusSyncRunFailedException:
+            outcome = "failed"
+            raise
+        finally:
+            self.metrics_sink.observe_sync_run_wait(
+                polls=wait.polls, duration=perf_counter() - started_at, outcome=outcome
+            )
+
+    @staticmethod
+    def _get_next_poll_delay(
+        sync_run_id: int,
+        sync_run_response: Dict,
+        intervals: Iterator[float],
+        deadline: Optional[float],
+    ) -> float:
+        """
+        Returns the number of seconds to wait before checking again the status
+        of a sync run that has not completed yet.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            sync_run_response: The last JSON response of the Census Sync Run API.
+            intervals: The wait times yielded by the polling strategy.
+            deadline: The `time.monotonic` instant after which waiting must stop.
+
+        Raises:
+            `CensusSyncRunTimeoutException` if the deadline has passed.
+
+        Returns:
+            The number of seconds to wait.
+        """
+        delay = next(intervals)
+
+        if deadline is not None:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise _BaseCensusClient._get_sync_run_timeout_exception(
+                    sync_run_id=sync_run_id, last_response=sync_run_response
+                )
+            delay = min(delay, remaining)
+
+        return delay
+
+    @staticmethod
+    def _get_sync_run_timeout_exception(
+        sync_run_id: int, last_response: Optional[Dict]
+    ) -> CensusSyncRunTimeoutException:
+        """
+        Returns the exception to raise when a sync run does not complete in time.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            last_response: The last JSON response of the Census Sync Run API,
+                if any.
+
+        Returns:
+            The exception, whose message includes the last known sync run status.
+        """
+        status = last_response["data"]["status"] if last_response else "unknown"
+        msg = (
+            f"Sync run {sync_run_id} did not complete in time, "
+            f"last known status: {status}"
+        )
+        return CensusSyncRunTimeoutException(
+            msg, sync_run_id=sync_run_id, last_response=last_response
+        )
+
+    @staticmethod
+    def _get_deadline(
+        polling_strategy: PollingStrategy, timeout: Optional[float]
+    ) -> Optional[float]:
+        """
+        Returns the instant after which waiting for a sync run must stop.
+
+        Args:
+            polling_strategy: The polling strategy, which may have its own timeout.
+            timeout: Optional number of seconds to wait, from now.
+
+        Returns:
+            The earliest of the two deadlines, as a `time.monotonic` instant,
+                or `None` if there is no deadline.
+        """
+        deadlines = [polling_strategy.get_deadline()]
+        if timeout is not None:
+            deadlines.append(monotonic() + timeout)
+
+        return min((d for d in deadlines if d is not None), default=None)
+
+    @staticmethod
+    def _get_remaining_time(deadline: Optional[float]) -> Optional[float]:
+        """
+        Returns the number of seconds left before the deadline.
+
+        Args:
+            deadline: A `time.monotonic` instant, or `None`.
+
+        Returns:
+            The number of seconds left, or `None` if there is no deadline.
+        """
+        return None if deadline is None else deadline - monotonic()
+
+    @staticmethod
+    def _check_deadline(
+        api_url: str, deadline: Optional[float], delay: float = 0
+    ) -> None:
+        """
+        Check that an API call can still be made, after waiting
+        for `delay` seconds, before the deadline.
+
+        Args:
+            api_url: The URL of the API to call.
+            deadline: A `time.monotonic` instant, or `None`.
+            delay: Seconds to wait before the API call. Defaults to `0`.
+
+        Raises:
+            `CensusSyncRunTimeoutException` if the deadline would pass.
+        """
+        if deadline is not None and monotonic() + delay >= deadline:
+            raise _BaseCensusClient._get_deadline_exception(api_url)
+
+    @staticmethod
+    def _get_deadline_exception(api_url: str) -> CensusSyncRunTimeoutException:
+        """
+        Returns the exception to raise when an API call
+        does not complete before its deadline.
+
+        Args:
+            api_url: The URL of the API.
+
+        Returns:
+            The timeout exception.
+        """
+        msg = f"Census API call to {api_url} did not complete before the deadline"
+        return CensusSyncRunTimeoutException(msg)
+
+    def _get_request_timeout(
+        self, api_url: str, deadline: Optional[float]
+    ) -> Tuple[float, float]:
+        """
+        Returns the connect and read timeouts of an API call, shortened so that
+        the call doesn't last past the deadline.
+
+        Args:
+            api_url: The URL of the API to call.
+            deadline: A `time.monotonic` instant, or `None`.
+
+        Raises:
+            `CensusSyncRunTimeoutException` if the deadline has passed.
+
+        Returns:
+            The connect and read timeouts, in seconds.
+        """
+        self._check_deadline(api_url=api_url, deadline=deadline)
+        if deadline is None:
+            return self.connect_timeout, self.read_timeout
+
+        remaining = deadline - monotonic()
+        return min(self.connect_timeout, remaining), min(self.read_timeout, remaining)
+
+
+class CensusClient(_BaseCensusClient):
+    """
+    Class that represents a Census client that can be used
+    to interact with Census APIs.
+
+    The client owns a single HTTP session, backed by a connection pool, that is
+    reused across API calls. Use the client as a context manager, or call `close`,
+    to release the pooled connections deterministically.
+
+    Args:
+        credentials: Census credentials, e.g. a `CensusCredentials` block,
+            or a plain access token.
+        pool_connections: Number of connection pools to cache.
+            Defaults to `10`.
+        pool_maxsize: Maximum number of connections to keep in each pool.
+            Defaults to `10`.
+        pool_block: Whether to block when the pool has no free connections
+            instead of opening a new, non-pooled one. Defaults to `False`.
+        keep_alive: Whether to keep connections open and reuse them across
+            API calls. Defaults to `True`.
+        polling_strategy: The strategy used to wait for sync runs to complete.
+            Defaults to `ExponentialBackoffPolling()`.
+        requests_per_second: Optional maximum number of API calls per second.
+            The limit is shared by all the clients of the process that use
+            the same access token. Defaults to `None`, i.e. no limit.
+        burst_size: Maximum number of API calls that can be made at once
+            when `requests_per_second` is set. Defaults to `1`.
+        retry_policy: The policy used to retry API calls that failed because
+            of transient errors. Defaults to `RetryPolicy()`.
+        connect_timeout: Seconds to wait for a connection to Census to be
+            established. Defaults to `10`.
+        read_timeout: Seconds to wait for Census to send a response.
+            Defaults to `60`.
+        sync_run_cache: Optional cache of the sync runs that completed or failed,
+            used to serve `get_sync_run` without calling the API.
+            Defaults to `None`, i.e. no caching.
+        json_codec: The codec used to decode API responses. Defaults to the
+            fastest codec available, see `prefect_census.codecs.get_default_codec`.
+        metrics_sink: Optional sink recording API call latencies, retries,
+            sleeps and status checks per sync run. Defaults to `None`,
+            i.e. no metrics.
+        base_url: Optional base URL of the Census API, including its version,
+            e.g. the URL of a `prefect_census.testing.FakeCensusServer`.
+            Defaults to `https://app.getcensus.com/api/v1`.
+        typed_responses: Whether to return sync runs and trigger results as
+            compact `prefect_census.models` objects instead of the JSON responses
+            of the API. Defaults to `False`.
+        webhook_receiver: Optional receiver of the webhooks of the workspace.
+            Waits for sync runs then check their status as soon as their webhook
+            arrives, and otherwise according to the polling strategy, which
+            defaults to the slow one of the receiver. Defaults to `None`.
+
+    Example:
+        ```python
+        from prefect_census.census_client import CensusClient
+
+        with CensusClient(credentials=credentials) as client:
+            client.trigger_sync_run(sync_id=1234)
+        ```
+    """
+
+    def __init__(
+        self,
+        credentials: CensusCredentialsLike,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        polling_strategy: Optional[PollingStrategy] = None,
+        requests_per_second: Optional[float] = None,
+        burst_size: int = 1,
+        retry_policy: Optional[RetryPolicy] = None,
+        connect_timeout: float = 10,
+        read_timeout: float = 60,
+        sync_run_cache: Optional[SyncRunCache] = None,
+        json_codec: Optional[JSONCodec] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        base_url: Optional[str] = None,
+        typed_responses: bool = False,
+        webhook_receiver: Optional["SyncRunWebhookReceiver"] = None,
+    ) -> None:
+        super().__init__(
+            credentials=credentials,
+            polling_strategy=polling_strategy,
+            requests_per_second=requests_per_second,
+            burst_size=burst_size,
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            sync_run_cache=sync_run_cache,
+            json_codec=json_codec,
+            metrics_sink=metrics_sink,
+            base_url=base_url,
+            typed_responses=typed_responses,
+            webhook_receiver=webhook_receiver,
+        )
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.__session: Optional[Session] = None
+        self.__session_lock = Lock()
+        self.__sync_run_requests = SingleFlight()
+
+    @classmethod
+    def for_credentials(
+        cls,
+        credentials: CensusCredentialsLike,
+        idle_timeout: float = SHARED_CLIENT_IDLE_TIMEOUT,
+        **client_kwargs: Any,
+    ) -> "CensusClient":
+        """
+        Returns the client shared by the process for an access token and a set
+        of options, creating it if needed, so that its connection pool, cache and
+        other state are reused across callers, e.g. across task runs.
+        The client is thread-safe and must not be closed by its callers.
+
+        Shared clients that made no API call for `idle_timeout` seconds are
+        closed and released on the next call: a caller still holding one can
+        keep using it, with new connections.
+
+        Args:
+            credentials: Census credentials, e.g. a `CensusCredentials` block,
+                or a plain access token.
+            idle_timeout: Seconds without API calls after which other shared
+                clients are released. Defaults to `300`.
+            client_kwargs: Additional keyword arguments passed to `CensusClient`,
+                whose values must be hashable. Callers passing different options
+                get different clients.
+
+        Returns:
+            The shared client.
+
+        Example:
+            ```python
+            from prefect_census.census_client import CensusClient
+
+            client = CensusClient.for_credentials(credentials)
+            client.trigger_sync_run(sync_id=1234)
+            ```
+        """
+        key = (
+            cls,
+            _get_credentials_fingerprint(credentials),
+            tuple(sorted(client_kwargs.items())),
+        )
+        now = monotonic()
+        idle_clients = []
+        with _shared_clients_lock:
+            for other_key, client in list(_shared_clients.items()):
+                if other_key != key and now - client._last_used_at > idle_timeout:
+                    idle_clients.append(_shared_clients.pop(other_key))
+
+            client = _shared_clients.get(key)
+            if client is None:
+                client = cls(credentials=credentials, **client_kwargs)
+                _shared_clients[key] = client
+            client._last_used_at = now
+
+        # closing a client can block on its connections, so other callers
+        # must not wait for it
+        for idle_client in idle_clients:
+            idle_client.close()
+        return client
+
+    def __enter__(self) -> "CensusClient":
+        """
+        Returns the client, which is closed on exit.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Closes the client.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release its pooled connections.
+        The client can still be used afterwards: a new session will be created
+        on the next API call.
+        """
+        with self.__session_lock:
+            if self.__session is not None:
+                self.__session.close()
+                self.__session = None
 
     def __get_session(self) -> Session:
         """
-        Returns a `requests.Session` object that can be used in subsequent API calls.
+        Returns the `requests.Session` object owned by the client, creating it
+        on first use. The session is shared by all the API calls made by the client
+        so that connections (and TLS handshakes) are reused across calls.
 
         Returns:
             Session object configured with the proper headers.
         """
-        session = Session()
-        session.auth = HTTPBasicAuth(
-            username="bearer", password=self.credentials.access_token.get_secret_value()
-        )
+        with self.__session_lock:
+            if self.__session is None:
+                session = Session()
+                session.auth = HTTPBasicAuth(
+                    username="bearer", password=self._get_access_token()
+                )
+
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+
+                if not self.keep_alive:
+                    session.headers["Connection"] = "close"
+
+                self.__session = session
 
-        return session
+            return self.__session
 
     def __call_api(
-        self, api_url: str, params: Optional[Dict], http_method: str
+        self,
+        api_url: str,
+        params: Optional[Dict],
+        http_method: str,
+        deadline: Optional[float] = None,
     ) -> Dict:
         """
         Make an API call to the URL using the specified parameters and HTTP method.
+        Retryable failures are retried according to the retry policy of the client.
 
         Args:
             api_url: The URL of the API to call.
             params: Optional parameters to pass to the GET API call.
             http_method: String representing the HTTP method
                 to use to make the API call.
+            deadline: Optional `time.monotonic` instant by which the API call,
+                including its retries, must complete.
 
         Raises:
             `CensusAPIFailureException` if the response code is not 200.
+            `CensusSyncRunTimeoutException` if the deadline passes.
 
         Returns:
             The API JSON response.
         """
-
         session = self.__get_session()
         http_fn = session.get if http_method == "GET" else session.post
-        with http_fn(url=api_url, params=params) as response:
-            if response.status_code != 200:
-                err = f"There was an error while calling Census API: {response.reason}"
-                raise CensusAPIFailureException(err)
+        endpoint = self._get_endpoint_label(api_url)
+        self._last_used_at = monotonic()
+        attempt = 0
 
-            data = response.json()
+        while True:
+            # the request timeout is computed once the token is acquired,
+            # so that waiting for it cannot make the call overrun the deadline
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire()
+                if waited > 0:
+                    self.metrics_sink.observe_sleep(
+                        reason="rate_limit", duration=waited
+                    )
+            timeout = self._get_request_timeout(api_url=api_url, deadline=deadline)
 
-            if data["status"] == "error":
-                err = data["message"]
-                msg = f"Census API responded with error: {err}"
-                raise CensusAPIFailureException(msg)
+            started_at = perf_counter()
+            try:
+                response = http_fn(url=api_url, params=params, timeout=timeout)
+            except ConnectTimeout:
+                self._record_request(http_method, endpoint, started_at)
+                self._check_deadline(api_url=api_url, deadline=deadline)
+                if not self.retry_policy.should_retry(
+                    http_method=http_method, attempt=attempt, request_sent=False
+                ):
+                    raise
+                delay = self.retry_policy.get_delay(attempt=attempt)
+            except (RequestsConnectionError, Timeout):
+                self._record_request(http_method, endpoint, started_at)
+                self._check_deadline(api_url=api_url, deadline=deadline)
+                if not self.retry_policy.should_retry(
+                    http_method=http_method, attempt=attempt
+                ):
+                    raise
+                delay = self.retry_policy.get_delay(attempt=attempt)
+            else:
+                self._record_request(
+                    http_method, endpoint, started_at, response.status_code
+                )
+                with response:
+                    if not self.retry_policy.should_retry(
+                        http_method=http_method,
+                        attempt=attempt,
+                        status_code=response.status_code,
+                    ):
+                        data = (
+                            self.json_codec.loads(response.content)
+                            if response.status_code == 200
+                            else None
+                        )
+                        return self._check_api_response(
+                            status_code=response.status_code,
+                            reason=response.reason,
+                            data=data,
+                        )
+                    delay = self.retry_policy.get_delay(
+                        attempt=attempt,
+                        retry_after=response.headers.get("Retry-After"),
+                    )
 
-            return response.json()
+            self._check_deadline(api_url=api_url, deadline=deadline, delay=delay)
+            self._record_retry(http_method, endpoint, delay)
+            sleep(delay)
+            attempt += 1
 
-    def get_sync_run(self, sync_run_id: int) -> Dict:
+    def get_sync_run(
+        self, sync_run_id: int, timeout: Optional[float] = None
+    ) -> Union[Dict, SyncRun]:
         """
-        Get a Sync Run given its identifier.
+        Get a Sync Run given its identifier. Sync runs that completed or failed
+        are served from the cache of the client, if any.
+
+        Concurrent calls for the same sync run share a single API call, whose
+        response is returned to all of them and must be treated as read-only.
 
         Args:
             sync_run_id: The identifier of the sync run to retrieve.
+            timeout: Optional number of seconds within which the API call,
+                including its retries, must complete.
+
+        Raises:
+            `CensusSyncRunTimeoutException` if the API call does not complete
+                within `timeout` seconds.
 
         Returns:
             The JSON response of the [Census Sync Run API]
-                (https://docs.getcensus.com/basics/api/sync-runs#get-sync_runs-id)
+                (https://docs.getcensus.com/basics/api/sync-runs#get-sync_runs-id),
+                or a `SyncRun` if the client returns typed responses.
         """
-        url = self.__get_sync_run_url(sync_run_id=sync_run_id)
-        response = self.__call_api(
-            api_url=url,
-            params=None,
-            http_method="GET",
+        return self._to_sync_run(
+            self._get_sync_run_response(sync_run_id=sync_run_id, timeout=timeout)
         )
 
-        if response["data"]["status"] == "failed":
-            err = response["data"]["error_message"]
-            msg = f"Census API failure: {err}"
-            raise CensusAPIFailureException(msg)
+    def _get_sync_run_response(
+        self, sync_run_id: int, timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        Get the JSON response of the Census Sync Run API for a sync run,
+        see `get_sync_run`.
+        """
+        response = self._get_cached_sync_run(sync_run_id)
+        if response is None:
+            url = self._get_sync_run_url(sync_run_id=sync_run_id)
+            deadline = None if timeout is None else monotonic() + timeout
 
-        return response
+            def fetch() -> Dict:
+                """
+                Call the Sync Run API and cache the response if the sync run
+                completed or failed.
+                """
+                response = self.__call_api(
+                    api_url=url, params=None, http_method="GET", deadline=deadline
+                )
+                self._cache_sync_run(sync_run_id, response)
+                return response
+
+            try:
+                # the call is made with the deadline of the first caller:
+                # other callers call again if it passes, instead of failing
+                response = self.__sync_run_requests.do(
+                    sync_run_id,
+                    fetch,
+                    timeout=timeout,
+                    retry_on=(CensusSyncRunTimeoutException,),
+                )
+            except TimeoutError as exc:
+                raise self._get_deadline_exception(url) from exc
+
+        return self._check_sync_run(response)
 
     def trigger_sync_run(
         self,
         sync_id: int,
         force_full_sync: bool = False,
         wait_for_sync_run_completed: bool = False,
-    ) -> Dict:
+        polling_strategy: Optional[PollingStrategy] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[Dict, SyncRun, SyncTriggerResult]:
         """
         Trigger a new Sync Run given the Sync identifier.
 
@@ -141,6 +1018,15 @@ class CensusClient:
                 Defaults to `False`.
             wait_for_sync_run_completed: Whether to wait for the sync run
                 to complete or not. Defaults to `False`.
+            polling_strategy: The strategy used to wait for the sync run
+                to complete. Defaults to the polling strategy of the client.
+            timeout: Optional number of seconds within which the trigger
+                of the sync run and, if requested, the wait for its completion
+                must complete. Defaults to `None`.
+
+        Raises:
+            `CensusSyncRunTimeoutException` if the sync run does not complete
+                before the timeout, or before the timeout of the polling strategy.
 
         Returns:
             If `wait_for_sync_run_completed` is `False` then returns the JSON response
@@ -149,30 +1035,766 @@ class CensusClient:
                 Otherwise, returns the JSON response of the
                 [Census Sync Run API]
                     (https://docs.getcensus.com/basics/api/sync-runs#get-sync_runs-id).
+                If the client returns typed responses, they are returned as
+                a `SyncTriggerResult` and a `SyncRun` respectively.
         """
-        params = {"force_full_sync": force_full_sync} if force_full_sync else None
-        url = self.__get_trigger_sync_run_url(sync_id=sync_id)
+        deadline = None if timeout is None else monotonic() + timeout
+        url = self._get_trigger_sync_run_url(sync_id=sync_id)
         response = self.__call_api(
             api_url=url,
-            params=params,
+            params=self._get_trigger_sync_run_params(force_full_sync),
             http_method="POST",
+            deadline=deadline,
         )
 
         if wait_for_sync_run_completed:
+            return self.wait_for_sync_run(
+                sync_run_id=response["data"]["sync_run_id"],
+                polling_strategy=polling_strategy,
+                timeout=self._get_remaining_time(deadline),
+            )
+
+        return self._to_sync_trigger_result(response)
+
+    def trigger_sync_runs(
+        self,
+        sync_ids: List[int],
+        force_full_sync: bool = False,
+        max_concurrency: int = 10,
+    ) -> Dict[int, Union[Dict, SyncTriggerResult]]:
+        """
+        Trigger a new Sync Run for each of the given Sync identifiers,
+        sending at most `max_concurrency` requests at the same time.
+        A failure to trigger a sync doesn't prevent the others from being triggered.
 
-            wait_time = 10
-            sync_run_completed = False
-            sync_run_id = response["data"]["sync_run_id"]
+        Set `pool_maxsize` to at least `max_concurrency` so that every concurrent
+        request can reuse a pooled connection.
 
-            while not sync_run_completed:
+        Args:
+            sync_ids: The identifiers of the Syncs to trigger.
+            force_full_sync: Whether the syncs should run in full refresh mode or not.
+                Defaults to `False`.
+            max_concurrency: Maximum number of concurrent requests.
+                Defaults to `10`.
 
-                sync_run_response = self.get_sync_run(sync_run_id=sync_run_id)
-                sync_run_status = sync_run_response["data"]["status"]
+        Returns:
+            A dictionary mapping each Sync identifier to the JSON response
+                of the [Census Trigger Sync Run API]
+                (https://docs.getcensus.com/basics/api/syncs#post-syncs-id-trigger),
+                or to an error response (`{"status": "error", "message": ...}`)
+                if the sync could not be triggered. Both are returned as
+                `SyncTriggerResult` objects if the client returns typed responses.
+        """
 
-                if sync_run_status == "working":
-                    sleep(wait_time)
-                elif sync_run_status == "completed":
-                    response = sync_run_response
-                    sync_run_completed = True
+        def trigger(sync_id: int) -> Union[Dict, SyncTriggerResult]:
+            """
+            Trigger a sync, returning an error response if it fails.
+            """
+            try:
+                return self.trigger_sync_run(
+                    sync_id=sync_id, force_full_sync=force_full_sync
+                )
+            except Exception as exc:
+                return self._to_sync_trigger_result(self._get_batch_error_response(exc))
 
-        return response
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return dict(zip(sync_ids, executor.map(trigger, sync_ids)))
+
+    def __iter_pages(
+        self, api_url: str, params: Optional[Dict], prefetch: bool
+    ) -> Iterator[List[Dict]]:
+        """
+        Walk a paginated Census list API, page by page. When `prefetch` is `True`,
+        the next page is fetched in a background thread while the current one
+        is being consumed.
+
+        Args:
+            api_url: The URL of the list API to call.
+            params: Optional parameters to pass to the API call.
+            prefetch: Whether to fetch the next page in the background.
+
+        Returns:
+            An iterator of the `data` items of each page.
+        """
+
+        def fetch(page: int) -> Dict:
+            """
+            Call the API for a page of the listing.
+            """
+            return self.__call_api(
+                api_url=api_url,
+                params={**(params or {}), "page": page},
+                http_method="GET",
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page: Optional[int] = 1
+            future = executor.submit(fetch, 1) if prefetch else None
+
+            while next_page is not None:
+                response = future.result() if future else fetch(next_page)
+                next_page = (response.get("pagination") or {}).get("next_page")
+                future = (
+                    executor.submit(fetch, next_page)
+                    if prefetch and next_page
+                    else None
+                )
+
+                try:
+                    yield response["data"]
+                except GeneratorExit:
+                    if future is not None:
+                        future.cancel()
+                    raise
+
+    def iter_syncs(self, per_page: int = 100, prefetch: bool = True) -> Iterator[Dict]:
+        """
+        Iterate over all the syncs of the workspace, fetching them page by page
+        so that memory usage doesn't depend on the number of syncs.
+
+        Args:
+            per_page: Number of syncs to fetch per API call. Defaults to `100`.
+            prefetch: Whether to fetch the next page in the background while
+                the current one is being consumed. Defaults to `True`.
+
+        Returns:
+            An iterator of syncs, as returned by the [Census List Syncs API]
+                (https://docs.getcensus.com/basics/api/syncs#get-syncs).
+        """
+        for page in self.__iter_pages(
+            api_url=self._get_syncs_url(),
+            params={"per_page": per_page},
+            prefetch=prefetch,
+        ):
+            yield from page
+
+    def iter_sync_runs(
+        self,
+        sync_id: int,
+        since: Optional[datetime] = None,
+        per_page: int = 100,
+        prefetch: bool = True,
+    ) -> Iterator[Union[Dict, SyncRun]]:
+        """
+        Iterate over the runs of a sync, from the most recent to the oldest,
+        fetching them page by page so that memory usage doesn't depend
+        on the number of runs.
+
+        Args:
+            sync_id: The identifier of the sync.
+            since: Optional instant before which runs are not returned; naive
+                datetimes are considered UTC. Pagination stops at the first run
+                created before it. Defaults to `None`, i.e. all the runs.
+            per_page: Number of runs to fetch per API call. Defaults to `100`.
+            prefetch: Whether to fetch the next page in the background while
+                the current one is being consumed. Defaults to `True`.
+
+        Returns:
+            An iterator of sync runs, as returned by the [Census List Sync Runs API]
+                (https://docs.getcensus.com/basics/api/sync-runs#get-syncs-id-sync_runs),
+                or `SyncRun` objects if the client returns typed responses.
+        """
+        if since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        pages = self.__iter_pages(
+            api_url=self._get_sync_runs_url(sync_id=sync_id),
+            params={"per_page": per_page, "order": "desc"},
+            prefetch=prefetch,
+        )
+        for page in pages:
+            for sync_run in page:
+                if since and parse_timestamp(sync_run["created_at"]) < since:
+                    pages.close()
+                    return
+                yield SyncRun(sync_run) if self.typed_responses else sync_run
+
+    def wait_for_sync_run(
+        self,
+        sync_run_id: int,
+        polling_strategy: Optional[PollingStrategy] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[Dict, SyncRun]:
+        """
+        Wait for a Sync Run to complete, checking its status according
+        to the polling strategy.
+
+        Args:
+            sync_run_id: The identifier of the sync run to wait for.
+            polling_strategy: The strategy used to wait for the sync run
+                to complete. Defaults to the polling strategy of the client.
+            timeout: Optional number of seconds to wait for the sync run,
+                status checks included. Defaults to `None`.
+
+        Raises:
+            `CensusAPIFailureException` if the sync run fails.
+            `CensusSyncRunTimeoutException` if the sync run does not complete
+                before the timeout, or before the timeout of the polling strategy.
+
+        Returns:
+            The JSON response of the [Census Sync Run API]
+                (https://docs.getcensus.com/basics/api/sync-runs#get-sync_runs-id)
+                for the completed sync run, or a `SyncRun` if the client
+                returns typed responses.
+        """
+        polling_strategy = polling_strategy or self.polling_strategy
+        intervals = None
+        deadline = self._get_deadline(polling_strategy, timeout)
+        sync_run_response = None
+        waiting_since = perf_counter()
+        webhook_received = False
+
+        with self._record_sync_run_wait() as wait:
+            while True:
+                wait.polls += 1
+                try:
+                    sync_run_response = self._get_sync_run_response(
+                        sync_run_id=sync_run_id,
+                        timeout=self._get_remaining_time(deadline),
+                    )
+                except CensusSyncRunTimeoutException:
+                    raise self._get_sync_run_timeout_exception(
+                        sync_run_id=sync_run_id, last_response=sync_run_response
+                    )
+
+                if sync_run_response["data"]["status"] == "completed":
+                    polling_strategy.observe(sync_run_response["data"])
+                    return self._to_sync_run(sync_run_response)
+
+                if intervals is None:
+                    intervals = polling_strategy.refine_intervals(
+                        polling_strategy.intervals(),
+                        sync_run=sync_run_response["data"],
+                        elapsed=perf_counter() - waiting_since,
+                    )
+                delay = self._get_next_poll_delay(
+                    sync_run_id=sync_run_id,
+                    sync_run_response=sync_run_response,
+                    intervals=intervals,
+                    deadline=deadline,
+                )
+                if self.webhook_receiver is None or webhook_received:
+                    # a webhook received for the sync run is only trusted once:
+                    # the API may not show the run as completed yet
+                    self.metrics_sink.observe_sleep(reason="poll", duration=delay)
+                    sleep(delay)
+                else:
+                    started_at = perf_counter()
+                    webhook_received = (
+                        self.webhook_receiver.wait(sync_run_id, timeout=delay)
+                        is not None
+                    )
+                    self.metrics_sink.observe_sleep(
+                        reason="poll", duration=perf_counter() - started_at
+                    )
+
+
+class AsyncCensusClient(_BaseCensusClient):
+    """
+    Class that represents an asynchronous Census client that can be used
+    to interact with Census APIs from an `asyncio` event loop.
+
+    The client owns a single `httpx.AsyncClient`, backed by a connection pool,
+    that is shared by every coroutine using the client. Use the client as an
+    async context manager, or await `aclose`, to release the pooled connections.
+
+    Args:
+        credentials: Census credentials, e.g. a `CensusCredentials` block,
+            or a plain access token.
+        max_connections: Maximum number of concurrent connections.
+            Defaults to `100`.
+        max_keepalive_connections: Maximum number of idle connections
+            to keep in the pool. Defaults to `20`.
+        keepalive_expiry: Seconds after which an idle connection is closed.
+            Defaults to `5.0`.
+        transport: Optional `httpx` transport to use instead of the default one.
+        polling_strategy: The strategy used to wait for sync runs to complete.
+            Defaults to `ExponentialBackoffPolling()`.
+        requests_per_second: Optional maximum number of API calls per second.
+            The limit is shared by all the clients of the process that use
+            the same access token. Defaults to `None`, i.e. no limit.
+        burst_size: Maximum number of API calls that can be made at once
+            when `requests_per_second` is set. Defaults to `1`.
+        retry_policy: The policy used to retry API calls that failed because
+            of transient errors. Defaults to `RetryPolicy()`.
+        connect_timeout: Seconds to wait for a connection to Census to be
+            established. Defaults to `10`.
+        read_timeout: Seconds to wait for Census to send a response.
+            Defaults to `60`.
+        sync_run_cache: Optional cache of the sync runs that completed or failed,
+            used to serve `get_sync_run` without calling the API.
+            Defaults to `None`, i.e. no caching.
+        json_codec: The codec used to decode API responses. Defaults to the
+            fastest codec available, see `prefect_census.codecs.get_default_codec`.
+        metrics_sink: Optional sink recording API call latencies, retries,
+            sleeps and status checks per sync run. Defaults to `None`,
+            i.e. no metrics.
+        base_url: Optional base URL of the Census API, including its version,
+            e.g. the URL of a `prefect_census.testing.FakeCensusServer`.
+            Defaults to `https://app.getcensus.com/api/v1`.
+        typed_responses: Whether to return sync runs and trigger results as
+            compact `prefect_census.models` objects instead of the JSON responses
+            of the API. Defaults to `False`.
+        webhook_receiver: Optional receiver of the webhooks of the workspace.
+            Waits for sync runs then check their status as soon as their webhook
+            arrives, and otherwise according to the polling strategy, which
+            defaults to the slow one of the receiver. Defaults to `None`.
+
+    Example:
+        ```python
+        import asyncio
+
+        from prefect_census.census_client import AsyncCensusClient
+
+        async def trigger_all(credentials, sync_ids):
+            async with AsyncCensusClient(credentials=credentials) as client:
+                return await asyncio.gather(
+                    *[
+                        client.trigger_sync_run(
+                            sync_id=sync_id, wait_for_sync_run_completed=True
+                        )
+                        for sync_id in sync_ids
+                    ]
+                )
+        ```
+    """
+
+    def __init__(
+        self,
+        credentials: CensusCredentialsLike,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        transport: Optional["httpx.AsyncBaseTransport"] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+        requests_per_second: Optional[float] = None,
+        burst_size: int = 1,
+        retry_policy: Optional[RetryPolicy] = None,
+        connect_timeout: float = 10,
+        read_timeout: float = 60,
+        sync_run_cache: Optional[SyncRunCache] = None,
+        json_codec: Optional[JSONCodec] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        base_url: Optional[str] = None,
+        typed_responses: bool = False,
+        webhook_receiver: Optional["SyncRunWebhookReceiver"] = None,
+    ) -> None:
+        super().__init__(
+            credentials=credentials,
+            polling_strategy=polling_strategy,
+            requests_per_second=requests_per_second,
+            burst_size=burst_size,
+            retry_policy=retry_policy,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            sync_run_cache=sync_run_cache,
+            json_codec=json_codec,
+            metrics_sink=metrics_sink,
+            base_url=base_url,
+            typed_responses=typed_responses,
+            webhook_receiver=webhook_receiver,
+        )
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.transport = transport
+        self.__client: Optional["httpx.AsyncClient"] = None
+        self.__sync_run_requests = AsyncSingleFlight()
+
+    async def __aenter__(self) -> "AsyncCensusClient":
+        """
+        Returns the client, which is closed on exit.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Closes the client.
+        """
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and release its pooled connections.
+        The client can still be used afterwards: a new HTTP client will be created
+        on the next API call.
+        """
+        if self.__client is not None:
+            await self.__client.aclose()
+            self.__client = None
+
+    def __get_client(self) -> "httpx.AsyncClient":
+        """
+        Returns the `httpx.AsyncClient` object owned by the client, creating it
+        on first use.
+
+        Returns:
+            HTTP client configured with the proper authentication.
+        """
+        import httpx
+
+        if self.__client is None:
+            self.__client = httpx.AsyncClient(
+                auth=httpx.BasicAuth(
+                    username="bearer", password=self._get_access_token()
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                transport=self.transport,
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+            )
+
+        return self.__client
+
+    async def __call_api(
+        self,
+        api_url: str,
+        params: Optional[Dict],
+        http_method: str,
+        deadline: Optional[float] = None,
+    ) -> Dict:
+        """
+        Make an API call to the URL using the specified parameters and HTTP method.
+        Retryable failures are retried according to the retry policy of the client.
+
+        Args:
+            api_url: The URL of the API to call.
+            params: Optional parameters to pass to the GET API call.
+            http_method: String representing the HTTP method
+                to use to make the API call.
+            deadline: Optional `time.monotonic` instant by which the API call,
+                including its retries, must complete.
+
+        Raises:
+            `CensusAPIFailureException` if the response code is not 200.
+            `CensusSyncRunTimeoutException` if the deadline passes.
+
+        Returns:
+            The API JSON response.
+        """
+        import httpx
+
+        client = self.__get_client()
+        endpoint = self._get_endpoint_label(api_url)
+        self._last_used_at = monotonic()
+        attempt = 0
+
+        while True:
+            # the request timeout is computed once the token is acquired,
+            # so that waiting for it cannot make the call overrun the deadline
+            if self.rate_limiter is not None:
+                waited = await self.rate_limiter.acquire_async()
+                if waited > 0:
+                    self.metrics_sink.observe_sleep(
+                        reason="rate_limit", duration=waited
+                    )
+            connect_timeout, read_timeout = self._get_request_timeout(
+                api_url=api_url, deadline=deadline
+            )
+
+            started_at = perf_counter()
+            try:
+                response = await client.request(
+                    method=http_method,
+                    url=api_url,
+                    params=params,
+                    timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                self._record_request(http_method, endpoint, started_at)
+                self._check_deadline(api_url=api_url, deadline=deadline)
+                if not self.retry_policy.should_retry(
+                    http_method=http_method, attempt=attempt, request_sent=False
+                ):
+                    raise
+                delay = self.retry_policy.get_delay(attempt=attempt)
+            except httpx.TransportError:
+                self._record_request(http_method, endpoint, started_at)
+                self._check_deadline(api_url=api_url, deadline=deadline)
+                if not self.retry_policy.should_retry(
+                    http_method=http_method, attempt=attempt
+                ):
+                    raise
+                delay = self.retry_policy.get_delay(attempt=attempt)
+            else:
+                self._record_request(
+                    http_method, endpoint, started_at, response.status_code
+                )
+                if not self.retry_policy.should_retry(
+                    http_method=http_method,
+                    attempt=attempt,
+                    status_code=response.status_code,
+                ):
+                    data = (
+                        self.json_codec.loads(response.content)
+                        if response.status_code == 200
+                        else None
+                    )
+                    return self._check_api_response(
+                        status_code=response.status_code,
+                        reason=response.reason_phrase,
+                        data=data,
+                    )
+                delay = self.retry_policy.get_delay(
+                    attempt=attempt, retry_after=response.headers.get("Retry-After")
+                )
+
+            self._check_deadline(api_url=api_url, deadline=deadline, delay=delay)
+            self._record_retry(http_method, endpoint, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get_sync_run(
+        self, sync_run_id: int, timeout: Optional[float] = None
+    ) -> Union[Dict, SyncRun]:
+        """
+        Get a Sync Run given its identifier. Sync runs that completed or failed
+        are served from the cache of the client, if any.
+
+        Concurrent calls for the same sync run share a single API call, whose
+        response is returned to all of them and must be treated as read-only.
+
+        Args:
+            sync_run_id: The identifier of the sync run to retrieve.
+            timeout: Optional number of seconds within which the API call,
+                including its retries, must complete.
+
+        Raises:
+            `CensusSyncRunTimeoutException` if the API call does not complete
+                within `timeout` seconds.
+
+        Returns:
+            The JSON response of the [Census Sync Run API]
+                (https://docs.getcensus.com/basics/api/sync-runs#get-sync_runs-id),
+                or a `SyncRun` if the client returns typed responses.
+        """
+        return self._to_sync_run(
+            await self._get_sync_run_response(sync_run_id=sync_run_id, timeout=timeout)
+        )
+
+    async def _get_sync_run_response(
+        self, sync_run_id: int, timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        Get the JSON response of the Census Sync Run API for a sync run,
+        see `get_sync_run`.
+        """
+        response = self._get_cached_sync_run(sync_run_id)
+        if response is None:
+            url = self._get_sync_run_url(sync_run_id=sync_run_id)
+            deadline = None if timeout is None else monotonic() + timeout
+
+            async def fetch() -> Dict:
+                """
+                Call the Sync Run API and cache the response if the sync run
+                completed or failed.
+                """
+                response = await self.__call_api(
+                    api_url=url, params=None, http_method="GET", deadline=deadline
+                )
+                self._cache_sync_run(sync_run_id, response)
+                return response
+
+            try:
+                # the call is made with the deadline of the first caller:
+                # other callers call again if it passes, instead of failing
+                response = await self.__sync_run_requests.do(
+                    sync_run_id,
+                    fetch,
+                    timeout=timeout,
+                    retry_on=(CensusSyncRunTimeoutException,),
+                )
+            except TimeoutError as exc:
+                raise self._get_deadline_exception(url) from exc
+
+        return self._check_sync_run(response)
+
+    async def trigger_sync_run(
+        self,
+        sync_id: int,
+        force_full_sync: bool = False,
+        wait_for_sync_run_completed: bool = False,
+        polling_strategy: Optional[PollingStrategy] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[Dict, SyncRun, SyncTriggerResult]:
+        """
+        Trigger a new Sync Run given the Sync identifier.
+
+        Args:
+            sync_id: The identifier of the Sync to trigger.
+            force_full_sync: Whether the sync should run in full refresh mode or not.
+                Defaults to `False`.
+            wait_for_sync_run_completed: Whether to wait for the sync run
+                to complete or not. Defaults to `False`.
+            polling_strategy: The strategy used to wait for the sync run
+                to complete. Defaults to the polling strategy of the client.
+            timeout: Optional number of seconds within which the trigger
+                of the sync run and, if requested, the wait for its completion
+                must complete. Defaults to `None`.
+
+        Raises:
+            `CensusSyncRunTimeoutException` if the sync run does not complete
+                before the timeout, or before the timeout of the polling strategy.
+
+        Returns:
+            If `wait_for_sync_run_completed` is `False` then returns the JSON response
+                of the [Census Trigger Sync Run API]
+                    (https://docs.getcensus.com/basics/api/syncs#post-syncs-id-trigger).
+                Otherwise, returns the JSON response of the
+                [Census Sync Run API]
+                    (https://docs.getcensus.com/basics/api/sync-runs#get-sync_runs-id).
+                If the client returns typed responses, they are returned as
+                a `SyncTriggerResult` and a `SyncRun` respectively.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        url = self._get_trigger_sync_run_url(sync_id=sync_id)
+        response = await self.__call_api(
+            api_url=url,
+            params=self._get_trigger_sync_run_params(force_full_sync),
+            http_method="POST",
+            deadline=deadline,
+        )
+
+        if wait_for_sync_run_completed:
+            return await self.wait_for_sync_run(
+                sync_run_id=response["data"]["sync_run_id"],
+                polling_strategy=polling_strategy,
+                timeout=self._get_remaining_time(deadline),
+            )
+
+        return self._to_sync_trigger_result(response)
+
+    async def trigger_sync_runs(
+        self,
+        sync_ids: List[int],
+        force_full_sync: bool = False,
+        max_concurrency: int = 10,
+    ) -> Dict[int, Union[Dict, SyncTriggerResult]]:
+        """
+        Trigger a new Sync Run for each of the given Sync identifiers,
+        sending at most `max_concurrency` requests at the same time.
+        A failure to trigger a sync doesn't prevent the others from being triggered.
+
+        Args:
+            sync_ids: The identifiers of the Syncs to trigger.
+            force_full_sync: Whether the syncs should run in full refresh mode or not.
+                Defaults to `False`.
+            max_concurrency: Maximum number of concurrent requests.
+                Defaults to `10`.
+
+        Returns:
+            A dictionary mapping each Sync identifier to the JSON response
+                of the [Census Trigger Sync Run API]
+                (https://docs.getcensus.com/basics/api/syncs#post-syncs-id-trigger),
+                or to an error response (`{"status": "error", "message": ...}`)
+                if the sync could not be triggered. Both are returned as
+                `SyncTriggerResult` objects if the client returns typed responses.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def trigger(sync_id: int) -> Union[Dict, SyncTriggerResult]:
+            """
+            Trigger a sync once a slot is free, returning an error response
+            if it fails.
+            """
+            async with semaphore:
+                try:
+                    return await self.trigger_sync_run(
+                        sync_id=sync_id, force_full_sync=force_full_sync
+                    )
+                except Exception as exc:
+                    return self._to_sync_trigger_result(
+                        self._get_batch_error_response(exc)
+                    )
+
+        results = await asyncio.gather(*[trigger(sync_id) for sync_id in sync_ids])
+        return dict(zip(sync_ids, results))
+
+    async def wait_for_sync_run(
+        self,
+        sync_run_id: int,
+        polling_strategy: Optional[PollingStrategy] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[Dict, SyncRun]:
+        """
+        Wait for a Sync Run to complete, checking its status according
+        to the polling strategy.
+
+        Args:
+            sync_run_id: The identifier of the sync run to wait for.
+            polling_strategy: The strategy used to wait for the sync run
+                to complete. Defaults to the polling strategy of the client.
+            timeout: Optional number of seconds to wait for the sync run,
+                status checks included. Defaults to `None`.
+
+        Raises:
+            `CensusAPIFailureException` if the sync run fails.
+            `CensusSyncRunTimeoutException` if the sync run does not complete
+                before the timeout, or before the timeout of the polling strategy.
+
+        Returns:
+            The JSON response of the [Census Sync Run API]
+                (https://docs.getcensus.com/basics/api/sync-runs#get-sync_runs-id)
+                for the completed sync run, or a `SyncRun` if the client
+                returns typed responses.
+        """
+        polling_strategy = polling_strategy or self.polling_strategy
+        intervals = None
+        deadline = self._get_deadline(polling_strategy, timeout)
+        sync_run_response = None
+        waiting_since = perf_counter()
+        webhook_received = False
+
+        with self._record_sync_run_wait() as wait:
+            while True:
+                wait.polls += 1
+                try:
+                    sync_run_response = await self._get_sync_run_response(
+                        sync_run_id=sync_run_id,
+                        timeout=self._get_remaining_time(deadline),
+                    )
+                except CensusSyncRunTimeoutException:
+                    raise self._get_sync_run_timeout_exception(
+                        sync_run_id=sync_run_id, last_response=sync_run_response
+                    )
+
+                if sync_run_response["data"]["status"] == "completed":
+                    polling_strategy.observe(sync_run_response["data"])
+                    return self._to_sync_run(sync_run_response)
+
+                if intervals is None:
+                    intervals = polling_strategy.refine_intervals(
+                        polling_strategy.intervals(),
+                        sync_run=sync_run_response["data"],
+                        elapsed=perf_counter() - waiting_since,
+                    )
+                delay = self._get_next_poll_delay(
+                    sync_run_id=sync_run_id,
+                    sync_run_response=sync_run_response,
+                    intervals=intervals,
+                    deadline=deadline,
+                )
+                if self.webhook_receiver is None or webhook_received:
+                    # a webhook received for the sync run is only trusted once:
+                    # the API may not show the run as completed yet
+                    self.metrics_sink.observe_sleep(reason="poll", duration=delay)
+                    await asyncio.sleep(delay)
+                else:
+                    started_at = perf_counter()
+                    webhook_received = (
+                        await self.webhook_receiver.wait_async(
+                            sync_run_id, timeout=delay
+                        )
+                        is not None
+                    )
+                    self.metrics_sink.observe_sleep(
+                        reason="poll", duration=perf_counter() - started_at
+                    )
@@ -0,0 +1,111 @@
+"""
+Stores that checkpoint the sync runs triggered by a task, so that a retry
+of the task resumes waiting for the same sync run instead of triggering
+a new one.
+"""
+import abc
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional, Union
+
+
+class SyncRunCheckpointStore(abc.ABC):
+    """
+    Base class of the stores that map a key, like the identifier of a task run,
+    to the sync run it triggered.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Returns the checkpoint stored for a key, if any.
+
+        Args:
+            key: The key of the checkpoint.
+
+        Returns:
+            The checkpoint, a dictionary with `sync_id` and `sync_run_id`, or `None`.
+        """
+
+    @abc.abstractmethod
+    def put(self, key: str, sync_id: int, sync_run_id: int) -> None:
+        """
+        Store the sync run triggered for a key.
+
+        Args:
+            key: The key of the checkpoint.
+            sync_id: The identifier of the sync.
+            sync_run_id: The identifier of the triggered sync run.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Remove the checkpoint of a key, if any.
+
+        Args:
+            key: The key of the checkpoint.
+        """
+
+
+class LocalFileCheckpointStore(SyncRunCheckpointStore):
+    """
+    Store that keeps each checkpoint in a small JSON file of a local directory,
+    so that checkpoints survive the restart of the process running the task.
+    Files are replaced atomically: a crash never leaves a partial checkpoint.
+
+    Args:
+        path: The directory of the checkpoint files, created if needed.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path).expanduser()
+        self._lock = Lock()
+
+    def _get_file(self, key: str) -> Path:
+        """
+        Returns the file of the checkpoint of a key.
+        """
+        return self.path / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key)}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Returns the checkpoint read from the file of a key, if any.
+        """
+        try:
+            with open(self._get_file(key)) as checkpoint_file:
+                return json.load(checkpoint_file)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, sync_id: int, sync_run_id: int) -> None:
+        """
+        Write the checkpoint of a key to a temporary file, then move it
+        in place of the file of the key.
+        """
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as tmp_file:
+                    json.dump(
+                        {"sync_id": sync_id, "sync_run_id": sync_run_id}, tmp_file
+                    )
+                os.replace(tmp_path, self._get_file(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def delete(self, key: str) -> None:
+        """
+        Remove the file of the checkpoint of a key, if any.
+        """
+        with self._lock:
+            try:
+                self._get_file(key).unlink()
+            except FileNotFoundError:
+                pass
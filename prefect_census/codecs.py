@@ -0,0 +1,111 @@
+"""
+Codecs used to decode the JSON bodies returned by Census APIs.
+
+`orjson` and `msgspec` are optional dependencies: when one of them is installed
+it is used by default, since it decodes JSON several times faster than the
+standard library.
+"""
+import abc
+import json
+from functools import lru_cache
+from typing import Any
+
+
+class JSONCodec(abc.ABC):
+    """
+    Base class for the codecs used to decode Census API responses.
+    """
+
+    @abc.abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded document.
+        """
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    Codec based on the `json` module of the standard library.
+    """
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded document.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Codec based on [orjson](https://github.com/ijl/orjson).
+    """
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads = orjson.loads
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded document.
+        """
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    Codec based on [msgspec](https://github.com/jcrist/msgspec).
+    """
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._loads = msgspec.json.Decoder().decode
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: The raw JSON document.
+
+        Returns:
+            The decoded document.
+        """
+        return self._loads(data)
+
+
+@lru_cache(maxsize=None)
+def get_default_codec() -> JSONCodec:
+    """
+    Returns the fastest codec available: `orjson`, then `msgspec`,
+    then the standard library.
+
+    Returns:
+        The default JSON codec.
+    """
+    for codec_cls in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_cls()
+        except ImportError:
+            pass
+
+    return StdlibJSONCodec()
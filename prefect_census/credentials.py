@@ -1,7 +1,11 @@
 """Census credentials block"""
+from typing import Any
+
 from prefect.blocks.core import Block
 from pydantic import SecretStr
 
+from prefect_census.census_client import AsyncCensusClient, CensusClient
+
 
 class CensusCredentials(Block):
     """
@@ -21,3 +25,41 @@ class CensusCredentials(Block):
     _block_type_name = "Census Credentials"
 
     _logo_url = "http://TODO.foo"  # noqa
+
+    def get_client(self, **client_kwargs: Any) -> CensusClient:
+        """
+        Returns a Census client authenticated with these credentials.
+
+        Args:
+            client_kwargs: Additional keyword arguments passed to `CensusClient`.
+
+        Returns:
+            An authenticated Census client.
+        """
+        return CensusClient(credentials=self, **client_kwargs)
+
+    def get_shared_client(self, **client_kwargs: Any) -> CensusClient:
+        """
+        Returns the Census client shared by the process for these credentials
+        and options, see `CensusClient.for_credentials`. The client must not
+        be closed.
+
+        Args:
+            client_kwargs: Additional keyword arguments passed to `CensusClient`.
+
+        Returns:
+            The shared, authenticated Census client.
+        """
+        return CensusClient.for_credentials(credentials=self, **client_kwargs)
+
+    def get_async_client(self, **client_kwargs: Any) -> AsyncCensusClient:
+        """
+        Returns an asynchronous Census client authenticated with these credentials.
+
+        Args:
+            client_kwargs: Additional keyword arguments passed to `AsyncCensusClient`.
+
+        Returns:
+            An authenticated asynchronous Census client.
+        """
+        return AsyncCensusClient(credentials=self, **client_kwargs)
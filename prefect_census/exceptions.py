@@ -1,6 +1,7 @@
 """
 Exceptions to be used when interacting with Census APIs.
 """
+from typing import Any, Dict, Optional
 
 
 class CensusAPIFailureException(Exception):
@@ -9,3 +10,64 @@ class CensusAPIFailureException(Exception):
     """
 
     pass
+
+
+class CensusSyncRunFailedException(CensusAPIFailureException):
+    """
+    Exception to raise when a Census sync run fails.
+
+    Args:
+        message: The error message.
+        response: The JSON response of the Census Sync Run API for the failed run.
+    """
+
+    def __init__(self, message: str, response: Dict) -> None:
+        super().__init__(message)
+        self.response = response
+
+
+class CensusSyncRunTimeoutException(Exception):
+    """
+    Exception to raise when a Census sync run, or a call to Census APIs,
+    does not complete within the allotted time.
+
+    Args:
+        message: The error message.
+        sync_run_id: The identifier of the sync run, if known.
+        last_response: The last JSON response of the Census Sync Run API
+            for the sync run, if any.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        sync_run_id: Optional[int] = None,
+        last_response: Optional[Dict] = None,
+    ) -> None:
+        super().__init__(message)
+        self.sync_run_id = sync_run_id
+        self.last_response = last_response
+
+
+class CensusSyncResolutionException(Exception):
+    """
+    Exception to raise when a reference to a Census sync, like its name,
+    doesn't match exactly one sync.
+    """
+
+    pass
+
+
+class CensusSyncGraphFailedException(CensusAPIFailureException):
+    """
+    Exception to raise when syncs of a sync graph fail.
+
+    Args:
+        message: The error message.
+        result: The outcome of the run of the graph,
+            a `prefect_census.graph.SyncGraphResult`.
+    """
+
+    def __init__(self, message: str, result: Any) -> None:
+        super().__init__(message)
+        self.result = result
@@ -0,0 +1,83 @@
+"""
+Collection of flows to orchestrate Census syncs.
+"""
+from typing import Dict, List, Optional
+
+from prefect import flow, get_run_logger
+
+from prefect_census.credentials import CensusCredentials
+from prefect_census.exceptions import CensusSyncGraphFailedException
+from prefect_census.graph import SyncGraph
+from prefect_census.polling import FixedIntervalPolling
+
+
+@flow
+def run_sync_graph(
+    credentials: CensusCredentials,
+    graph: Dict[int, List[int]],
+    max_concurrency: int = 10,
+    force_full_sync: bool = False,
+    poll_interval: Optional[float] = None,
+) -> Dict:
+    """
+    This flow runs Census syncs that depend on each other: each sync is triggered
+    as soon as all its upstream syncs completed, so that independent syncs
+    run concurrently, up to `max_concurrency` at once.
+
+    When a sync fails, the syncs depending on it are skipped, the others keep
+    running, and the flow fails once no sync can run anymore.
+
+    Args:
+        credentials: Census credentials.
+        graph: A mapping of each sync identifier to the identifiers of the syncs
+            it depends on, e.g. `{3: [1, 2], 4: [3]}`.
+        max_concurrency: Maximum number of sync runs in progress at once.
+            Defaults to `10`.
+        force_full_sync: Whether to run the syncs in full refresh or not.
+            Defaults to `False`.
+        poll_interval: Optional number of seconds between the status checks
+            of each sync run. Defaults to `None`, i.e. exponential backoff.
+
+    Raises:
+        `CensusSyncGraphFailedException` if syncs failed.
+
+    Returns:
+        The outcome of the run, see `SyncGraphResult.to_dict`: the status and
+            timings of each sync, and the critical path of the graph.
+
+    Example:
+        ```python
+        from prefect_census.credentials import CensusCredentials
+        from prefect_census.flows import run_sync_graph
+
+        credentials = CensusCredentials.load("census")
+        run_sync_graph(credentials=credentials, graph={3: [1, 2], 4: [1], 5: [3, 4]})
+        ```
+    """
+    logger = get_run_logger()
+    sync_graph = SyncGraph(graph)
+    logger.info(
+        "Running %d syncs, %d at most at once", len(sync_graph), max_concurrency
+    )
+
+    result = sync_graph.run(
+        client=credentials.get_shared_client(),
+        max_concurrency=max_concurrency,
+        force_full_sync=force_full_sync,
+        polling_strategy=(
+            None if poll_interval is None else FixedIntervalPolling(poll_interval)
+        ),
+    )
+    logger.info(
+        "Ran the syncs in %.1fs, critical path %s took %.1fs",
+        result.duration,
+        " -> ".join(str(sync_id) for sync_id in result.critical_path),
+        result.critical_path_duration,
+    )
+
+    if result.failed:
+        msg = f"Syncs {result.failed} failed"
+        if result.skipped:
+            msg += f", syncs {result.skipped} were skipped"
+        raise CensusSyncGraphFailedException(msg, result=result)
+    return result.to_dict()
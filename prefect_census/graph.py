@@ -0,0 +1,296 @@
+"""
+Orchestration of Census syncs that depend on each other.
+"""
+from collections import deque
+from time import monotonic
+from typing import Deque, Dict, Iterable, List, Mapping, Optional, Union
+
+from prefect_census.census_client import CensusClient
+from prefect_census.models import SyncRun, SyncTriggerResult
+from prefect_census.polling import PollingStrategy
+from prefect_census.watcher import SyncRunWatcher
+
+
+class SyncGraphResult:
+    """
+    Class that reports the outcome of a run of a `SyncGraph`.
+
+    Attributes:
+        statuses: The final status of each sync: `completed`, `failed`,
+            or `skipped` when one of its upstream syncs failed.
+        responses: The last response of each sync that was triggered:
+            the response of the Census Sync Run API, or an error response
+            if the sync could not be triggered.
+        started_at: The number of seconds between the start of the run
+            and the trigger of each sync.
+        finished_at: The number of seconds between the start of the run
+            and the completion or failure of each sync.
+        duration: The number of seconds the run took.
+        critical_path: The longest chain of dependent syncs, by the durations
+            of their runs, from the most upstream sync.
+        critical_path_duration: The sum of the durations of the runs on the
+            critical path: the shortest possible duration of the whole run
+            without concurrency limit.
+    """
+
+    def __init__(self) -> None:
+        self.statuses: Dict[int, str] = {}
+        self.responses: Dict[int, Union[Dict, SyncRun, SyncTriggerResult]] = {}
+        self.started_at: Dict[int, float] = {}
+        self.finished_at: Dict[int, float] = {}
+        self.duration = 0.0
+        self.critical_path: List[int] = []
+        self.critical_path_duration = 0.0
+
+    @property
+    def failed(self) -> List[int]:
+        """
+        The syncs that failed, or could not be triggered.
+        """
+        return sorted(
+            sync_id for sync_id, status in self.statuses.items() if status == "failed"
+        )
+
+    @property
+    def skipped(self) -> List[int]:
+        """
+        The syncs that were not triggered because an upstream sync failed.
+        """
+        return sorted(
+            sync_id for sync_id, status in self.statuses.items() if status == "skipped"
+        )
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the outcome of the run as a JSON-serializable dictionary.
+
+        Returns:
+            The statuses, timings and critical path of the run.
+        """
+        return {
+            "statuses": dict(self.statuses),
+            "started_at": dict(self.started_at),
+            "finished_at": dict(self.finished_at),
+            "duration": self.duration,
+            "critical_path": list(self.critical_path),
+            "critical_path_duration": self.critical_path_duration,
+        }
+
+
+class SyncGraph:
+    """
+    Class that represents Census syncs depending on each other, as a directed
+    acyclic graph, and runs them: each sync is triggered as soon as all its
+    upstream syncs completed, so that independent branches of the graph run
+    concurrently instead of one after the other.
+
+    The sync runs are waited for by a single `SyncRunWatcher`. When a sync fails,
+    or cannot be triggered, the syncs depending on it, directly or not,
+    are skipped; the other branches of the graph keep running.
+
+    Args:
+        graph: A mapping of each sync identifier to the identifiers of the syncs
+            it depends on. Upstream syncs missing from the keys are syncs
+            without dependencies.
+
+    Raises:
+        `ValueError` if the graph has a cycle.
+
+    Example:
+        ```python
+        from prefect_census.census_client import CensusClient
+        from prefect_census.graph import SyncGraph
+
+        # 3 and 4 run concurrently once 1 and 2 completed
+        graph = SyncGraph({3: [1, 2], 4: [1, 2], 5: [3]})
+        with CensusClient(credentials=credentials) as client:
+            result = graph.run(client, max_concurrency=2)
+        print(result.statuses, result.critical_path_duration)
+        ```
+    """
+
+    def __init__(self, graph: Mapping[int, Iterable[int]]) -> None:
+        self.upstreams: Dict[int, List[int]] = {}
+        for sync_id, upstreams in graph.items():
+            self.upstreams[sync_id] = list(dict.fromkeys(upstreams))
+            for upstream in self.upstreams[sync_id]:
+                self.upstreams.setdefault(upstream, [])
+
+        self.downstreams: Dict[int, List[int]] = {
+            sync_id: [] for sync_id in self.upstreams
+        }
+        for sync_id, upstreams in self.upstreams.items():
+            for upstream in upstreams:
+                self.downstreams[upstream].append(sync_id)
+
+        self.order = self.__sort()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of syncs in the graph.
+        """
+        return len(self.upstreams)
+
+    def __sort(self) -> List[int]:
+        """
+        Sort the syncs so that each sync comes after its upstream syncs.
+
+        Raises:
+            `ValueError` if the graph has a cycle.
+
+        Returns:
+            The sorted sync identifiers.
+        """
+        remaining = {sync_id: len(ups) for sync_id, ups in self.upstreams.items()}
+        ready = deque(sync_id for sync_id, count in remaining.items() if count == 0)
+        order = []
+        while ready:
+            sync_id = ready.popleft()
+            order.append(sync_id)
+            for downstream in self.downstreams[sync_id]:
+                remaining[downstream] -= 1
+                if remaining[downstream] == 0:
+                    ready.append(downstream)
+
+        if len(order) < len(self.upstreams):
+            cycle = sorted(set(self.upstreams) - set(order))
+            raise ValueError(f"The sync graph has a cycle between syncs {cycle}")
+        return order
+
+    def __skip_downstreams(self, sync_id: int, result: SyncGraphResult) -> None:
+        """
+        Mark the syncs depending on a failed sync, directly or not, as skipped.
+        """
+        pending = deque(self.downstreams[sync_id])
+        while pending:
+            downstream = pending.popleft()
+            if downstream not in result.statuses:
+                result.statuses[downstream] = "skipped"
+                pending.extend(self.downstreams[downstream])
+
+    def __set_critical_path(self, result: SyncGraphResult) -> None:
+        """
+        Compute the critical path of a run: the chain of dependent syncs whose
+        runs took the longest in total.
+        """
+        longest: Dict[int, float] = {}
+        previous: Dict[int, Optional[int]] = {}
+        for sync_id in self.order:
+            if sync_id not in result.finished_at:
+                continue
+            upstreams = [u for u in self.upstreams[sync_id] if u in longest]
+            previous[sync_id] = max(upstreams, key=longest.get, default=None)
+            longest[sync_id] = (
+                result.finished_at[sync_id] - result.started_at[sync_id]
+            ) + (longest[previous[sync_id]] if previous[sync_id] is not None else 0)
+
+        sync_id = max(longest, key=longest.get, default=None)
+        result.critical_path_duration = longest.get(sync_id, 0.0)
+        while sync_id is not None:
+            result.critical_path.insert(0, sync_id)
+            sync_id = previous[sync_id]
+
+    def run(
+        self,
+        client: CensusClient,
+        max_concurrency: int = 10,
+        force_full_sync: bool = False,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> SyncGraphResult:
+        """
+        Run the syncs of the graph, each as soon as its upstream syncs completed.
+
+        Args:
+            client: The Census client used to trigger and wait for the syncs.
+            max_concurrency: Maximum number of sync runs in progress at once.
+                Defaults to `10`.
+            force_full_sync: Whether the syncs should run in full refresh mode
+                or not. Defaults to `False`.
+            polling_strategy: The strategy used to wait for each sync run.
+                Defaults to the polling strategy of the client.
+
+        A sync whose run status cannot be checked, or whose run does not complete
+        before the timeout of the polling strategy, is failed, with the error
+        response as its response, and its downstream syncs are skipped.
+
+        Returns:
+            The outcome of the run.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+
+        result = SyncGraphResult()
+        started_at = monotonic()
+        watcher = SyncRunWatcher(client=client, polling_strategy=polling_strategy)
+        remaining = {sync_id: len(ups) for sync_id, ups in self.upstreams.items()}
+        ready: Deque[int] = deque(
+            sync_id for sync_id in self.order if remaining[sync_id] == 0
+        )
+        running: Dict[int, int] = {}
+
+        def finish(sync_id: int, status: str, response) -> None:
+            """
+            Record the outcome of a sync and release its downstream syncs,
+            or skip them if the sync failed.
+            """
+            result.statuses[sync_id] = status
+            result.responses[sync_id] = response
+            result.finished_at[sync_id] = monotonic() - started_at
+            if status != "completed":
+                self.__skip_downstreams(sync_id, result)
+                return
+            for downstream in self.downstreams[sync_id]:
+                remaining[downstream] -= 1
+                if remaining[downstream] == 0:
+                    ready.append(downstream)
+
+        def launch() -> None:
+            """
+            Trigger the syncs that are ready, up to the concurrency limit.
+            """
+            while ready and len(running) < max_concurrency:
+                sync_id = ready.popleft()
+                result.started_at[sync_id] = monotonic() - started_at
+                try:
+                    response = client.trigger_sync_run(
+                        sync_id=sync_id, force_full_sync=force_full_sync
+                    )
+                except Exception as exc:
+                    finish(sync_id, "failed", client._get_batch_error_response(exc))
+                    continue
+
+                sync_run_id = _get_sync_run_id(response)
+                running[sync_run_id] = sync_id
+                watcher.add(sync_run_id)
+
+        launch()
+        for sync_run_id, response in watcher.watch():
+            sync_id = running.pop(sync_run_id)
+            finish(sync_id, _get_status(response), response)
+            launch()
+
+        result.duration = monotonic() - started_at
+        self.__set_critical_path(result)
+        return result
+
+
+def _get_sync_run_id(response: Union[Dict, SyncTriggerResult]) -> int:
+    """
+    Returns the identifier of the sync run triggered, from the response
+    of the Census Trigger Sync Run API.
+    """
+    if isinstance(response, SyncTriggerResult):
+        return response.sync_run_id
+    return response["data"]["sync_run_id"]
+
+
+def _get_status(response: Union[Dict, SyncRun]) -> str:
+    """
+    Returns the status of a sync run, from the response
+    of the Census Sync Run API, or `failed` for an error response.
+    """
+    if isinstance(response, SyncRun):
+        return response.status
+    if "data" not in response:
+        return "failed"
+    return response["data"]["status"]
@@ -0,0 +1,399 @@
+"""
+Sinks that record metrics about the calls made to Census APIs
+and about the time spent waiting for sync runs.
+
+The clients report to a `MetricsSink`: every API call, retry and sleep, and the
+number of status checks made to wait for each sync run. Comparing the time spent
+on the network with the time spent sleeping tells how much of a long wait
+was Census work and how much was polling overhead.
+
+`opentelemetry-api` is an optional dependency, only needed by
+`OpenTelemetryMetricsSink` (`pip install prefect-census[opentelemetry]`).
+"""
+from bisect import bisect_left
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Bucket upper bounds, in seconds, of the API call latency histogram
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Bucket upper bounds of the histogram of status checks per sync run
+DEFAULT_POLL_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Bucket upper bounds, in seconds, of the sync run wait duration histogram
+DEFAULT_WAIT_BUCKETS = (1, 10, 30, 60, 300, 600, 1800, 3600, 7200)
+
+
+class MetricsSink:
+    """
+    Base class of the sinks receiving the metrics reported by Census clients.
+    The base class discards all metrics: subclasses override the methods
+    for the metrics they record.
+    """
+
+    def observe_request(
+        self, http_method: str, endpoint: str, status: str, duration: float
+    ) -> None:
+        """
+        Record an HTTP request made to Census.
+
+        Args:
+            http_method: The HTTP method of the request.
+            endpoint: The path of the API, with identifiers replaced by `{id}`.
+            status: The HTTP status code of the response, or `error` if no
+                response was received.
+            duration: The number of seconds spent on the network.
+        """
+
+    def increment_retries(self, http_method: str, endpoint: str) -> None:
+        """
+        Record the retry of a failed API call.
+
+        Args:
+            http_method: The HTTP method of the API call.
+            endpoint: The path of the API, with identifiers replaced by `{id}`.
+        """
+
+    def observe_sleep(self, reason: str, duration: float) -> None:
+        """
+        Record time spent sleeping.
+
+        Args:
+            reason: Why the client slept: `rate_limit`, `retry` or `poll`.
+            duration: The number of seconds slept.
+        """
+
+    def observe_sync_run_wait(self, polls: int, duration: float, outcome: str) -> None:
+        """
+        Record the end of the wait for a sync run.
+
+        Args:
+            polls: The number of status checks made.
+            duration: The number of seconds spent waiting, sleeps included.
+            outcome: `completed`, `failed`, `timeout` or `error`.
+        """
+
+
+class _Histogram:
+    """
+    Cumulative histogram, in the format of Prometheus histograms.
+    """
+
+    def __init__(self, buckets: Iterable[float]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add a value to its bucket and to the sum.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class PrometheusMetricsSink(MetricsSink):
+    """
+    Thread-safe sink that aggregates metrics in memory and renders them in the
+    [Prometheus text exposition format]
+    (https://prometheus.io/docs/instrumenting/exposition_formats/),
+    without depending on a Prometheus client library.
+
+    Args:
+        namespace: Prefix of the metric names. Defaults to `census`.
+        latency_buckets: Bucket upper bounds, in seconds, of the API call
+            latency histogram.
+        poll_buckets: Bucket upper bounds of the histogram of status checks
+            per sync run.
+        wait_buckets: Bucket upper bounds, in seconds, of the sync run wait
+            duration histogram.
+
+    Example:
+        ```python
+        from prefect_census.census_client import CensusClient
+        from prefect_census.metrics import PrometheusMetricsSink
+
+        sink = PrometheusMetricsSink()
+        with CensusClient(credentials=credentials, metrics_sink=sink) as client:
+            client.trigger_sync_run(sync_id=1234, wait_for_sync_run_completed=True)
+        print(sink.render())
+        ```
+    """
+
+    def __init__(
+        self,
+        namespace: str = "census",
+        latency_buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+        poll_buckets: Iterable[float] = DEFAULT_POLL_BUCKETS,
+        wait_buckets: Iterable[float] = DEFAULT_WAIT_BUCKETS,
+    ) -> None:
+        self.namespace = namespace
+        self.latency_buckets = tuple(latency_buckets)
+        self.poll_buckets = tuple(poll_buckets)
+        self.wait_buckets = tuple(wait_buckets)
+        self._lock = Lock()
+        self._latencies: Dict[Tuple[Tuple[str, str], ...], _Histogram] = {}
+        self._requests: Dict[Tuple[Tuple[str, str], ...], float] = {}
+        self._retries: Dict[Tuple[Tuple[str, str], ...], float] = {}
+        self._sleeps: Dict[Tuple[Tuple[str, str], ...], float] = {}
+        self._polls: Dict[Tuple[Tuple[str, str], ...], _Histogram] = {}
+        self._waits: Dict[Tuple[Tuple[str, str], ...], _Histogram] = {}
+
+    @staticmethod
+    def __observe(
+        histograms: Dict[Tuple[Tuple[str, str], ...], _Histogram],
+        labels: Tuple[Tuple[str, str], ...],
+        buckets: Tuple[float, ...],
+        value: float,
+    ) -> None:
+        """
+        Add a value to the histogram of a set of labels, creating it if needed.
+        """
+        histogram = histograms.get(labels)
+        if histogram is None:
+            histogram = histograms[labels] = _Histogram(buckets)
+        histogram.observe(value)
+
+    def observe_request(
+        self, http_method: str, endpoint: str, status: str, duration: float
+    ) -> None:
+        """
+        Record an API call in the latency histogram and the request counter.
+        """
+        labels = (("endpoint", endpoint), ("method", http_method))
+        with self._lock:
+            self.__observe(self._latencies, labels, self.latency_buckets, duration)
+            key = labels + (("status", status),)
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+    def increment_retries(self, http_method: str, endpoint: str) -> None:
+        """
+        Count a retried API call.
+        """
+        key = (("endpoint", endpoint), ("method", http_method))
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def observe_sleep(self, reason: str, duration: float) -> None:
+        """
+        Add the time slept to the sleep counter of its reason.
+        """
+        key = (("reason", reason),)
+        with self._lock:
+            self._sleeps[key] = self._sleeps.get(key, 0) + duration
+
+    def observe_sync_run_wait(self, polls: int, duration: float, outcome: str) -> None:
+        """
+        Record the status checks and the duration of a sync run wait.
+        """
+        labels = (("outcome", outcome),)
+        with self._lock:
+            self.__observe(self._polls, labels, self.poll_buckets, polls)
+            self.__observe(self._waits, labels, self.wait_buckets, duration)
+
+    @staticmethod
+    def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+        """
+        Returns the labels of a sample, escaped as required by the text format.
+        """
+        formatted = []
+        for name, value in labels:
+            value = (
+                str(value)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n")
+            )
+            formatted.append(f'{name}="{value}"')
+        return "{" + ",".join(formatted) + "}" if formatted else ""
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        """
+        Returns a sample value as written in the text format.
+        """
+        if value == float("inf"):
+            return "+Inf"
+        return repr(float(value)) if isinstance(value, float) else str(value)
+
+    def __render_counter(
+        self,
+        lines: List[str],
+        name: str,
+        help_text: str,
+        samples: Dict[Tuple[Tuple[str, str], ...], float],
+    ) -> None:
+        """
+        Append the lines of a counter metric to the rendered text.
+        """
+        name = f"{self.namespace}_{name}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for labels, value in sorted(samples.items()):
+            lines.append(
+                f"{name}{self._format_labels(labels)} {self._format_value(value)}"
+            )
+
+    def __render_histogram(
+        self,
+        lines: List[str],
+        name: str,
+        help_text: str,
+        histograms: Dict[Tuple[Tuple[str, str], ...], _Histogram],
+    ) -> None:
+        """
+        Append the lines of a histogram metric to the rendered text.
+        """
+        name = f"{self.namespace}_{name}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, histogram in sorted(histograms.items()):
+            cumulative = 0
+            bounds = histogram.buckets + (float("inf"),)
+            for bound, bucket_count in zip(bounds, histogram.counts):
+                cumulative += bucket_count
+                bucket_labels = self._format_labels(
+                    labels + (("le", self._format_value(bound)),)
+                )
+                lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+            formatted_labels = self._format_labels(labels)
+            lines.append(
+                f"{name}_sum{formatted_labels} {self._format_value(histogram.sum)}"
+            )
+            lines.append(f"{name}_count{formatted_labels} {cumulative}")
+
+    def render(self) -> str:
+        """
+        Returns the recorded metrics in the Prometheus text exposition format,
+        e.g. to be served on a `/metrics` endpoint or written to a file
+        read by the node exporter.
+
+        Returns:
+            The metrics, in the Prometheus text exposition format.
+        """
+        lines: List[str] = []
+        with self._lock:
+            self.__render_histogram(
+                lines,
+                "api_request_duration_seconds",
+                "Latency of the HTTP requests made to Census APIs.",
+                self._latencies,
+            )
+            self.__render_counter(
+                lines,
+                "api_requests_total",
+                "HTTP requests made to Census APIs, by status code.",
+                self._requests,
+            )
+            self.__render_counter(
+                lines,
+                "api_retries_total",
+                "Retries of Census API calls that failed.",
+                self._retries,
+            )
+            self.__render_counter(
+                lines,
+                "sleep_seconds_total",
+                "Time spent sleeping, by reason.",
+                self._sleeps,
+            )
+            self.__render_histogram(
+                lines,
+                "sync_run_polls",
+                "Status checks made to wait for a sync run.",
+                self._polls,
+            )
+            self.__render_histogram(
+                lines,
+                "sync_run_wait_seconds",
+                "Time spent waiting for a sync run.",
+                self._waits,
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryMetricsSink(MetricsSink):
+    """
+    Sink that forwards metrics to [OpenTelemetry](https://opentelemetry.io/)
+    instruments, to be exported by the configured meter provider.
+
+    Args:
+        meter: The OpenTelemetry meter used to create the instruments.
+            Defaults to the `prefect_census` meter of the global meter provider.
+
+    Example:
+        ```python
+        from prefect_census.census_client import CensusClient
+        from prefect_census.metrics import OpenTelemetryMetricsSink
+
+        client = CensusClient(
+            credentials=credentials, metrics_sink=OpenTelemetryMetricsSink()
+        )
+        ```
+    """
+
+    def __init__(self, meter: Optional[Any] = None) -> None:
+        if meter is None:
+            from opentelemetry import metrics
+
+            meter = metrics.get_meter("prefect_census")
+
+        self.meter = meter
+        self._request_duration = meter.create_histogram(
+            "census.api.request.duration",
+            unit="s",
+            description="Latency of the HTTP requests made to Census APIs.",
+        )
+        self._requests = meter.create_counter(
+            "census.api.requests",
+            description="HTTP requests made to Census APIs, by status code.",
+        )
+        self._retries = meter.create_counter(
+            "census.api.retries",
+            description="Retries of Census API calls that failed.",
+        )
+        self._sleep_duration = meter.create_counter(
+            "census.sleep.duration",
+            unit="s",
+            description="Time spent sleeping, by reason.",
+        )
+        self._sync_run_polls = meter.create_histogram(
+            "census.sync_run.polls",
+            description="Status checks made to wait for a sync run.",
+        )
+        self._sync_run_wait_duration = meter.create_histogram(
+            "census.sync_run.wait.duration",
+            unit="s",
+            description="Time spent waiting for a sync run.",
+        )
+
+    def observe_request(
+        self, http_method: str, endpoint: str, status: str, duration: float
+    ) -> None:
+        """
+        Record an API call in the latency histogram and the request counter.
+        """
+        attributes = {"method": http_method, "endpoint": endpoint}
+        self._request_duration.record(duration, attributes=attributes)
+        self._requests.add(1, attributes={**attributes, "status": status})
+
+    def increment_retries(self, http_method: str, endpoint: str) -> None:
+        """
+        Count a retried API call.
+        """
+        self._retries.add(1, attributes={"method": http_method, "endpoint": endpoint})
+
+    def observe_sleep(self, reason: str, duration: float) -> None:
+        """
+        Add the time slept to the sleep counter of its reason.
+        """
+        self._sleep_duration.add(duration, attributes={"reason": reason})
+
+    def observe_sync_run_wait(self, polls: int, duration: float, outcome: str) -> None:
+        """
+        Record the status checks and the duration of a sync run wait.
+        """
+        attributes = {"outcome": outcome}
+        self._sync_run_polls.record(polls, attributes=attributes)
+        self._sync_run_wait_duration.record(duration, attributes=attributes)
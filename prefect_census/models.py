@@ -0,0 +1,273 @@
+"""
+Compact, typed representations of the responses of Census APIs.
+
+The models keep the fields of a response in `__slots__` instead of nested
+dictionaries, which makes them about half the size in memory and once
+pickled, e.g. as task results: they pickle as a tuple of values, without
+the field names. Timestamps are kept as returned by the API and only parsed
+when accessed.
+"""
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+
+def parse_timestamp(timestamp: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a timestamp returned by Census APIs, if any; naive timestamps
+    are considered UTC.
+
+    Args:
+        timestamp: The ISO 8601 timestamp, e.g. `2021-10-20T02:51:07.546Z`.
+
+    Returns:
+        The timezone-aware datetime, or `None`.
+    """
+    if timestamp is None:
+        return None
+    parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class SyncRun:
+    """
+    A Census sync run, as returned by the [Census Sync Run API]
+    (https://docs.getcensus.com/basics/api/sync-runs#get-sync_runs-id).
+
+    Fields that are not known to the model are kept as they are, so that
+    `to_dict` returns the response the model was built from.
+
+    Args:
+        data: The sync run, i.e. the `data` of the JSON response of the API,
+            or an item of the [Census List Sync Runs API]
+            (https://docs.getcensus.com/basics/api/sync-runs#get-syncs-id-sync_runs).
+
+    Example:
+        ```python
+        from prefect_census.census_client import CensusClient
+
+        with CensusClient(credentials=credentials, typed_responses=True) as client:
+            sync_run = client.get_sync_run(sync_run_id=1234)
+            print(sync_run.status, sync_run.records_processed, sync_run.duration)
+        ```
+    """
+
+    _FIELDS = (
+        "id",
+        "sync_id",
+        "status",
+        "source_record_count",
+        "records_processed",
+        "records_updated",
+        "records_failed",
+        "records_invalid",
+        "scheduled_execution_time",
+        "error_code",
+        "error_message",
+        "error_detail",
+        "canceled",
+        "full_sync",
+    )
+    _TIMESTAMP_FIELDS = ("created_at", "updated_at", "completed_at")
+
+    __slots__ = (
+        _FIELDS + tuple(f"_{field}" for field in _TIMESTAMP_FIELDS) + ("_extra",)
+    )
+
+    id: Optional[int]
+    sync_id: Optional[int]
+    status: Optional[str]
+    source_record_count: Optional[int]
+    records_processed: Optional[int]
+    records_updated: Optional[int]
+    records_failed: Optional[int]
+    records_invalid: Optional[int]
+    scheduled_execution_time: Optional[str]
+    error_code: Optional[str]
+    error_message: Optional[str]
+    error_detail: Optional[str]
+    canceled: Optional[bool]
+    full_sync: Optional[bool]
+
+    def __init__(self, data: Dict) -> None:
+        data = dict(data)
+        for field in self._FIELDS:
+            setattr(self, field, data.pop(field, None))
+        for field in self._TIMESTAMP_FIELDS:
+            setattr(self, f"_{field}", data.pop(field, None))
+        self._extra = data or None
+
+    @classmethod
+    def from_response(cls, response: Dict) -> "SyncRun":
+        """
+        Build a sync run from the JSON response of the Census Sync Run API.
+
+        Args:
+            response: The JSON response, with the sync run in `data`.
+
+        Returns:
+            The sync run.
+        """
+        return cls(response["data"])
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """
+        When the sync run was created.
+        """
+        return parse_timestamp(self._created_at)
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        """
+        When the sync run was last updated.
+        """
+        return parse_timestamp(self._updated_at)
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        """
+        When the sync run completed, or `None` if it did not complete yet.
+        """
+        return parse_timestamp(self._completed_at)
+
+    @property
+    def duration(self) -> Optional[float]:
+        """
+        The number of seconds the sync run took to complete, or `None`
+        if it did not complete yet.
+        """
+        if self._created_at is None or self._completed_at is None:
+            return None
+        return (self.completed_at - self.created_at).total_seconds()
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the sync run as a JSON response of the Census Sync Run API.
+
+        Returns:
+            The JSON response, with the sync run in `data`.
+        """
+        data = {field: getattr(self, field) for field in self._FIELDS}
+        for field in self._TIMESTAMP_FIELDS:
+            data[field] = getattr(self, f"_{field}")
+        if self._extra:
+            data.update(self._extra)
+        return {"status": "success", "data": data}
+
+    def __getstate__(self) -> Tuple:
+        """
+        Returns the values of the fields, pickled instead of a dictionary.
+        """
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state: Tuple) -> None:
+        """
+        Restore the values of the fields returned by `__getstate__`.
+        """
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Returns whether two sync runs have the same fields.
+        """
+        if not isinstance(other, SyncRun):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        """
+        Returns the identifiers and the status of the sync run.
+        """
+        return (
+            f"SyncRun(id={self.id!r}, sync_id={self.sync_id!r}, status={self.status!r})"
+        )
+
+
+class SyncTriggerResult:
+    """
+    The outcome of triggering a Census sync: the JSON response of the
+    [Census Trigger Sync Run API]
+    (https://docs.getcensus.com/basics/api/syncs#post-syncs-id-trigger),
+    or the error that prevented the trigger when triggering many syncs at once.
+    """
+
+    __slots__ = ("status", "sync_run_id", "message")
+
+    def __init__(
+        self,
+        status: str,
+        sync_run_id: Optional[int] = None,
+        message: Optional[str] = None,
+    ) -> None:
+        self.status = status
+        self.sync_run_id = sync_run_id
+        self.message = message
+
+    @classmethod
+    def from_response(cls, response: Dict) -> "SyncTriggerResult":
+        """
+        Build a trigger result from the JSON response of the Census Trigger
+        Sync Run API, or from an error response.
+
+        Args:
+            response: The JSON response.
+
+        Returns:
+            The trigger result.
+        """
+        data = response.get("data") or {}
+        return cls(
+            status=response.get("status"),
+            sync_run_id=data.get("sync_run_id"),
+            message=response.get("message"),
+        )
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        Whether the sync run was triggered.
+        """
+        return self.status == "success"
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the trigger result as a JSON response of the Census Trigger
+        Sync Run API, or as an error response.
+
+        Returns:
+            The JSON response.
+        """
+        if self.succeeded:
+            return {"status": self.status, "data": {"sync_run_id": self.sync_run_id}}
+        return {"status": self.status, "message": self.message}
+
+    def __getstate__(self) -> Tuple:
+        """
+        Returns the values of the fields, pickled instead of a dictionary.
+        """
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state: Tuple) -> None:
+        """
+        Restore the values of the fields returned by `__getstate__`.
+        """
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Returns whether two trigger results have the same fields.
+        """
+        if not isinstance(other, SyncTriggerResult):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        """
+        Returns the status and the sync run of the trigger result.
+        """
+        return (
+            f"SyncTriggerResult(status={self.status!r}, "
+            f"sync_run_id={self.sync_run_id!r})"
+        )
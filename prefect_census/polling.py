@@ -0,0 +1,397 @@
+"""
+Strategies that control how often the status of a Census sync run is checked
+while waiting for it to complete.
+"""
+import abc
+import random
+from threading import Lock
+from time import monotonic
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from prefect_census.models import SyncRun
+
+
+class PollingStrategy(abc.ABC):
+    """
+    Base class for the strategies used to wait for a Census sync run to complete.
+
+    Subclasses implement `intervals`, which yields the number of seconds to wait
+    before each sync run status check.
+
+    Args:
+        timeout: Optional overall number of seconds to wait for the sync run
+            to complete. Defaults to `None`, which means waiting indefinitely.
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        self.timeout = timeout
+
+    @abc.abstractmethod
+    def intervals(self) -> Iterator[float]:
+        """
+        Yields the number of seconds to wait before each status check.
+
+        Returns:
+            An endless iterator of wait times, in seconds.
+        """
+
+    def refine_intervals(
+        self, intervals: Iterator[float], sync_run: Dict, elapsed: float = 0
+    ) -> Iterator[float]:
+        """
+        Called after the first status check of a sync run, when its sync
+        is known, to adapt the wait times before the next checks.
+        Keeps the wait times yielded by `intervals` by default.
+
+        Args:
+            intervals: The wait times used so far for the sync run.
+            sync_run: The sync run, i.e. the `data` of the JSON response
+                of the Census Sync Run API.
+            elapsed: The number of seconds spent waiting for the sync run so far.
+
+        Returns:
+            An endless iterator of wait times, in seconds.
+        """
+        return intervals
+
+    def observe(self, sync_run: Union[Dict, SyncRun]) -> None:
+        """
+        Called with each sync run that completed while waiting for it,
+        so that strategies can learn from past sync runs. Does nothing
+        by default.
+
+        Args:
+            sync_run: The completed sync run, i.e. the `data` of the JSON response
+                of the Census Sync Run API, or a `SyncRun`.
+        """
+
+    def get_deadline(self) -> Optional[float]:
+        """
+        Returns the `time.monotonic` instant after which waiting must stop,
+        computed from the moment this method is called.
+
+        Returns:
+            The deadline, or `None` if the strategy has no timeout.
+        """
+        return None if self.timeout is None else monotonic() + self.timeout
+
+
+class FixedIntervalPolling(PollingStrategy):
+    """
+    Polling strategy that waits the same number of seconds between status checks.
+
+    Args:
+        interval: Seconds to wait between two consecutive status checks.
+            Defaults to `10`.
+        timeout: Optional overall number of seconds to wait for the sync run
+            to complete. Defaults to `None`.
+    """
+
+    def __init__(self, interval: float = 10, timeout: Optional[float] = None) -> None:
+        super().__init__(timeout=timeout)
+        self.interval = interval
+
+    def intervals(self) -> Iterator[float]:
+        """
+        Yields the same wait time forever.
+
+        Returns:
+            An endless iterator of wait times, in seconds.
+        """
+        while True:
+            yield self.interval
+
+
+class ExponentialBackoffPolling(PollingStrategy):
+    """
+    Polling strategy that checks the sync run status often right after
+    the sync is triggered and then backs off exponentially, so that short syncs
+    are detected quickly and long ones don't cost an API call every few seconds.
+
+    Args:
+        initial_interval: Seconds to wait before the first status check.
+            Defaults to `1`.
+        multiplier: Factor applied to the interval after each status check.
+            Defaults to `2`.
+        max_interval: Maximum number of seconds between two status checks.
+            Defaults to `60`.
+        jitter: Whether to apply "full jitter", i.e. wait a random number of seconds
+            between zero and the current interval, to avoid synchronized polling
+            across many waiting sync runs. Defaults to `True`.
+        timeout: Optional overall number of seconds to wait for the sync run
+            to complete. Defaults to `None`.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 1,
+        multiplier: float = 2,
+        max_interval: float = 60,
+        jitter: bool = True,
+        timeout: Optional[float] = None,
+    ) -> None:
+        super().__init__(timeout=timeout)
+        self.initial_interval = initial_interval
+        self.multiplier = multiplier
+        self.max_interval = max_interval
+        self.jitter = jitter
+
+    def intervals(self) -> Iterator[float]:
+        """
+        Yields exponentially growing wait times, capped at `max_interval`.
+
+        Returns:
+            An endless iterator of wait times, in seconds.
+        """
+        interval = min(self.initial_interval, self.max_interval)
+        while True:
+            yield random.uniform(0, interval) if self.jitter else interval
+            interval = min(interval * self.multiplier, self.max_interval)
+
+
+class SyncDurationEstimator:
+    """
+    Thread-safe rolling model of the duration of the runs of each Census sync.
+
+    For each sync, the estimator keeps an exponentially weighted moving average
+    of the durations of its runs, and of their absolute deviation from the
+    average, the way TCP estimates round-trip times: recent runs weigh more,
+    so that the estimate follows syncs getting slower or faster.
+
+    Args:
+        smoothing: Weight of each new duration, between 0 and 1.
+            Defaults to `0.25`.
+    """
+
+    def __init__(self, smoothing: float = 0.25) -> None:
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be between 0 and 1.")
+        self.smoothing = smoothing
+        self._estimates: Dict[int, Tuple[float, float]] = {}
+        self._last_sync_run_ids: Dict[int, int] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of syncs with a duration estimate.
+        """
+        return len(self._estimates)
+
+    def record(self, sync_id: int, duration: float) -> None:
+        """
+        Update the estimate of a sync with the duration of one of its runs.
+
+        Args:
+            sync_id: The identifier of the sync.
+            duration: The number of seconds the sync run took to complete.
+        """
+        with self._lock:
+            estimate = self._estimates.get(sync_id)
+            if estimate is None:
+                self._estimates[sync_id] = (duration, duration / 2)
+                return
+
+            mean, deviation = estimate
+            deviation += self.smoothing * (abs(duration - mean) - deviation)
+            mean += self.smoothing * (duration - mean)
+            self._estimates[sync_id] = (mean, deviation)
+
+    def observe(self, sync_run: Union[Dict, SyncRun]) -> None:
+        """
+        Update the estimate of a sync with one of its completed runs. Runs that
+        did not complete, or that were already observed last, are ignored.
+
+        Args:
+            sync_run: The sync run, i.e. the `data` of the JSON response of
+                the Census Sync Run API, an item of the Census List Sync Runs API,
+                or a `SyncRun`.
+        """
+        if not isinstance(sync_run, SyncRun):
+            sync_run = SyncRun(sync_run)
+        duration = sync_run.duration
+        if (
+            sync_run.status != "completed"
+            or sync_run.sync_id is None
+            or duration is None
+        ):
+            return
+
+        with self._lock:
+            if self._last_sync_run_ids.get(sync_run.sync_id) == sync_run.id:
+                return
+            self._last_sync_run_ids[sync_run.sync_id] = sync_run.id
+        self.record(sync_id=sync_run.sync_id, duration=max(duration, 0.0))
+
+    def observe_many(self, sync_runs: Iterable[Union[Dict, SyncRun]]) -> None:
+        """
+        Update the estimates with past sync runs, oldest first, e.g. to warm up
+        the estimator with `CensusClient.iter_sync_runs`.
+
+        Args:
+            sync_runs: The sync runs.
+        """
+        for sync_run in sync_runs:
+            self.observe(sync_run)
+
+    def get_estimate(self, sync_id: int) -> Optional[Tuple[float, float]]:
+        """
+        Returns the estimated duration of the runs of a sync.
+
+        Args:
+            sync_id: The identifier of the sync.
+
+        Returns:
+            A `(mean, deviation)` tuple, in seconds, or `None` if no run
+                of the sync was observed.
+        """
+        with self._lock:
+            return self._estimates.get(sync_id)
+
+
+class EstimatedDurationPolling(PollingStrategy):
+    """
+    Polling strategy that schedules the status checks of a sync run around the
+    moment it is expected to complete, from the durations of the past runs
+    of the same sync.
+
+    Status checks are sparse until the expected completion window, i.e. the
+    average duration plus or minus `spread` times the average deviation,
+    dense within the window, so that completion is detected quickly, and back
+    off exponentially if the sync run takes longer than expected. Syncs
+    without past runs are polled according to the `fallback` strategy.
+
+    The durations of the sync runs completing while waiting for them are
+    recorded by the strategy, so the same instance must be reused across
+    waits, e.g. as the polling strategy of the client.
+
+    Args:
+        estimator: The model of the durations of the syncs. Defaults to
+            a new `SyncDurationEstimator`.
+        fallback: The strategy used for syncs without past runs. Defaults to
+            `ExponentialBackoffPolling` without jitter and the same bounds.
+        min_interval: Minimum number of seconds between two status checks.
+            Defaults to `1`.
+        max_interval: Maximum number of seconds between two status checks.
+            Defaults to `60`.
+        spread: Half-width of the expected completion window, in average
+            deviations. Defaults to `1`.
+        window_polls: Number of status checks spread over the expected
+            completion window. Defaults to `10`.
+        timeout: Optional overall number of seconds to wait for the sync run
+            to complete. Defaults to `None`.
+
+    Example:
+        ```python
+        from itertools import islice
+
+        from prefect_census.census_client import CensusClient
+        from prefect_census.polling import EstimatedDurationPolling
+
+        polling_strategy = EstimatedDurationPolling()
+        with CensusClient(credentials, polling_strategy=polling_strategy) as client:
+            # warm up the estimates with the last runs of the sync
+            sync_runs = list(islice(client.iter_sync_runs(sync_id=1234), 20))
+            polling_strategy.estimator.observe_many(reversed(sync_runs))
+            client.trigger_sync_run(sync_id=1234, wait_for_sync_run_completed=True)
+        ```
+    """
+
+    def __init__(
+        self,
+        estimator: Optional[SyncDurationEstimator] = None,
+        fallback: Optional[PollingStrategy] = None,
+        min_interval: float = 1,
+        max_interval: float = 60,
+        spread: float = 1,
+        window_polls: int = 10,
+        timeout: Optional[float] = None,
+    ) -> None:
+        super().__init__(timeout=timeout)
+        self.estimator = SyncDurationEstimator() if estimator is None else estimator
+        self.fallback = fallback or ExponentialBackoffPolling(
+            initial_interval=min_interval, max_interval=max_interval, jitter=False
+        )
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.spread = spread
+        self.window_polls = window_polls
+
+    def intervals(self) -> Iterator[float]:
+        """
+        Yields the wait times of the fallback strategy, used until the sync
+        of the sync run is known.
+
+        Returns:
+            An endless iterator of wait times, in seconds.
+        """
+        return self.fallback.intervals()
+
+    def refine_intervals(
+        self, intervals: Iterator[float], sync_run: Dict, elapsed: float = 0
+    ) -> Iterator[float]:
+        """
+        Yields wait times that are long until the expected completion window
+        of the sync run, short within it, and growing after it. Keeps the wait
+        times of the fallback strategy if the sync has no past runs.
+
+        Durations are learned from the creation of the sync runs, so the age
+        of the sync run is measured the same way: from its `created_at` to its
+        `updated_at`, both on the clock of Census. The time spent waiting is
+        used if it is longer, e.g. if the sync run wasn't updated recently,
+        or if the sync run has no timestamps.
+
+        Args:
+            intervals: The wait times used so far for the sync run.
+            sync_run: The sync run, i.e. the `data` of the JSON response
+                of the Census Sync Run API.
+            elapsed: The number of seconds spent waiting for the sync run so far.
+
+        Returns:
+            An endless iterator of wait times, in seconds.
+        """
+        estimate = self.estimator.get_estimate(sync_run.get("sync_id"))
+        if estimate is None:
+            return intervals
+
+        sync_run = SyncRun(sync_run)
+        if sync_run.created_at is not None and sync_run.updated_at is not None:
+            age = (sync_run.updated_at - sync_run.created_at).total_seconds()
+            elapsed = max(elapsed, age)
+        return self.__estimated_intervals(*estimate, elapsed=elapsed)
+
+    def __estimated_intervals(
+        self, mean: float, deviation: float, elapsed: float
+    ) -> Iterator[float]:
+        """
+        Yields the wait times around the expected completion window.
+        """
+        window_start = mean - self.spread * deviation
+        window_end = mean + self.spread * deviation
+        dense_interval = min(
+            max((window_end - window_start) / self.window_polls, self.min_interval),
+            self.max_interval,
+        )
+
+        while elapsed < window_end:
+            if elapsed < window_start:
+                interval = min(window_start - elapsed, self.max_interval)
+            else:
+                interval = dense_interval
+            interval = max(interval, self.min_interval)
+            elapsed += interval
+            yield interval
+
+        interval = dense_interval
+        while True:
+            interval = min(interval * 2, self.max_interval)
+            yield interval
+
+    def observe(self, sync_run: Union[Dict, SyncRun]) -> None:
+        """
+        Record the duration of a completed sync run in the estimator.
+
+        Args:
+            sync_run: The completed sync run, i.e. the `data` of the JSON response
+                of the Census Sync Run API, or a `SyncRun`.
+        """
+        self.estimator.observe(sync_run)
@@ -0,0 +1,113 @@
+"""
+Client-side rate limiting of the calls made to Census APIs.
+"""
+import asyncio
+from threading import Lock
+from time import monotonic, sleep
+from typing import Dict
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that limits the rate of API calls.
+
+    The bucket holds up to `burst_size` tokens and is refilled at
+    `requests_per_second` tokens per second. Every API call consumes a token:
+    when the bucket is empty, callers wait for their turn, in the order in which
+    they asked for a token.
+
+    Args:
+        requests_per_second: Sustained number of API calls allowed per second.
+        burst_size: Maximum number of API calls that can be made at once
+            after a period of inactivity. Defaults to `1`.
+    """
+
+    def __init__(self, requests_per_second: float, burst_size: int = 1) -> None:
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than zero.")
+        if burst_size < 1:
+            raise ValueError("burst_size must be at least 1.")
+
+        self.requests_per_second = requests_per_second
+        self.burst_size = burst_size
+        self._tokens = float(burst_size)
+        self._updated_at = monotonic()
+        self._lock = Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket, borrowing it from the future
+        if the bucket is empty.
+
+        Returns:
+            The number of seconds the caller must wait before using the token.
+        """
+        with self._lock:
+            now = monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(
+                self.burst_size, self._tokens + elapsed * self.requests_per_second
+            )
+            self._updated_at = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.requests_per_second
+
+    def acquire(self) -> float:
+        """
+        Take a token from the bucket, blocking until it can be used.
+
+        Returns:
+            The number of seconds waited.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """
+        Take a token from the bucket, suspending the calling coroutine
+        until it can be used.
+
+        Returns:
+            The number of seconds waited.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+_shared_rate_limiters: Dict[str, TokenBucket] = {}
+_shared_rate_limiters_lock = Lock()
+
+
+def get_shared_rate_limiter(
+    key: str, requests_per_second: float, burst_size: int = 1
+) -> TokenBucket:
+    """
+    Returns the token bucket shared by all the clients of the process
+    that use the same key, creating it if needed. The configuration of the bucket
+    is set by the first caller.
+
+    Args:
+        key: The key identifying the bucket, e.g. a fingerprint of the access token.
+        requests_per_second: Sustained number of API calls allowed per second.
+        burst_size: Maximum number of API calls that can be made at once.
+            Defaults to `1`.
+
+    Returns:
+        The shared token bucket.
+    """
+    with _shared_rate_limiters_lock:
+        rate_limiter = _shared_rate_limiters.get(key)
+        if rate_limiter is None:
+            rate_limiter = TokenBucket(
+                requests_per_second=requests_per_second, burst_size=burst_size
+            )
+            _shared_rate_limiters[key] = rate_limiter
+
+        return rate_limiter
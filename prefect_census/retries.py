@@ -0,0 +1,128 @@
+"""
+Policy used to retry Census API calls that failed because of transient errors.
+"""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+# HTTP methods whose requests can be sent again without side effects
+IDEMPOTENT_HTTP_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy:
+    """
+    Class that decides whether, and after how long, a failed Census API call
+    must be retried.
+
+    Calls are retried when the API responds with one of the retryable status codes
+    or when the connection fails. Requests that are not idempotent, like the
+    trigger of a sync run, are only retried when Census is known not to have
+    processed them: when the API responds with `429 Too Many Requests` or when the
+    connection could not be established. This way a sync run is never
+    triggered twice.
+
+    Args:
+        max_retries: Maximum number of retries of an API call. Defaults to `3`.
+        backoff_factor: Seconds to wait before the first retry; the wait time is
+            doubled at each subsequent retry. Defaults to `0.5`.
+        max_backoff: Maximum number of seconds to wait between two attempts,
+            unless the API asks for a longer wait via the `Retry-After` header.
+            Defaults to `30`.
+        retry_on_status: HTTP status codes that make an API call retryable.
+            Defaults to `(429, 500, 502, 503, 504)`.
+        respect_retry_after: Whether to wait for the time requested by the API
+            in the `Retry-After` response header, if any. Defaults to `True`.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        retry_on_status: Iterable[int] = (429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_on_status = frozenset(retry_on_status)
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry(
+        self,
+        http_method: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        request_sent: bool = True,
+    ) -> bool:
+        """
+        Decide whether a failed API call must be retried.
+
+        Args:
+            http_method: The HTTP method of the API call.
+            attempt: The number of retries already made.
+            status_code: The HTTP status code of the response, or `None`
+                if no response was received.
+            request_sent: Whether the request may have reached Census, when
+                no response was received.
+
+        Returns:
+            `True` if the API call must be retried, `False` otherwise.
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        idempotent = http_method.upper() in IDEMPOTENT_HTTP_METHODS
+
+        if status_code is not None:
+            if status_code not in self.retry_on_status:
+                return False
+            return idempotent or status_code == 429
+
+        return idempotent or not request_sent
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Returns the number of seconds to wait before retrying an API call.
+
+        Args:
+            attempt: The number of retries already made.
+            retry_after: The value of the `Retry-After` response header, if any.
+
+        Returns:
+            The number of seconds to wait.
+        """
+        if self.respect_retry_after and retry_after:
+            delay = self._parse_retry_after(retry_after)
+            if delay is not None:
+                return delay
+
+        return min(self.backoff_factor * 2**attempt, self.max_backoff)
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str) -> Optional[float]:
+        """
+        Parse the value of a `Retry-After` header, that can be either a number
+        of seconds or an HTTP date.
+
+        Args:
+            retry_after: The value of the `Retry-After` header.
+
+        Returns:
+            The number of seconds to wait, or `None` if the value is invalid.
+        """
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
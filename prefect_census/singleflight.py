@@ -0,0 +1,182 @@
+"""
+Coalescing of concurrent identical calls, so that callers asking for the same
+resource at the same moment share a single in-flight request.
+"""
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from threading import Lock
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Type
+
+
+class SingleFlight:
+    """
+    Thread-safe group of calls, keyed by the resource they fetch. While a call
+    for a key is in flight, other threads calling with the same key wait for
+    its outcome instead of making their own call, and all get its result
+    or its exception.
+
+    Exceptions specific to the caller that made the call, e.g. its own deadline,
+    can be listed in `retry_on`: threads waiting for a call that raises one of
+    them make a new call instead.
+
+    Results are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of calls in flight.
+        """
+        return len(self._calls)
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        timeout: Optional[float] = None,
+        retry_on: Tuple[Type[BaseException], ...] = (),
+    ) -> Any:
+        """
+        Call `fn`, unless a call for the same key is already in flight,
+        in which case wait for its outcome.
+
+        Args:
+            key: The key identifying the call.
+            fn: The function to call.
+            timeout: Optional number of seconds to wait for calls
+                made by other threads.
+            retry_on: Exceptions that, raised by a call made by another thread,
+                make this thread call again instead of raising them.
+
+        Raises:
+            `TimeoutError` if the calls made by other threads do not complete
+                within `timeout` seconds.
+
+        Returns:
+            The result of the call.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if leader:
+                    future = self._calls[key] = Future()
+
+            if leader:
+                break
+
+            remaining = None if deadline is None else max(deadline - monotonic(), 0)
+            try:
+                return future.result(timeout=remaining)
+            except FuturesTimeoutError as exc:
+                raise TimeoutError(f"In-flight call for {key!r} timed out") from exc
+            except retry_on:
+                continue
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            # forget the call first, so that callers calling again on its
+            # exception don't find it still in flight
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            del self._calls[key]
+        future.set_result(result)
+        return result
+
+
+class _CallCancelled(Exception):
+    """
+    Raised to the coroutines awaiting a call whose caller was cancelled.
+    """
+
+
+class AsyncSingleFlight:
+    """
+    Group of coroutine calls, keyed by the resource they fetch. While a call
+    for a key is in flight, other coroutines calling with the same key await
+    its outcome instead of making their own call, and all get its result
+    or its exception, except those listed in `retry_on`, see `SingleFlight`.
+    If the coroutine making the call is cancelled, the coroutines awaiting
+    its outcome call again instead of being cancelled too.
+
+    Results are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of calls in flight.
+        """
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+        retry_on: Tuple[Type[BaseException], ...] = (),
+    ) -> Any:
+        """
+        Await `fn()`, unless a call for the same key is already in flight,
+        in which case await its outcome.
+
+        Args:
+            key: The key identifying the call.
+            fn: The coroutine function to call.
+            timeout: Optional number of seconds to wait for calls
+                made by other coroutines.
+            retry_on: Exceptions that, raised by a call made by another
+                coroutine, make this coroutine call again instead of raising them.
+
+        Raises:
+            `TimeoutError` if the calls made by other coroutines do not complete
+                within `timeout` seconds.
+
+        Returns:
+            The result of the call.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        while key in self._calls:
+            remaining = None if deadline is None else max(deadline - monotonic(), 0)
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(self._calls[key]), remaining
+                )
+            except asyncio.TimeoutError as exc:
+                raise TimeoutError(f"In-flight call for {key!r} timed out") from exc
+            except (_CallCancelled,) + retry_on:
+                continue
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # only the coroutine that made the call is cancelled: the callers
+            # awaiting the future, if any, call again
+            future.set_exception(_CallCancelled())
+            future.exception()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # the callers awaiting the future, if any, retrieve the exception:
+            # mark it as retrieved so that asyncio doesn't log it otherwise
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -0,0 +1,225 @@
+"""
+A local index of the syncs of a Census workspace, used to find syncs by name.
+"""
+from threading import Lock, RLock
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Set, Union
+
+from prefect_census.exceptions import CensusSyncResolutionException
+
+if TYPE_CHECKING:
+    from prefect_census.census_client import CensusClient
+
+
+class SyncIndex:
+    """
+    Class that keeps an in-memory index of the syncs of a Census workspace,
+    to resolve human-readable references to sync identifiers in constant time.
+
+    A sync can be referenced by its identifier, its label or the object
+    it writes to in the destination, e.g. `Contact` or `1:Contact` to include
+    the destination connection identifier. Labels take precedence
+    over destination objects.
+
+    The index is loaded on first use and refreshed when it is older than `ttl`
+    or when a reference cannot be resolved. Refreshes are incremental: only the
+    syncs whose `updated_at` changed are re-indexed.
+
+    Args:
+        ttl: Number of seconds after which the index is refreshed.
+            Defaults to `300`.
+
+    Example:
+        ```python
+        from prefect_census.census_client import CensusClient
+        from prefect_census.sync_index import SyncIndex
+
+        index = SyncIndex(ttl=60)
+        with CensusClient(credentials=credentials) as client:
+            sync_id = index.resolve(client, "Salesforce contacts")
+            client.trigger_sync_run(sync_id=sync_id)
+        ```
+    """
+
+    def __init__(self, ttl: float = 300) -> None:
+        self.ttl = ttl
+        self._syncs: Dict[int, Dict] = {}
+        self._keys: Dict[str, Set[int]] = {}
+        self._refreshed_at: Optional[float] = None
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of indexed syncs.
+        """
+        return len(self._syncs)
+
+    @staticmethod
+    def _get_keys(sync: Dict) -> Iterator[str]:
+        """
+        Returns the references that can be used to find a sync.
+
+        Args:
+            sync: The sync, as returned by the Census List Syncs API.
+
+        Returns:
+            An iterator of references.
+        """
+        for attribute in ("label", "name"):
+            if sync.get(attribute):
+                yield f"label:{sync[attribute]}"
+
+        destination = sync.get("destination_attributes") or {}
+        if destination.get("object"):
+            yield f"object:{destination['object']}"
+            if destination.get("connection_id") is not None:
+                yield f"object:{destination['connection_id']}:{destination['object']}"
+
+    def __index(self, sync: Dict) -> None:
+        """
+        Add a sync to the index.
+
+        Args:
+            sync: The sync, as returned by the Census List Syncs API.
+        """
+        self._syncs[sync["id"]] = sync
+        for key in self._get_keys(sync):
+            self._keys.setdefault(key, set()).add(sync["id"])
+
+    def __unindex(self, sync_id: int) -> None:
+        """
+        Remove a sync from the index.
+
+        Args:
+            sync_id: The identifier of the sync.
+        """
+        sync = self._syncs.pop(sync_id)
+        for key in self._get_keys(sync):
+            sync_ids = self._keys[key]
+            sync_ids.discard(sync_id)
+            if not sync_ids:
+                del self._keys[key]
+
+    def refresh(self, client: "CensusClient") -> None:
+        """
+        Reload the list of syncs from Census, re-indexing only the syncs
+        that were added, updated or deleted since the last refresh.
+
+        Args:
+            client: The Census client used to list the syncs.
+        """
+        with self._lock:
+            seen = set()
+            for sync in client.iter_syncs():
+                sync_id = sync["id"]
+                seen.add(sync_id)
+                indexed = self._syncs.get(sync_id)
+                if indexed is not None:
+                    if indexed.get("updated_at") == sync.get("updated_at"):
+                        continue
+                    self.__unindex(sync_id)
+                self.__index(sync)
+
+            for sync_id in set(self._syncs) - seen:
+                self.__unindex(sync_id)
+
+            self._refreshed_at = monotonic()
+
+    def __is_stale(self) -> bool:
+        """
+        Returns whether the index must be refreshed before being used.
+        """
+        return self._refreshed_at is None or monotonic() - self._refreshed_at > self.ttl
+
+    def __lookup(self, reference: str) -> Optional[Set[int]]:
+        """
+        Returns the identifiers of the syncs matching a reference, if any.
+        """
+        return self._keys.get(f"label:{reference}") or self._keys.get(
+            f"object:{reference}"
+        )
+
+    def resolve(self, client: "CensusClient", reference: Union[int, str]) -> int:
+        """
+        Returns the identifier of the sync matching a reference.
+
+        Args:
+            client: The Census client used to list the syncs, if needed.
+            reference: The identifier, label or destination object of the sync.
+
+        Raises:
+            `CensusSyncResolutionException` if no sync, or more than one sync,
+                matches the reference.
+
+        Returns:
+            The identifier of the sync.
+        """
+        if isinstance(reference, int):
+            return reference
+        if reference.isdigit():
+            return int(reference)
+
+        with self._lock:
+            refreshed = False
+            if self.__is_stale():
+                self.refresh(client)
+                refreshed = True
+
+            sync_ids = self.__lookup(reference)
+            if not sync_ids and not refreshed:
+                self.refresh(client)
+                sync_ids = self.__lookup(reference)
+
+            if not sync_ids:
+                raise CensusSyncResolutionException(
+                    f"No Census sync matches {reference!r}"
+                )
+            if len(sync_ids) > 1:
+                raise CensusSyncResolutionException(
+                    f"Several Census syncs match {reference!r}: {sorted(sync_ids)}"
+                )
+
+            return next(iter(sync_ids))
+
+    def get(self, client: "CensusClient", sync_id: int) -> Optional[Dict]:
+        """
+        Returns an indexed sync given its identifier.
+
+        Args:
+            client: The Census client used to list the syncs, if needed.
+            sync_id: The identifier of the sync.
+
+        Returns:
+            The sync, as returned by the Census List Syncs API, or `None`.
+        """
+        with self._lock:
+            if self.__is_stale():
+                self.refresh(client)
+            return self._syncs.get(sync_id)
+
+
+_shared_sync_indexes: Dict[str, SyncIndex] = {}
+_shared_sync_indexes_lock = Lock()
+
+
+def get_shared_sync_index(key: str, ttl: float = 300) -> SyncIndex:
+    """
+    Returns the sync index shared by all the clients of the process
+    that use the same key, creating it if needed. The configuration of the index
+    is set by the first caller.
+
+    Args:
+        key: The key identifying the index, e.g. a fingerprint of the access token.
+        ttl: Number of seconds after which the index is refreshed.
+            Defaults to `300`.
+
+    Returns:
+        The shared sync index.
+    """
+    with _shared_sync_indexes_lock:
+        sync_index = _shared_sync_indexes.get(key)
+        if sync_index is None:
+            sync_index = SyncIndex(ttl=ttl)
+            _shared_sync_indexes[key] = sync_index
+
+        return sync_index
@@ -3,35 +3,369 @@ Collection of tasks to interact with Census APIs.
 More details about Census APIs can be found in the [official docs]
     (https://docs.getcensus.com/basics/api).
 """
-from typing import Dict
+import asyncio
+from time import monotonic
+from typing import Dict, List, Optional, Union
 
 from prefect import task
+from prefect.context import TaskRunContext
+from prefect.settings import PREFECT_HOME
 
 from prefect_census.census_client import CensusClient
+from prefect_census.checkpoints import LocalFileCheckpointStore, SyncRunCheckpointStore
 from prefect_census.credentials import CensusCredentials
+from prefect_census.exceptions import CensusSyncRunFailedException
+from prefect_census.models import SyncRun, SyncTriggerResult
+from prefect_census.polling import PollingStrategy
+from prefect_census.sync_index import get_shared_sync_index
+from prefect_census.webhooks import SyncRunWebhookReceiver
+
+
+def _resolve_sync_id(client: CensusClient, sync_id: Union[int, str]) -> int:
+    """
+    Returns the identifier of a sync given its identifier or its name,
+    using the sync index shared by the task runs of the process.
+
+    Args:
+        client: The Census client used to load the sync index, if needed.
+        sync_id: The identifier, label or destination object of the Sync.
+
+    Returns:
+        The identifier of the Sync.
+    """
+    if isinstance(sync_id, int):
+        return sync_id
+
+    sync_index = get_shared_sync_index(key=client._get_credentials_fingerprint())
+    return sync_index.resolve(client, sync_id)
+
+
+def _get_checkpoint_key() -> Optional[str]:
+    """
+    Returns the key of the checkpoint of the current task run: the identifier
+    of the task run, which is kept across its retries.
+
+    Returns:
+        The checkpoint key, or `None` outside of a task run.
+    """
+    task_run_context = TaskRunContext.get()
+    if task_run_context is None:
+        return None
+    return str(task_run_context.task_run.id)
+
+
+def _get_checkpointed_sync_run_id(
+    checkpoint_store: SyncRunCheckpointStore,
+    checkpoint_key: Optional[str],
+    sync_id: int,
+) -> Optional[int]:
+    """
+    Returns the sync run already triggered by a previous attempt of the
+    current task run, if any.
+
+    Args:
+        checkpoint_store: The store of the checkpoints.
+        checkpoint_key: The key of the checkpoint of the task run.
+        sync_id: The identifier of the sync to trigger.
+
+    Returns:
+        The identifier of the sync run, or `None`.
+    """
+    if checkpoint_key is None:
+        return None
+
+    checkpoint = checkpoint_store.get(checkpoint_key)
+    if checkpoint is None or checkpoint.get("sync_id") != sync_id:
+        return None
+    return checkpoint["sync_run_id"]
+
+
+def _to_task_result(
+    response: Dict, typed_response: bool
+) -> Union[Dict, SyncRun, SyncTriggerResult]:
+    """
+    Returns the result of a trigger task: the JSON response of the Census API,
+    or its compact model if requested.
+
+    Args:
+        response: The JSON response of the Census Trigger Sync Run API,
+            or of the Census Sync Run API.
+        typed_response: Whether to return the model of the response.
+
+    Returns:
+        The result of the task.
+    """
+    if not typed_response:
+        return response
+    if "sync_run_id" in response["data"]:
+        return SyncTriggerResult.from_response(response)
+    return SyncRun.from_response(response)
+
+
+def _get_default_checkpoint_store() -> SyncRunCheckpointStore:
+    """
+    Returns the checkpoint store used when none is given: a local directory
+    in the Prefect home directory.
+    """
+    return LocalFileCheckpointStore(PREFECT_HOME.value() / "census" / "sync_runs")
 
 
 @task
 def trigger_sync_run(
     credentials: CensusCredentials,
-    sync_id: int,
+    sync_id: Union[int, str],
     force_full_sync: bool = False,
     wait_for_sync_run_completed: bool = False,
-) -> Dict:
+    polling_strategy: Optional[PollingStrategy] = None,
+    timeout: Optional[float] = None,
+    checkpoint_store: Optional[SyncRunCheckpointStore] = None,
+    typed_response: bool = False,
+    webhook_receiver: Optional[SyncRunWebhookReceiver] = None,
+) -> Union[Dict, SyncRun, SyncTriggerResult]:
     """
     This task triggers a new Sync run and, optionally, wait for it to complete.
 
+    When waiting, the triggered sync run is checkpointed until it completes
+    or fails: if the task is retried, or its flow run restarted, after the sync run
+    was triggered, the retry resumes waiting for that sync run instead of
+    triggering a new one.
+
+    The Census client, its connections and its state are shared by the task runs
+    of the process that use the same credentials, see `CensusClient.for_credentials`.
+
+    Args:
+        credentials: Census credentials.
+        sync_id: The identifier of the Sync or, alternatively, its label or the
+            object it writes to in the destination. Names are resolved through an
+            index of the syncs of the workspace, shared by the task runs of the
+            process and refreshed every 5 minutes.
+        force_full_sync: Whether to run the sync in full refresh or not.
+            Defaults to `False`.
+        wait_for_sync_run_completed: Whether to wait for the sync
+            run to complete or not. Defaults to `False`.
+        polling_strategy: The strategy used to wait for the sync run
+            to complete. Defaults to `ExponentialBackoffPolling()`.
+        timeout: Optional number of seconds within which the sync run must be
+            triggered and, if requested, complete. Defaults to `None`.
+        checkpoint_store: The store of the triggered sync runs. Defaults to
+            a local directory in the Prefect home directory, which only
+            survives restarts on the same machine.
+        typed_response: Whether to return a compact `SyncTriggerResult` or
+            `SyncRun` instead of the JSON response of the Census API, which is
+            cheaper to store as the result of the task. Defaults to `False`.
+        webhook_receiver: Optional receiver of the webhooks of the workspace,
+            started by the flow: when waiting, the completion of the sync run is
+            noticed as soon as its webhook arrives, and polling only happens
+            according to the slow polling strategy of the receiver, unless
+            `polling_strategy` is given. Defaults to `None`.
+    """
+    client = credentials.get_shared_client(webhook_receiver=webhook_receiver)
+    sync_id = _resolve_sync_id(client, sync_id)
+    if not wait_for_sync_run_completed:
+        response = client.trigger_sync_run(
+            sync_id=sync_id, force_full_sync=force_full_sync, timeout=timeout
+        )
+        return _to_task_result(response, typed_response)
+
+    checkpoint_store = checkpoint_store or _get_default_checkpoint_store()
+    checkpoint_key = _get_checkpoint_key()
+    deadline = None if timeout is None else monotonic() + timeout
+
+    sync_run_id = _get_checkpointed_sync_run_id(
+        checkpoint_store, checkpoint_key, sync_id
+    )
+    if sync_run_id is None:
+        response = client.trigger_sync_run(
+            sync_id=sync_id, force_full_sync=force_full_sync, timeout=timeout
+        )
+        sync_run_id = response["data"]["sync_run_id"]
+        if checkpoint_key is not None:
+            checkpoint_store.put(checkpoint_key, sync_id, sync_run_id)
+
+    try:
+        response = client.wait_for_sync_run(
+            sync_run_id=sync_run_id,
+            polling_strategy=polling_strategy,
+            timeout=client._get_remaining_time(deadline),
+        )
+    except CensusSyncRunFailedException:
+        if checkpoint_key is not None:
+            checkpoint_store.delete(checkpoint_key)
+        raise
+
+    if checkpoint_key is not None:
+        checkpoint_store.delete(checkpoint_key)
+    return _to_task_result(response, typed_response)
+
+
+@task
+async def trigger_sync_run_async(
+    credentials: CensusCredentials,
+    sync_id: Union[int, str],
+    force_full_sync: bool = False,
+    wait_for_sync_run_completed: bool = False,
+    polling_strategy: Optional[PollingStrategy] = None,
+    timeout: Optional[float] = None,
+    checkpoint_store: Optional[SyncRunCheckpointStore] = None,
+    typed_response: bool = False,
+    webhook_receiver: Optional[SyncRunWebhookReceiver] = None,
+) -> Union[Dict, SyncRun, SyncTriggerResult]:
+    """
+    This task triggers a new Sync run and, optionally, wait for it to complete,
+    without holding a thread while waiting: many of them can run concurrently
+    on the event loop of an async flow. Like `trigger_sync_run`, a retry resumes
+    waiting for the sync run triggered by the previous attempt.
+
     Args:
         credentials: Census credentials.
-        sync_id: The identifier of the Sync.
+        sync_id: The identifier of the Sync or, alternatively, its label or the
+            object it writes to in the destination, see `trigger_sync_run`.
         force_full_sync: Whether to run the sync in full refresh or not.
             Defaults to `False`.
         wait_for_sync_run_completed: Whether to wait for the sync
             run to complete or not. Defaults to `False`.
+        polling_strategy: The strategy used to wait for the sync run
+            to complete. Defaults to `ExponentialBackoffPolling()`.
+        timeout: Optional number of seconds within which the sync run must be
+            triggered and, if requested, complete. Defaults to `None`.
+        checkpoint_store: The store of the triggered sync runs. Defaults to
+            a local directory in the Prefect home directory.
+        typed_response: Whether to return a compact `SyncTriggerResult` or
+            `SyncRun` instead of the JSON response of the Census API.
+            Defaults to `False`.
+        webhook_receiver: Optional receiver of the webhooks of the workspace,
+            see `trigger_sync_run`. Defaults to `None`.
+
+    Example:
+        ```python
+        import asyncio
+
+        from prefect import flow
+
+        from prefect_census.credentials import CensusCredentials
+        from prefect_census.tasks import trigger_sync_run_async
+
+        @flow
+        async def run_syncs(sync_ids):
+            credentials = await CensusCredentials.load("census")
+            return await asyncio.gather(
+                *[
+                    trigger_sync_run_async(
+                        credentials=credentials,
+                        sync_id=sync_id,
+                        wait_for_sync_run_completed=True,
+                    )
+                    for sync_id in sync_ids
+                ]
+            )
+        ```
     """
-    client = CensusClient(credentials=credentials)
-    return client.trigger_sync_run(
-        sync_id=sync_id,
+    if not isinstance(sync_id, int):
+        sync_id = await asyncio.get_running_loop().run_in_executor(
+            None, _resolve_sync_id, credentials.get_shared_client(), sync_id
+        )
+
+    async with credentials.get_async_client(
+        webhook_receiver=webhook_receiver
+    ) as client:
+        if not wait_for_sync_run_completed:
+            response = await client.trigger_sync_run(
+                sync_id=sync_id, force_full_sync=force_full_sync, timeout=timeout
+            )
+            return _to_task_result(response, typed_response)
+
+        checkpoint_store = checkpoint_store or _get_default_checkpoint_store()
+        checkpoint_key = _get_checkpoint_key()
+        deadline = None if timeout is None else monotonic() + timeout
+
+        sync_run_id = _get_checkpointed_sync_run_id(
+            checkpoint_store, checkpoint_key, sync_id
+        )
+        if sync_run_id is None:
+            response = await client.trigger_sync_run(
+                sync_id=sync_id, force_full_sync=force_full_sync, timeout=timeout
+            )
+            sync_run_id = response["data"]["sync_run_id"]
+            if checkpoint_key is not None:
+                checkpoint_store.put(checkpoint_key, sync_id, sync_run_id)
+
+        try:
+            response = await client.wait_for_sync_run(
+                sync_run_id=sync_run_id,
+                polling_strategy=polling_strategy,
+                timeout=client._get_remaining_time(deadline),
+            )
+        except CensusSyncRunFailedException:
+            if checkpoint_key is not None:
+                checkpoint_store.delete(checkpoint_key)
+            raise
+
+        if checkpoint_key is not None:
+            checkpoint_store.delete(checkpoint_key)
+        return _to_task_result(response, typed_response)
+
+
+@task
+def trigger_sync_runs(
+    credentials: CensusCredentials,
+    sync_ids: List[int],
+    force_full_sync: bool = False,
+    max_concurrency: int = 10,
+) -> Dict[int, Dict]:
+    """
+    This task triggers a new Sync run for each of the given Syncs, concurrently.
+    A failure to trigger a sync doesn't fail the task: it is reported
+    in the result of that sync instead.
+
+    Args:
+        credentials: Census credentials.
+        sync_ids: The identifiers of the Syncs.
+        force_full_sync: Whether to run the syncs in full refresh or not.
+            Defaults to `False`.
+        max_concurrency: Maximum number of concurrent requests to Census.
+            Defaults to `10`.
+
+    Returns:
+        A dictionary mapping each Sync identifier to the response
+            of the Census Trigger Sync Run API, or to an error response
+            (`{"status": "error", "message": ...}`).
+    """
+    client = credentials.get_shared_client(pool_maxsize=max_concurrency)
+    return client.trigger_sync_runs(
+        sync_ids=sync_ids,
         force_full_sync=force_full_sync,
-        wait_for_sync_run_completed=wait_for_sync_run_completed,
+        max_concurrency=max_concurrency,
     )
+
+
+@task
+async def trigger_sync_runs_async(
+    credentials: CensusCredentials,
+    sync_ids: List[int],
+    force_full_sync: bool = False,
+    max_concurrency: int = 10,
+) -> Dict[int, Dict]:
+    """
+    This task triggers a new Sync run for each of the given Syncs, concurrently,
+    from the event loop of the flow. A failure to trigger a sync doesn't fail
+    the task: it is reported in the result of that sync instead.
+
+    Args:
+        credentials: Census credentials.
+        sync_ids: The identifiers of the Syncs.
+        force_full_sync: Whether to run the syncs in full refresh or not.
+            Defaults to `False`.
+        max_concurrency: Maximum number of concurrent requests to Census.
+            Defaults to `10`.
+
+    Returns:
+        A dictionary mapping each Sync identifier to the response
+            of the Census Trigger Sync Run API, or to an error response
+            (`{"status": "error", "message": ...}`).
+    """
+    async with credentials.get_async_client(max_connections=max_concurrency) as client:
+        return await client.trigger_sync_runs(
+            sync_ids=sync_ids,
+            force_full_sync=force_full_sync,
+            max_concurrency=max_concurrency,
+        )
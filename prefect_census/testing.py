@@ -0,0 +1,535 @@
+"""
+A local stand-in for the Census API, to test and load-test flows offline.
+
+Unlike HTTP stubs, the fake server models time: sync runs go through their
+statuses as time passes, responses can be delayed and the API can be rate
+limited, so that fan-out and polling behaviors can be observed end to end.
+"""
+import json
+import math
+import re
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Lock, Thread, Timer
+from time import monotonic, sleep
+from types import TracebackType
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+from urllib.error import URLError
+from urllib.parse import parse_qs, urlsplit
+from urllib.request import Request, urlopen
+
+# Statuses a sync run goes through by default: it works for one second,
+# then completes
+DEFAULT_LIFECYCLE: Tuple[Tuple[str, float], ...] = (("working", 1.0), ("completed", 0))
+
+_ROUTES = (
+    ("POST", re.compile(r"^/syncs/(\d+)/trigger$"), "/syncs/{id}/trigger"),
+    ("GET", re.compile(r"^/sync_runs/(\d+)$"), "/sync_runs/{id}"),
+    ("GET", re.compile(r"^/syncs/(\d+)/sync_runs$"), "/syncs/{id}/sync_runs"),
+    ("GET", re.compile(r"^/syncs$"), "/syncs"),
+)
+
+
+class _FakeSyncRun:
+    """
+    A sync run of the fake server, whose status depends on the time elapsed
+    since it was triggered.
+    """
+
+    def __init__(
+        self,
+        sync_run_id: int,
+        sync_id: int,
+        lifecycle: Sequence[Tuple[str, float]],
+        full_sync: bool,
+    ) -> None:
+        self.sync_run_id = sync_run_id
+        self.sync_id = sync_id
+        self.lifecycle = lifecycle
+        self.full_sync = full_sync
+        self.triggered_at = monotonic()
+        self.created_at = datetime.now(timezone.utc)
+
+    def get_status(self) -> Tuple[str, Optional[float]]:
+        """
+        Returns the current status of the sync run and, if it reached
+        its last status, the number of seconds it took to get there.
+        """
+        elapsed = monotonic() - self.triggered_at
+        started = 0.0
+        for status, duration in self.lifecycle[:-1]:
+            if elapsed < started + duration:
+                return status, None
+            started += duration
+        return self.lifecycle[-1][0], started
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the sync run as returned by the Census Sync Run API.
+        """
+        status, duration = self.get_status()
+        created_at = self.created_at.isoformat().replace("+00:00", "Z")
+        data = {
+            "id": self.sync_run_id,
+            "sync_id": self.sync_id,
+            "status": status,
+            "full_sync": self.full_sync,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "completed_at": None,
+            "error_message": None,
+        }
+        if duration is not None:
+            completed_at = self.created_at + timedelta(seconds=duration)
+            data["completed_at"] = completed_at.isoformat().replace("+00:00", "Z")
+            if status == "failed":
+                data["error_message"] = "Sync run failed on the fake Census server"
+        return data
+
+
+class FakeCensusServer:
+    """
+    Class that runs a fake Census API on a local port, in a background thread.
+
+    Triggered sync runs follow the lifecycle of their sync: a sequence of
+    `(status, seconds)` steps, the status of the last step being final.
+    For instance, `[("queued", 0.5), ("working", 2), ("failed", 0)]` describes
+    a run that waits half a second, works for two seconds and then fails.
+
+    The server implements the Trigger Sync Run, Sync Run, List Syncs and
+    List Sync Runs APIs. Any access token is accepted.
+
+    Args:
+        sync_ids: Identifiers of the syncs that exist on the server. More syncs
+            can be added with `add_sync`. Defaults to no syncs.
+        lifecycle: The default lifecycle of the sync runs.
+            Defaults to one second of `working`, then `completed`.
+        latency: Seconds to wait before answering each request. Defaults to `0`.
+        requests_per_second: Optional maximum number of requests per second,
+            above which the server responds with `429 Too Many Requests`.
+            Defaults to `None`, i.e. no limit.
+        burst_size: Maximum number of requests accepted at once when
+            `requests_per_second` is set. Defaults to `1`.
+        host: The interface to listen on. Defaults to `127.0.0.1`.
+        port: The port to listen on. Defaults to `0`, i.e. any free port.
+        webhook_url: Optional URL the server posts a webhook to when a sync run
+            reaches its last status, e.g. the URL of a
+            `prefect_census.webhooks.SyncRunWebhookReceiver`. Defaults to `None`.
+
+    Example:
+        ```python
+        from prefect_census.census_client import CensusClient
+        from prefect_census.testing import FakeCensusServer
+
+        with FakeCensusServer(sync_ids=[1], latency=0.05) as server:
+            server.inject_errors(status_code=503, count=2)
+            client = CensusClient(credentials="token", base_url=server.url)
+            client.trigger_sync_run(sync_id=1, wait_for_sync_run_completed=True)
+            print(server.request_counts)
+        ```
+    """
+
+    def __init__(
+        self,
+        sync_ids: Iterable[int] = (),
+        lifecycle: Sequence[Tuple[str, float]] = DEFAULT_LIFECYCLE,
+        latency: float = 0,
+        requests_per_second: Optional[float] = None,
+        burst_size: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        webhook_url: Optional[str] = None,
+    ) -> None:
+        if not lifecycle:
+            raise ValueError("lifecycle must have at least one step.")
+
+        self.lifecycle = tuple(lifecycle)
+        self.latency = latency
+        self.requests_per_second = requests_per_second
+        self.burst_size = burst_size
+        self.host = host
+        self.port = port
+        self.webhook_url = webhook_url
+        self.request_counts: Counter = Counter()
+        self._syncs: Dict[int, Dict] = {}
+        self._sync_runs: Dict[int, _FakeSyncRun] = {}
+        self._sync_run_ids = count(1)
+        self._errors: Deque[Tuple[int, Optional[str], Optional[float]]] = deque()
+        self._tokens = float(burst_size)
+        self._tokens_updated_at = monotonic()
+        self._lock = Lock()
+        self._server: Optional["_FakeCensusHTTPServer"] = None
+        self._thread: Optional[Thread] = None
+        self._webhook_timers: List[Timer] = []
+        for sync_id in sync_ids:
+            self.add_sync(sync_id)
+
+    def __enter__(self) -> "FakeCensusServer":
+        """
+        Start the server.
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Stop the server.
+        """
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        The base URL of the fake Census API, to pass as `base_url` to the clients.
+        """
+        if self._server is None:
+            raise RuntimeError("The fake Census server is not running.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    def start(self) -> None:
+        """
+        Start serving requests in a background thread.
+        """
+        if self._server is not None:
+            return
+
+        handler = type("_Handler", (_FakeCensusRequestHandler,), {"fake": self})
+        self._server = _FakeCensusHTTPServer((self.host, self.port), handler)
+        self._thread = Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="fake-census-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop serving requests and release the port.
+        """
+        if self._server is None:
+            return
+
+        with self._lock:
+            timers, self._webhook_timers = self._webhook_timers, []
+        for timer in timers:
+            timer.cancel()
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def add_sync(
+        self,
+        sync_id: int,
+        label: Optional[str] = None,
+        destination_object: Optional[str] = None,
+        lifecycle: Optional[Sequence[Tuple[str, float]]] = None,
+    ) -> None:
+        """
+        Add a sync to the server, or replace it.
+
+        Args:
+            sync_id: The identifier of the sync.
+            label: Optional label of the sync.
+            destination_object: Optional object the sync writes to.
+            lifecycle: The lifecycle of the runs of the sync. Defaults to
+                the lifecycle of the server.
+        """
+        now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        with self._lock:
+            self._syncs[sync_id] = {
+                "id": sync_id,
+                "label": label,
+                "destination_attributes": {
+                    "connection_id": 1,
+                    "object": destination_object,
+                },
+                "created_at": now,
+                "updated_at": now,
+                "lifecycle": tuple(lifecycle) if lifecycle else self.lifecycle,
+            }
+
+    def inject_errors(
+        self,
+        status_code: int,
+        count: int = 1,
+        endpoint: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Make the next requests fail with the given status code.
+
+        Args:
+            status_code: The HTTP status code of the failed responses,
+                e.g. `429` or `503`.
+            count: The number of requests to fail. Defaults to `1`.
+            endpoint: Optional endpoint whose requests must fail, e.g.
+                `/sync_runs/{id}`. Defaults to `None`, i.e. any endpoint.
+            retry_after: Optional value of the `Retry-After` header
+                of the failed responses, in seconds.
+        """
+        with self._lock:
+            self._errors.extend([(status_code, endpoint, retry_after)] * count)
+
+    def get_sync_runs(self, sync_id: Optional[int] = None) -> List[Dict]:
+        """
+        Returns the sync runs triggered on the server.
+
+        Args:
+            sync_id: Optional identifier of the sync whose runs to return.
+
+        Returns:
+            The sync runs, as returned by the Census Sync Run API.
+        """
+        with self._lock:
+            sync_runs = list(self._sync_runs.values())
+        return [
+            sync_run.to_dict()
+            for sync_run in sync_runs
+            if sync_id is None or sync_run.sync_id == sync_id
+        ]
+
+    def _take_token(self) -> Optional[float]:
+        """
+        Take a token from the rate limiting bucket of the server.
+
+        Returns:
+            `None` if the request is allowed, otherwise the number of seconds
+                after which it can be retried.
+        """
+        if self.requests_per_second is None:
+            return None
+
+        now = monotonic()
+        self._tokens = min(
+            self.burst_size,
+            self._tokens + (now - self._tokens_updated_at) * self.requests_per_second,
+        )
+        self._tokens_updated_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / self.requests_per_second
+
+    def _take_error(
+        self, endpoint: str
+    ) -> Optional[Tuple[int, Optional[str], Optional[float]]]:
+        """
+        Returns the first injected error matching an endpoint, if any.
+        """
+        for error in self._errors:
+            if error[1] is None or error[1] == endpoint:
+                self._errors.remove(error)
+                return error
+        return None
+
+    def _handle(
+        self, http_method: str, path: str, query: Dict[str, List[str]]
+    ) -> Tuple[int, Optional[Dict], Dict[str, str]]:
+        """
+        Handle a request made to the fake Census API.
+
+        Returns:
+            The status code, JSON body and headers of the response.
+        """
+        if not path.startswith("/api/v1/"):
+            return 404, {"status": "not_found"}, {}
+        path = path[len("/api/v1") :]
+
+        for route_method, pattern, endpoint in _ROUTES:
+            match = pattern.match(path)
+            if match is not None and route_method == http_method:
+                break
+        else:
+            return 404, {"status": "not_found"}, {}
+
+        with self._lock:
+            self.request_counts[f"{http_method} {endpoint}"] += 1
+
+            retry_after = self._take_token()
+            if retry_after is not None:
+                headers = {"Retry-After": str(math.ceil(retry_after))}
+                return 429, {"status": "too_many_requests"}, headers
+
+            error = self._take_error(endpoint)
+            if error is not None:
+                status_code, _, error_retry_after = error
+                headers = {}
+                if error_retry_after is not None:
+                    headers["Retry-After"] = str(error_retry_after)
+                return status_code, {"status": "error"}, headers
+
+            identifier = int(match.group(1)) if match.groups() else None
+            if endpoint == "/syncs/{id}/trigger":
+                return self.__trigger(identifier, query)
+            if endpoint == "/sync_runs/{id}":
+                sync_run = self._sync_runs.get(identifier)
+                if sync_run is None:
+                    return 404, {"status": "not_found"}, {}
+                return 200, {"status": "success", "data": sync_run.to_dict()}, {}
+            if endpoint == "/syncs":
+                syncs = [
+                    {k: v for k, v in sync.items() if k != "lifecycle"}
+                    for sync in self._syncs.values()
+                ]
+                return 200, self.__paginate(syncs, query), {}
+
+            if identifier not in self._syncs:
+                return 404, {"status": "not_found"}, {}
+            sync_runs = [
+                sync_run.to_dict()
+                for sync_run in list(self._sync_runs.values())[::-1]
+                if sync_run.sync_id == identifier
+            ]
+            return 200, self.__paginate(sync_runs, query), {}
+
+    def __trigger(
+        self, sync_id: int, query: Dict[str, List[str]]
+    ) -> Tuple[int, Optional[Dict], Dict[str, str]]:
+        """
+        Trigger a run of a sync.
+        """
+        sync = self._syncs.get(sync_id)
+        if sync is None:
+            return 404, {"status": "not_found"}, {}
+
+        sync_run_id = next(self._sync_run_ids)
+        sync_run = self._sync_runs[sync_run_id] = _FakeSyncRun(
+            sync_run_id=sync_run_id,
+            sync_id=sync_id,
+            lifecycle=sync["lifecycle"],
+            full_sync=query.get("force_full_sync", [""])[0].lower() == "true",
+        )
+        if self.webhook_url is not None:
+            timer = Timer(
+                sum(duration for _, duration in sync_run.lifecycle[:-1]),
+                self.__send_webhook,
+                args=(sync_run,),
+            )
+            timer.daemon = True
+            timer.start()
+            self._webhook_timers = [t for t in self._webhook_timers if t.is_alive()] + [
+                timer
+            ]
+        return 200, {"status": "success", "data": {"sync_run_id": sync_run_id}}, {}
+
+    def __send_webhook(self, sync_run: _FakeSyncRun) -> None:
+        """
+        Post the webhook of a sync run that reached its last status.
+        """
+        status = sync_run.lifecycle[-1][0]
+        body = {
+            "event": f"sync_run.{status}",
+            "data": {
+                "sync_id": sync_run.sync_id,
+                "sync_run_id": sync_run.sync_run_id,
+                "status": status,
+            },
+        }
+        request = Request(
+            self.webhook_url,
+            data=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urlopen(request, timeout=5):
+                pass
+        except (URLError, OSError):
+            # webhooks that could not be delivered are dropped
+            pass
+
+    @staticmethod
+    def __paginate(items: List[Dict], query: Dict[str, List[str]]) -> Dict:
+        """
+        Returns a page of a list, as returned by the Census List APIs.
+        """
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("per_page", ["25"])[0])
+        start = (page - 1) * per_page
+        return {
+            "status": "success",
+            "pagination": {
+                "page": page,
+                "per_page": per_page,
+                "total_records": len(items),
+                "next_page": page + 1 if start + per_page < len(items) else None,
+            },
+            "data": items[start : start + per_page],
+        }
+
+
+class _FakeCensusHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server serving each connection in its own thread, with a listen
+    backlog large enough for load tests opening many connections at once.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class _FakeCensusRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of the fake Census server.
+    """
+
+    protocol_version = "HTTP/1.1"
+    fake: FakeCensusServer
+
+    def __respond(self) -> None:
+        """
+        Answer a request with the response of the fake server, after its latency.
+        """
+        url = urlsplit(self.path)
+        content_length = int(self.headers.get("Content-Length") or 0)
+        if content_length:
+            self.rfile.read(content_length)
+
+        if self.fake.latency:
+            sleep(self.fake.latency)
+
+        if "Authorization" not in self.headers:
+            status_code, data, headers = 401, {"status": "unauthorized"}, {}
+        else:
+            status_code, data, headers = self.fake._handle(
+                self.command, url.path, parse_qs(url.query)
+            )
+
+        body = json.dumps(data).encode() if data is not None else b""
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        """
+        Answer a GET request.
+        """
+        self.__respond()
+
+    def do_POST(self) -> None:  # noqa: N802
+        """
+        Answer a POST request.
+        """
+        self.__respond()
+
+    def log_message(self, format: str, *args) -> None:
+        """
+        Don't log requests to stderr.
+        """
+        pass
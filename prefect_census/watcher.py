@@ -0,0 +1,297 @@
+"""
+An object that can be used to wait for many Census sync runs at once.
+"""
+import heapq
+from itertools import count
+from queue import Empty, Queue
+from time import monotonic, perf_counter, sleep
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from prefect_census.census_client import CensusClient
+from prefect_census.exceptions import CensusSyncRunFailedException
+from prefect_census.polling import PollingStrategy
+
+
+class SyncRunWatcher:
+    """
+    Class that tracks many Census sync runs from a single scheduling loop,
+    instead of dedicating a thread (and a sleeping wait loop) to each of them.
+
+    The watcher keeps a min-heap of the instants at which each sync run
+    must be checked next, and always sleeps until the earliest one. Each sync run
+    is polled according to its own sequence of intervals yielded by the
+    polling strategy: with a jittered strategy, the first checks of sync runs
+    added together are spread out instead of happening in a burst.
+
+    If the client has a webhook receiver, a sync run is also checked as soon as
+    its webhook arrives, instead of at its next scheduled check.
+
+    Args:
+        client: The Census client used to check the sync runs status.
+        sync_run_ids: Optional identifiers of the sync runs to watch.
+        polling_strategy: The strategy used to schedule the status checks of
+            each sync run. Defaults to the polling strategy of the client.
+
+    Example:
+        ```python
+        from prefect_census.census_client import CensusClient
+        from prefect_census.watcher import SyncRunWatcher
+
+        with CensusClient(credentials=credentials) as client:
+            watcher = SyncRunWatcher(client=client, sync_run_ids=sync_run_ids)
+            for sync_run_id, response in watcher.watch():
+                print(sync_run_id, response["data"]["status"])
+        ```
+    """
+
+    def __init__(
+        self,
+        client: CensusClient,
+        sync_run_ids: Optional[Iterable[int]] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> None:
+        self.client = client
+        self.polling_strategy = polling_strategy or client.polling_strategy
+        self._heap: List[Tuple[float, int, int]] = []
+        self._counter = count()
+        self._intervals: Dict[int, Iterator[float]] = {}
+        self._deadlines: Dict[int, Optional[float]] = {}
+        self._polls: Dict[int, int] = {}
+        self._started_at: Dict[int, float] = {}
+        self._first_checked: Set[int] = set()
+        self._notices: "Queue[int]" = Queue()
+        self._noticed: Set[int] = set()
+
+        for sync_run_id in sync_run_ids or []:
+            self.add(sync_run_id)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of sync runs being watched.
+        """
+        return len(self._intervals)
+
+    def __contains__(self, sync_run_id: int) -> bool:
+        """
+        Returns whether a sync run is being watched.
+        """
+        return sync_run_id in self._intervals
+
+    def add(self, sync_run_id: int) -> None:
+        """
+        Start watching a sync run. Adding a sync run that is already
+        being watched has no effect.
+
+        Args:
+            sync_run_id: The identifier of the sync run to watch.
+        """
+        if sync_run_id in self._intervals:
+            return
+
+        intervals = self.polling_strategy.intervals()
+        self._intervals[sync_run_id] = intervals
+        self._deadlines[sync_run_id] = self.polling_strategy.get_deadline()
+        self._polls[sync_run_id] = 0
+        self._started_at[sync_run_id] = perf_counter()
+        self.__schedule(sync_run_id, delay=next(intervals))
+
+        receiver = self.client.webhook_receiver
+        if receiver is not None and receiver.get_status(sync_run_id) is not None:
+            self._notices.put(sync_run_id)
+
+    def __forget(self, sync_run_id: int) -> None:
+        """
+        Stop watching a sync run that completed or failed.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+        """
+        del self._intervals[sync_run_id]
+        del self._deadlines[sync_run_id]
+        self._first_checked.discard(sync_run_id)
+        self._noticed.discard(sync_run_id)
+
+    def __on_webhook(self, sync_run_id: int, status: str) -> None:
+        """
+        Queue the check of a watched sync run whose webhook was received.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            status: The status received for the sync run.
+        """
+        if sync_run_id in self._intervals:
+            self._notices.put(sync_run_id)
+
+    def __wait_for_webhook(self, delay: float) -> Optional[int]:
+        """
+        Wait for the webhook of a watched sync run that was not checked yet
+        since its webhook was received.
+
+        Args:
+            delay: The number of seconds to wait.
+
+        Returns:
+            The identifier of the sync run, or `None` after `delay` seconds.
+        """
+        started_at = perf_counter()
+        try:
+            while True:
+                remaining = delay - (perf_counter() - started_at)
+                sync_run_id = self._notices.get(timeout=max(remaining, 0))
+                if sync_run_id in self._intervals and sync_run_id not in self._noticed:
+                    self._noticed.add(sync_run_id)
+                    return sync_run_id
+        except Empty:
+            return None
+        finally:
+            self.client.metrics_sink.observe_sleep(
+                reason="poll", duration=perf_counter() - started_at
+            )
+
+    def __schedule(self, sync_run_id: int, delay: float) -> None:
+        """
+        Schedule the next status check of a sync run.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            delay: The number of seconds to wait before the check.
+        """
+        deadline = self._deadlines[sync_run_id]
+        poll_at = monotonic() + delay
+        if deadline is not None:
+            poll_at = min(poll_at, deadline)
+
+        heapq.heappush(self._heap, (poll_at, next(self._counter), sync_run_id))
+
+    def __record_wait(self, sync_run_id: int, outcome: str) -> None:
+        """
+        Report the end of the wait for a sync run to the metrics sink
+        of the client.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            outcome: `completed`, `failed` or `timeout`.
+        """
+        self.client.metrics_sink.observe_sync_run_wait(
+            polls=self._polls.pop(sync_run_id),
+            duration=perf_counter() - self._started_at.pop(sync_run_id),
+            outcome=outcome,
+        )
+
+    def __poll(self, sync_run_id: int) -> Optional[Dict]:
+        """
+        Check the status of a sync run.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+
+        Returns:
+            The JSON response of the Census Sync Run API, or a `SyncRun`,
+                if the sync run completed or failed, an error response if its
+                status could not be checked or if it did not reach a terminal
+                state before the timeout of the polling strategy, `None` otherwise.
+        """
+        self._polls[sync_run_id] += 1
+        try:
+            response = self.client._get_sync_run_response(sync_run_id=sync_run_id)
+        except CensusSyncRunFailedException as exc:
+            self.__record_wait(sync_run_id, outcome="failed")
+            return self.client._to_sync_run(exc.response)
+        except Exception as exc:
+            self.__record_wait(sync_run_id, outcome="error")
+            return self.client._get_batch_error_response(exc)
+
+        status = response["data"]["status"]
+        if status == "completed":
+            self.polling_strategy.observe(response["data"])
+            self.__record_wait(sync_run_id, outcome="completed")
+            return self.client._to_sync_run(response)
+
+        deadline = self._deadlines[sync_run_id]
+        if deadline is not None and monotonic() >= deadline:
+            self.__record_wait(sync_run_id, outcome="timeout")
+            return self.client._get_batch_error_response(
+                self.client._get_sync_run_timeout_exception(
+                    sync_run_id=sync_run_id, last_response=response
+                )
+            )
+
+        if sync_run_id not in self._first_checked:
+            # the sync of the sync run is known from its first status check
+            self._first_checked.add(sync_run_id)
+            self._intervals[sync_run_id] = self.polling_strategy.refine_intervals(
+                self._intervals[sync_run_id],
+                sync_run=response["data"],
+                elapsed=perf_counter() - self._started_at[sync_run_id],
+            )
+        return None
+
+    def watch(self) -> Iterator[Tuple[int, Dict]]:
+        """
+        Wait for the watched sync runs, yielding each of them as soon as it
+        completes or fails. Sync runs can be added while iterating.
+
+        A sync run whose status cannot be checked, or that does not reach
+        a terminal state before the timeout of the polling strategy, is yielded
+        with an error response, e.g. `{"status": "error", "message": "..."}`,
+        and the other sync runs keep being watched.
+
+        Returns:
+            An iterator of `(sync_run_id, response)` tuples, where `response` is
+                the JSON response of the [Census Sync Run API]
+                (https://docs.getcensus.com/basics/api/sync-runs#get-sync_runs-id)
+                for the completed or failed sync run, or a `SyncRun` if the client
+                returns typed responses, or an error response.
+        """
+        receiver = self.client.webhook_receiver
+        if receiver is not None:
+            receiver.subscribe(self.__on_webhook)
+
+        try:
+            while self._heap:
+                poll_at, _, sync_run_id = self._heap[0]
+                if sync_run_id not in self._intervals:
+                    # checked after its webhook and already yielded
+                    heapq.heappop(self._heap)
+                    continue
+
+                delay = poll_at - monotonic()
+                if delay > 0 and receiver is None:
+                    self.client.metrics_sink.observe_sleep(
+                        reason="poll", duration=delay
+                    )
+                    sleep(delay)
+                elif delay > 0:
+                    noticed_sync_run_id = self.__wait_for_webhook(delay)
+                    if noticed_sync_run_id is not None:
+                        response = self.__poll(noticed_sync_run_id)
+                        if response is not None:
+                            self.__forget(noticed_sync_run_id)
+                            yield noticed_sync_run_id, response
+                        continue
+
+                heapq.heappop(self._heap)
+                response = self.__poll(sync_run_id)
+
+                if response is None:
+                    self.__schedule(
+                        sync_run_id, delay=next(self._intervals[sync_run_id])
+                    )
+                else:
+                    self.__forget(sync_run_id)
+                    yield sync_run_id, response
+        finally:
+            if receiver is not None:
+                receiver.unsubscribe(self.__on_webhook)
+
+    def wait(self) -> Dict[int, Dict]:
+        """
+        Wait for all the watched sync runs to complete or fail, see `watch`.
+
+        Returns:
+            A dictionary mapping each sync run identifier to the JSON response
+                of the Census Sync Run API for the completed or failed sync run,
+                to a `SyncRun` if the client returns typed responses, or to
+                an error response.
+        """
+        return dict(self.watch())
@@ -0,0 +1,381 @@
+"""
+A local receiver of the webhooks Census sends when sync runs complete, so that
+waiting for a sync run doesn't require polling the Census API.
+"""
+import asyncio
+import hmac
+import json
+from collections import OrderedDict, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Event, Lock, Thread
+from types import TracebackType
+from typing import Callable, Dict, List, Optional, Tuple, Type
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from prefect_census.census_client import TERMINAL_SYNC_RUN_STATUSES
+from prefect_census.polling import FixedIntervalPolling, PollingStrategy
+
+
+def parse_sync_run_event(event: Dict) -> Optional[Tuple[int, str]]:
+    """
+    Extract the sync run and its status from a webhook event.
+
+    The sync run is read from the `data` or the `payload` of the event, or from
+    the event itself: its identifier from `sync_run_id` and its status from
+    `status` or, failing that, from the last part of the event name,
+    e.g. `sync_run.completed`.
+
+    Args:
+        event: The JSON body of the webhook.
+
+    Returns:
+        A `(sync_run_id, status)` tuple, or `None` if the event is not about
+            a sync run that completed or failed.
+    """
+    payload = event.get("data") or event.get("payload") or event
+    if not isinstance(payload, dict):
+        return None
+
+    sync_run_id = payload.get("sync_run_id")
+    status = payload.get("status") or str(event.get("event", "")).rsplit(".", 1)[-1]
+    if sync_run_id is None or status not in TERMINAL_SYNC_RUN_STATUSES:
+        return None
+    return int(sync_run_id), status
+
+
+class SyncRunWebhookReceiver:
+    """
+    Class that runs a small HTTP server, in a background thread, receiving the
+    webhooks Census sends when sync runs complete or fail.
+
+    Clients created with a receiver wait for their sync runs to complete on the
+    receiver instead of sleeping between status checks: a status check is made
+    as soon as the webhook of the sync run arrives. Status checks are still made
+    according to the polling strategy of the receiver, a slow safety net against
+    webhooks that never arrive.
+
+    The receiver must be reachable by Census: expose it, e.g. through a tunnel
+    or a load balancer, and configure the public URL as a webhook of the
+    workspace, with `token` as query parameter if set.
+
+    Args:
+        host: The interface to listen on. Defaults to `127.0.0.1`.
+        port: The port to listen on. Defaults to `0`, i.e. any free port.
+        path: The path webhooks are posted to. Defaults to `/census/webhooks`.
+        token: Optional secret that webhooks must pass as the `token` query
+            parameter. Defaults to `None`, i.e. any webhook is accepted.
+        polling_strategy: The strategy used to check the status of sync runs
+            whose webhook did not arrive. Defaults to a check every minute.
+        max_notices: Maximum number of sync run completions remembered, for
+            waits that start after the webhook arrived. Defaults to `10000`.
+        event_parser: The function extracting the sync run and its status
+            from a webhook event. Defaults to `parse_sync_run_event`.
+
+    Example:
+        ```python
+        from prefect_census.census_client import CensusClient
+        from prefect_census.webhooks import SyncRunWebhookReceiver
+
+        with SyncRunWebhookReceiver(port=8080, token=token) as receiver:
+            client = CensusClient(credentials=credentials, webhook_receiver=receiver)
+            client.trigger_sync_run(sync_id=1234, wait_for_sync_run_completed=True)
+        ```
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/census/webhooks",
+        token: Optional[str] = None,
+        polling_strategy: Optional[PollingStrategy] = None,
+        max_notices: int = 10000,
+        event_parser: Callable[[Dict], Optional[Tuple[int, str]]] = (
+            parse_sync_run_event
+        ),
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.path = path
+        self.token = token
+        self.polling_strategy = polling_strategy or FixedIntervalPolling(interval=60)
+        self.max_notices = max_notices
+        self.event_parser = event_parser
+        self._statuses: "OrderedDict[int, str]" = OrderedDict()
+        self._waiters: Dict[int, List[Callable[[], None]]] = defaultdict(list)
+        self._listeners: List[Callable[[int, str], None]] = []
+        self._lock = Lock()
+        self._server: Optional["_WebhookHTTPServer"] = None
+        self._thread: Optional[Thread] = None
+
+    def __enter__(self) -> "SyncRunWebhookReceiver":
+        """
+        Start receiving webhooks.
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Stop receiving webhooks.
+        """
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        The local URL webhooks must be posted to, including the token if any.
+        """
+        if self._server is None:
+            raise RuntimeError("The webhook receiver is not running.")
+        host, port = self._server.server_address[:2]
+        query = f"?{urlencode({'token': self.token})}" if self.token else ""
+        return f"http://{host}:{port}{self.path}{query}"
+
+    def start(self) -> None:
+        """
+        Start receiving webhooks in a background thread.
+        """
+        if self._server is not None:
+            return
+
+        handler = type("_Handler", (_WebhookRequestHandler,), {"receiver": self})
+        self._server = _WebhookHTTPServer((self.host, self.port), handler)
+        self._thread = Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="census-webhook-receiver",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop receiving webhooks and release the port.
+        """
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def notify(self, sync_run_id: int, status: str) -> None:
+        """
+        Record that a sync run completed or failed, and wake up its waiters.
+        Called for each webhook received.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            status: The status of the sync run.
+        """
+        with self._lock:
+            self._statuses[sync_run_id] = status
+            self._statuses.move_to_end(sync_run_id)
+            while len(self._statuses) > self.max_notices:
+                self._statuses.popitem(last=False)
+            waiters = self._waiters.pop(sync_run_id, [])
+            listeners = list(self._listeners)
+
+        for wake in waiters:
+            wake()
+        for listener in listeners:
+            listener(sync_run_id, status)
+
+    def get_status(self, sync_run_id: int) -> Optional[str]:
+        """
+        Returns the status received for a sync run, if any.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+
+        Returns:
+            `completed` or `failed`, or `None` if no webhook was received.
+        """
+        with self._lock:
+            return self._statuses.get(sync_run_id)
+
+    def subscribe(self, listener: Callable[[int, str], None]) -> None:
+        """
+        Call a function with the identifier and the status of each sync run
+        whose webhook is received. The function is called from the thread of
+        the receiver and must return quickly.
+
+        Args:
+            listener: The function to call.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[int, str], None]) -> None:
+        """
+        Stop calling a function subscribed with `subscribe`.
+
+        Args:
+            listener: The function to stop calling.
+        """
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def __add_waiter(self, sync_run_id: int, wake: Callable[[], None]) -> Optional[str]:
+        """
+        Register a function to call when the webhook of a sync run is received,
+        unless it was already received.
+
+        Returns:
+            The status received for the sync run, if any.
+        """
+        with self._lock:
+            status = self._statuses.get(sync_run_id)
+            if status is None:
+                self._waiters[sync_run_id].append(wake)
+            return status
+
+    def __remove_waiter(self, sync_run_id: int, wake: Callable[[], None]) -> None:
+        """
+        Unregister a function registered with `__add_waiter`, if still registered.
+        """
+        with self._lock:
+            waiters = self._waiters.get(sync_run_id)
+            if waiters and wake in waiters:
+                waiters.remove(wake)
+                if not waiters:
+                    del self._waiters[sync_run_id]
+
+    def wait(self, sync_run_id: int, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for the webhook of a sync run.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            timeout: Optional number of seconds to wait.
+
+        Returns:
+            The status received for the sync run, or `None` if no webhook
+                was received within `timeout` seconds.
+        """
+        event = Event()
+        status = self.__add_waiter(sync_run_id, event.set)
+        if status is not None:
+            return status
+
+        try:
+            event.wait(timeout)
+        finally:
+            self.__remove_waiter(sync_run_id, event.set)
+        return self.get_status(sync_run_id)
+
+    async def wait_async(
+        self, sync_run_id: int, timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Wait for the webhook of a sync run, without blocking the event loop.
+
+        Args:
+            sync_run_id: The identifier of the sync run.
+            timeout: Optional number of seconds to wait.
+
+        Returns:
+            The status received for the sync run, or `None` if no webhook
+                was received within `timeout` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake() -> None:
+            """
+            Resolve the future from the thread of the receiver.
+            """
+            try:
+                loop.call_soon_threadsafe(_set_done, future)
+            except RuntimeError:
+                # the loop was closed while the webhook was being handled
+                pass
+
+        status = self.__add_waiter(sync_run_id, wake)
+        if status is not None:
+            return status
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.__remove_waiter(sync_run_id, wake)
+        return self.get_status(sync_run_id)
+
+    def _handle(self, path: str, body: bytes) -> int:
+        """
+        Handle a webhook posted to the receiver.
+
+        Returns:
+            The status code of the response.
+        """
+        url = urlsplit(path)
+        if url.path != self.path:
+            return 404
+        if self.token is not None:
+            token = parse_qs(url.query).get("token", [""])[0]
+            if not hmac.compare_digest(token.encode(), self.token.encode()):
+                return 401
+
+        try:
+            events = json.loads(body)
+        except ValueError:
+            return 400
+
+        for event in events if isinstance(events, list) else [events]:
+            if not isinstance(event, dict):
+                return 400
+            sync_run = self.event_parser(event)
+            if sync_run is not None:
+                self.notify(*sync_run)
+        return 204
+
+
+def _set_done(future: asyncio.Future) -> None:
+    """
+    Resolve a future, unless its waiter already gave up.
+    """
+    if not future.done():
+        future.set_result(None)
+
+
+class _WebhookHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server serving each connection in its own thread.
+    """
+
+    daemon_threads = True
+
+
+class _WebhookRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of the webhook receiver.
+    """
+
+    protocol_version = "HTTP/1.1"
+    receiver: SyncRunWebhookReceiver
+
+    def do_POST(self) -> None:  # noqa: N802
+        """
+        Answer a webhook with the status code returned by the receiver.
+        """
+        content_length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(content_length) if content_length else b""
+        self.send_response(self.receiver._handle(self.path, body))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        """
+        Don't log requests to stderr.
+        """
+        pass
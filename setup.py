@@ -26,7 +26,12 @@ setup(
     packages=find_packages(exclude=("tests", "docs")),
     python_requires=">=3.7",
     install_requires=install_requires,
-    extras_require={"dev": dev_requires},
+    extras_require={
+        "dev": dev_requires,
+        "orjson": ["orjson"],
+        "msgspec": ["msgspec"],
+        "opentelemetry": ["opentelemetry-api"],
+    },
     classifiers=[
         "Natural Language :: English",
         "Intended Audience :: Developers",
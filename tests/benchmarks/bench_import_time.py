@@ -0,0 +1,62 @@
+"""
+Benchmark of the time it takes to import `prefect_census` in a fresh interpreter.
+
+Usage:
+    python tests/benchmarks/bench_import_time.py --runs 20
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import": "import prefect_census",
+    "import_and_version": "import prefect_census; prefect_census.__version__",
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, runs: int) -> dict:
+    """
+    Run the statement in `runs` fresh interpreters and summarize its duration.
+    """
+    durations = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", TIMER.format(statement=statement)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+    return {
+        "runs": runs,
+        "median_ms": statistics.median(durations) * 1000,
+        "min_ms": min(durations) * 1000,
+        "max_ms": max(durations) * 1000,
+    }
+
+
+def main() -> None:
+    """
+    Print the benchmark results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    results = {name: measure(stmt, args.runs) for name, stmt in STATEMENTS.items()}
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
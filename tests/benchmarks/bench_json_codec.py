@@ -0,0 +1,120 @@
+"""
+Microbenchmark of the per-call overhead of decoding Census API responses
+with each of the available JSON codecs.
+
+Usage:
+    python tests/benchmarks/bench_json_codec.py --number 2000
+"""
+import argparse
+import json
+import timeit
+
+import responses
+
+from prefect_census.census_client import CensusClient
+from prefect_census.codecs import MsgspecCodec, OrjsonCodec, StdlibJSONCodec
+
+SYNC_RUN = {
+    "status": "success",
+    "data": {
+        "id": 1234567890,
+        "sync_id": 1234,
+        "source_record_count": 1000000,
+        "records_processed": 1000000,
+        "records_updated": 999000,
+        "records_failed": 1000,
+        "records_invalid": 0,
+        "created_at": "2022-10-01T00:00:00.000Z",
+        "updated_at": "2022-10-01T00:10:00.000Z",
+        "completed_at": "2022-10-01T00:10:00.000Z",
+        "scheduled_execution_time": None,
+        "error_code": None,
+        "error_message": None,
+        "error_detail": None,
+        "status": "completed",
+        "canceled": False,
+        "full_sync": False,
+    },
+}
+
+SYNCS_PAGE = {
+    "status": "success",
+    "pagination": {"page": 1, "next_page": None, "per_page": 100},
+    "data": [
+        {
+            "id": sync_id,
+            "label": f"Sync {sync_id}",
+            "schedule_frequency": "daily",
+            "operation": "upsert",
+            "paused": False,
+            "mappings": [
+                {"from": {"type": "column", "data": f"col_{i}"}, "to": f"field_{i}"}
+                for i in range(20)
+            ],
+            "destination_attributes": {"connection_id": 1, "object": "Contact"},
+            "updated_at": "2022-10-01T00:00:00.000Z",
+        }
+        for sync_id in range(100)
+    ],
+}
+
+
+def available_codecs() -> dict:
+    """
+    Returns the codecs that can be instantiated in this environment.
+    """
+    codecs = {"stdlib": StdlibJSONCodec()}
+    for name, codec_cls in (("orjson", OrjsonCodec), ("msgspec", MsgspecCodec)):
+        try:
+            codecs[name] = codec_cls()
+        except ImportError:
+            pass
+    return codecs
+
+
+def per_call_us(fn, number: int) -> float:
+    """
+    Returns the best per-call duration of `fn`, in microseconds.
+    """
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    """
+    Print the benchmark results as JSON.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    sync_run = json.dumps(SYNC_RUN).encode()
+    syncs_page = json.dumps(SYNCS_PAGE).encode()
+    results = {}
+
+    for name, codec in available_codecs().items():
+        client = CensusClient(credentials="token", json_codec=codec)
+        with responses.RequestsMock() as mock:
+            mock.add(
+                method=responses.GET,
+                url="https://app.getcensus.com/api/v1/sync_runs/1234567890",
+                body=sync_run,
+            )
+            get_sync_run_us = per_call_us(
+                lambda: client.get_sync_run(sync_run_id=1234567890), args.number // 10
+            )
+
+        results[name] = {
+            "decode_sync_run_us": per_call_us(
+                lambda: codec.loads(sync_run), args.number
+            ),
+            "decode_syncs_page_us": per_call_us(
+                lambda: codec.loads(syncs_page), args.number // 10
+            ),
+            "get_sync_run_us": get_sync_run_us,
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark of the synchronous `trigger_sync_run` task, submitted to the task
+runner of a flow, against the asynchronous `trigger_sync_run_async` task,
+gathered on the event loop of an async flow, when waiting for many sync runs
+at once against a local `FakeCensusServer`.
+
+Usage:
+    python tests/benchmarks/bench_sync_vs_async_tasks.py \
+        --concurrency 1 100 500 --run-seconds 2
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import List
+
+from bench_trigger_throughput import MODES, run_scenario
+from harness import FakeServerCensusCredentials, environment
+
+from prefect_census.polling import (
+    ExponentialBackoffPolling,
+    FixedIntervalPolling,
+    PollingStrategy,
+)
+
+
+def run_async_task(
+    url: str, sync_ids: List[int], polling_strategy: PollingStrategy
+) -> List[float]:
+    """
+    Gather a `trigger_sync_run_async` task run for each sync in an async flow.
+
+    Returns:
+        The end-to-end latency of each sync run, in seconds.
+    """
+    from prefect import flow
+
+    from prefect_census.tasks import trigger_sync_run_async
+
+    credentials = FakeServerCensusCredentials(access_token="token", base_url=url)
+
+    async def trigger_and_wait(sync_id: int) -> float:
+        started_at = time.perf_counter()
+        await trigger_sync_run_async(
+            credentials=credentials,
+            sync_id=sync_id,
+            wait_for_sync_run_completed=True,
+            polling_strategy=polling_strategy,
+        )
+        return time.perf_counter() - started_at
+
+    @flow(name="bench-trigger-sync-runs-async")
+    async def bench_flow() -> List[float]:
+        return await asyncio.gather(
+            *[trigger_and_wait(sync_id) for sync_id in sync_ids]
+        )
+
+    return asyncio.run(bench_flow())
+
+
+MODES["async_task"] = run_async_task
+
+
+def main() -> None:
+    """
+    Print the benchmark results as JSON.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 100, 500])
+    parser.add_argument("--run-seconds", type=float, nargs="+", default=[2])
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Seconds the fake server waits before answering each request.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="Poll at a fixed interval instead of the default exponential backoff.",
+    )
+    args = parser.parse_args()
+
+    polling_strategy = (
+        FixedIntervalPolling(interval=args.poll_interval)
+        if args.poll_interval is not None
+        else ExponentialBackoffPolling()
+    )
+
+    results = [
+        run_scenario(
+            mode=mode,
+            concurrency=concurrency,
+            run_seconds=run_seconds,
+            latency=args.latency,
+            polling_strategy=polling_strategy,
+        )
+        for concurrency in args.concurrency
+        for run_seconds in args.run_seconds
+        for mode in ("task", "async_task")
+    ]
+
+    print(
+        json.dumps(
+            {"environment": environment(), "config": vars(args), "results": results},
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Benchmark of triggering and waiting for many sync runs at once against
+a local `FakeCensusServer`, through `CensusClient` and through the
+`trigger_sync_run` task.
+
+For each mode, number of concurrent syncs and sync run duration, it reports
+the rate of triggers, the end-to-end latency of the waits and its overhead
+over the sync run duration, the API calls made per completed sync run,
+and the peak number of threads and memory of the benchmark process.
+
+Usage:
+    python tests/benchmarks/bench_trigger_throughput.py \
+        --concurrency 1 100 1000 --run-seconds 1 5 --modes client task
+"""
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from harness import (
+    FakeCensusServerProcess,
+    FakeServerCensusCredentials,
+    ResourceSampler,
+    environment,
+    summarize,
+    triggers_per_second,
+)
+
+from prefect_census.census_client import CensusClient
+from prefect_census.polling import (
+    ExponentialBackoffPolling,
+    FixedIntervalPolling,
+    PollingStrategy,
+)
+
+
+def run_client(
+    url: str, sync_ids: List[int], polling_strategy: PollingStrategy
+) -> List[float]:
+    """
+    Trigger and wait for each sync from its own thread, sharing one client.
+
+    Returns:
+        The end-to-end latency of each sync run, in seconds.
+    """
+
+    def trigger_and_wait(client: CensusClient, sync_id: int) -> float:
+        started_at = time.perf_counter()
+        client.trigger_sync_run(
+            sync_id=sync_id,
+            wait_for_sync_run_completed=True,
+            polling_strategy=polling_strategy,
+        )
+        return time.perf_counter() - started_at
+
+    with CensusClient(
+        credentials="token", base_url=url, pool_maxsize=len(sync_ids)
+    ) as client:
+        with ThreadPoolExecutor(max_workers=len(sync_ids)) as executor:
+            return list(
+                executor.map(
+                    lambda sync_id: trigger_and_wait(client, sync_id), sync_ids
+                )
+            )
+
+
+def run_task(
+    url: str, sync_ids: List[int], polling_strategy: PollingStrategy
+) -> List[float]:
+    """
+    Submit a `trigger_sync_run` task run for each sync from a flow.
+
+    Returns:
+        The end-to-end latency of each sync run, in seconds.
+    """
+    from prefect import flow
+
+    from prefect_census.tasks import trigger_sync_run
+
+    credentials = FakeServerCensusCredentials(access_token="token", base_url=url)
+
+    @flow(name="bench-trigger-sync-runs")
+    def bench_flow() -> List[float]:
+        started_at = datetime.now(timezone.utc)
+        futures = [
+            trigger_sync_run.submit(
+                credentials=credentials,
+                sync_id=sync_id,
+                wait_for_sync_run_completed=True,
+                polling_strategy=polling_strategy,
+            )
+            for sync_id in sync_ids
+        ]
+        return [
+            (future.wait().timestamp - started_at).total_seconds() for future in futures
+        ]
+
+    return bench_flow()
+
+
+MODES = {"client": run_client, "task": run_task}
+
+
+def run_scenario(
+    mode: str,
+    concurrency: int,
+    run_seconds: float,
+    latency: float,
+    polling_strategy: PollingStrategy,
+) -> Dict:
+    """
+    Run a single scenario against a fresh fake server.
+    """
+    sync_ids = list(range(1, concurrency + 1))
+    lifecycle = [("working", run_seconds), ("completed", 0)]
+
+    with FakeCensusServerProcess(sync_ids, lifecycle, latency=latency) as server:
+        started_at = datetime.now(timezone.utc)
+        with ResourceSampler() as sampler:
+            latencies = MODES[mode](server.url, sync_ids, polling_strategy)
+        stats = server.stats()
+
+    api_calls = sum(stats["request_counts"].values())
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "run_seconds": run_seconds,
+        "triggers_per_second": triggers_per_second(stats["sync_runs"], started_at),
+        "wait_latency_seconds": summarize(latencies),
+        "wait_overhead_seconds": summarize(
+            [latency - run_seconds for latency in latencies]
+        ),
+        "api_calls_per_run": round(api_calls / concurrency, 2),
+        "request_counts": stats["request_counts"],
+        **sampler.to_dict(),
+    }
+
+
+def main() -> None:
+    """
+    Print the benchmark results as JSON.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--run-seconds", type=float, nargs="+", default=[1, 5])
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=["client"])
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Seconds the fake server waits before answering each request.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=None,
+        help="Poll at a fixed interval instead of the default exponential backoff.",
+    )
+    args = parser.parse_args()
+
+    polling_strategy = (
+        FixedIntervalPolling(interval=args.poll_interval)
+        if args.poll_interval is not None
+        else ExponentialBackoffPolling()
+    )
+
+    results = [
+        run_scenario(
+            mode=mode,
+            concurrency=concurrency,
+            run_seconds=run_seconds,
+            latency=args.latency,
+            polling_strategy=polling_strategy,
+        )
+        for mode in args.modes
+        for concurrency in args.concurrency
+        for run_seconds in args.run_seconds
+    ]
+
+    print(
+        json.dumps(
+            {"environment": environment(), "config": vars(args), "results": results},
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
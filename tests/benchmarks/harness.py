@@ -0,0 +1,195 @@
+"""
+Helpers shared by the benchmarks that drive a `FakeCensusServer`.
+
+The fake server runs in a child process, so that the threads and the memory
+measured in the benchmark process are those of the client side only.
+"""
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from prefect_census.census_client import AsyncCensusClient, CensusClient
+from prefect_census.credentials import CensusCredentials
+from prefect_census.testing import FakeCensusServer
+
+
+def _serve(conn, sync_ids, lifecycle, latency) -> None:
+    """
+    Run a fake Census server until asked to stop, answering commands
+    sent by the parent process.
+    """
+    with FakeCensusServer(
+        sync_ids=sync_ids, lifecycle=lifecycle, latency=latency
+    ) as server:
+        conn.send(server.url)
+        while True:
+            command = conn.recv()
+            if command == "stats":
+                conn.send(
+                    {
+                        "request_counts": dict(server.request_counts),
+                        "sync_runs": server.get_sync_runs(),
+                    }
+                )
+            elif command == "stop":
+                return
+
+
+class FakeCensusServerProcess:
+    """
+    A `FakeCensusServer` running in a child process.
+    """
+
+    def __init__(
+        self,
+        sync_ids: Sequence[int],
+        lifecycle: Sequence,
+        latency: float = 0,
+    ) -> None:
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(
+            target=_serve,
+            args=(child_conn, list(sync_ids), list(lifecycle), latency),
+            daemon=True,
+        )
+        self.url: Optional[str] = None
+
+    def __enter__(self) -> "FakeCensusServerProcess":
+        self._process.start()
+        self.url = self._conn.recv()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._conn.send("stop")
+        self._process.join(timeout=10)
+
+    def stats(self) -> Dict:
+        """
+        Returns the request counts and the sync runs of the server.
+        """
+        self._conn.send("stats")
+        return self._conn.recv()
+
+
+class FakeServerCensusCredentials(CensusCredentials):
+    """
+    Credentials whose clients call the fake Census server.
+    """
+
+    _block_type_name = "Fake Server Census Credentials"
+
+    base_url: str
+
+    def get_client(self, **client_kwargs: Any) -> CensusClient:
+        return super().get_client(base_url=self.base_url, **client_kwargs)
+
+    def get_shared_client(self, **client_kwargs: Any) -> CensusClient:
+        return super().get_shared_client(base_url=self.base_url, **client_kwargs)
+
+    def get_async_client(self, **client_kwargs: Any) -> AsyncCensusClient:
+        return super().get_async_client(base_url=self.base_url, **client_kwargs)
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """
+    Returns the resident set size of the process, where `/proc` is available.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class ResourceSampler:
+    """
+    Context manager sampling the number of threads and the memory
+    of the process in a background thread.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.peak_threads = 0
+        self.peak_rss_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self) -> None:
+        self.peak_threads = max(self.peak_threads, threading.active_count())
+        rss = _current_rss_bytes()
+        if rss is None:
+            # ru_maxrss is the peak of the whole process, in kilobytes on Linux
+            # and in bytes on macOS
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            rss *= 1 if sys.platform == "darwin" else 1024
+        self.peak_rss_bytes = max(self.peak_rss_bytes, rss)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "ResourceSampler":
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+    def to_dict(self) -> Dict:
+        return {
+            "peak_threads": self.peak_threads,
+            "peak_rss_mb": round(self.peak_rss_bytes / 2**20, 1),
+        }
+
+
+def summarize(values: List[float]) -> Dict:
+    """
+    Returns the percentiles of a list of durations, in seconds.
+    """
+    values = sorted(values)
+    if not values:
+        return {}
+    return {
+        "p50": round(statistics.median(values), 4),
+        "p95": round(values[min(len(values) - 1, int(len(values) * 0.95))], 4),
+        "max": round(values[-1], 4),
+    }
+
+
+def triggers_per_second(sync_runs: List[Dict], started_at: datetime) -> float:
+    """
+    Returns the rate at which sync runs were triggered, from the creation time
+    recorded by the server.
+    """
+    created_at = max(
+        datetime.fromisoformat(sync_run["created_at"].replace("Z", "+00:00"))
+        for sync_run in sync_runs
+    )
+    elapsed = (created_at - started_at).total_seconds()
+    return round(len(sync_runs) / elapsed, 1) if elapsed > 0 else float("inf")
+
+
+def environment() -> Dict:
+    """
+    Returns a description of the environment the benchmark ran in.
+    """
+    import prefect_census
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "prefect_census": prefect_census.__version__,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
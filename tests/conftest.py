@@ -0,0 +1,33 @@
+import pytest
+
+from prefect_census import rate_limiter, sync_index
+from prefect_census.census_client import close_shared_clients
+from prefect_census.testing import FakeCensusServer
+
+FAST_LIFECYCLE = [("working", 0.1), ("completed", 0)]
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    """
+    Releases the clients, sync indexes and rate limiters shared by the process
+    after each test, so that no test sees another one's state.
+    """
+    yield
+    close_shared_clients()
+    sync_index._shared_sync_indexes.clear()
+    rate_limiter._shared_rate_limiters.clear()
+
+
+@pytest.fixture
+def fake_census_server(monkeypatch):
+    """
+    A fake Census API with syncs 1, 2 and 3, which clients created without
+    a base URL, e.g. by tasks and flows, send their requests to.
+    """
+    with FakeCensusServer(sync_ids=[1, 2, 3], lifecycle=FAST_LIFECYCLE) as server:
+        monkeypatch.setattr(
+            "prefect_census.census_client._BaseCensusClient._CENSUS_API_URL",
+            server.url[: -len("/v1")],
+        )
+        yield server
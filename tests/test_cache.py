@@ -0,0 +1,43 @@
+import pytest
+
+from prefect_census.cache import SyncRunCache
+
+
+def test_cache_invalid_maxsize_raises():
+    with pytest.raises(ValueError, match="maxsize"):
+        SyncRunCache(maxsize=0)
+
+
+def test_cache_counts_hits_and_misses():
+    cache = SyncRunCache()
+    response = {"status": "success", "data": {"status": "completed"}}
+
+    assert cache.get(1) is None
+    cache.put(1, response)
+    assert cache.get(1) is response
+    assert cache.get(1) is response
+
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = SyncRunCache(maxsize=2)
+    cache.put(1, {"id": 1})
+    cache.put(2, {"id": 2})
+    cache.get(1)
+    cache.put(3, {"id": 3})
+
+    assert len(cache) == 2
+    assert cache.get(2) is None
+    assert cache.get(1) == {"id": 1}
+    assert cache.get(3) == {"id": 3}
+
+
+def test_cache_clear():
+    cache = SyncRunCache()
+    cache.put(1, {"id": 1})
+    cache.get(1)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -1,11 +1,32 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import httpx
 import pytest
+import requests
 import responses
 from pydantic import SecretStr
 from responses import matchers
 
-from prefect_census.census_client import CensusClient
+from prefect_census.cache import SyncRunCache
+from prefect_census.census_client import (
+    AsyncCensusClient,
+    CensusClient,
+    close_shared_clients,
+)
+from prefect_census.codecs import StdlibJSONCodec
 from prefect_census.credentials import CensusCredentials
-from prefect_census.exceptions import CensusAPIFailureException
+from prefect_census.exceptions import (
+    CensusAPIFailureException,
+    CensusSyncRunTimeoutException,
+)
+from prefect_census.models import SyncRun, SyncTriggerResult
+from prefect_census.polling import (
+    EstimatedDurationPolling,
+    ExponentialBackoffPolling,
+    FixedIntervalPolling,
+)
+from prefect_census.retries import RetryPolicy
 
 
 def test_census_client_construction():
@@ -15,6 +36,32 @@ def test_census_client_construction():
     assert client.credentials.access_token.get_secret_value() == "foo"
 
 
+@pytest.mark.parametrize(
+    "credentials",
+    [
+        "foo",
+        SimpleNamespace(access_token="foo"),
+        SimpleNamespace(access_token=SecretStr("foo")),
+    ],
+)
+@responses.activate
+def test_census_client_accepts_plain_credentials(credentials):
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.GET,
+        url=api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+
+    with CensusClient(credentials=credentials) as client:
+        client.get_sync_run(sync_run_id=1234567890)
+
+    assert (
+        responses.calls[0].request.headers["Authorization"] == "Basic YmVhcmVyOmZvbw=="
+    )
+
+
 @responses.activate
 def test_get_sync_run_raises():
     api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
@@ -256,3 +303,862 @@ def test_trigger_sync_run_with_wait_after_wait_succeed():
 
     assert responses.assert_call_count(trigger_sync_api_url, 1) is True
     assert responses.assert_call_count(sync_run_api_url, 2) is True
+
+
+@responses.activate
+def test_census_client_reuses_session():
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.GET,
+        url=api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+
+    client.get_sync_run(sync_run_id=1234567890)
+    session = client._CensusClient__session
+    client.get_sync_run(sync_run_id=1234567890)
+
+    assert session is not None
+    assert client._CensusClient__session is session
+    assert responses.assert_call_count(api_url, 2) is True
+
+
+@responses.activate
+def test_census_client_pool_configuration():
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.GET,
+        url=api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(
+        credentials=creds, pool_connections=2, pool_maxsize=20, keep_alive=False
+    )
+    client.get_sync_run(sync_run_id=1234567890)
+
+    session = client._CensusClient__session
+    adapter = session.get_adapter("https://app.getcensus.com")
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 20
+    assert session.headers["Connection"] == "close"
+
+
+@responses.activate
+def test_census_client_context_manager_closes_session():
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.GET,
+        url=api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    with CensusClient(credentials=creds) as client:
+        client.get_sync_run(sync_run_id=1234567890)
+        assert client._CensusClient__session is not None
+
+    assert client._CensusClient__session is None
+
+
+def mock_transport(routes):
+    """
+    Build an `httpx.MockTransport` that replays, for each `(method, url)` pair,
+    the given list of `(status_code, json)` responses in order.
+    """
+    calls = []
+
+    def handler(request):
+        key = (request.method, str(request.url.copy_with(query=None)))
+        calls.append((request.method, str(request.url)))
+        status_code, json = (
+            routes[key].pop(0) if len(routes[key]) > 1 else routes[key][0]
+        )
+        return httpx.Response(status_code=status_code, json=json)
+
+    return httpx.MockTransport(handler), calls
+
+
+async def test_async_get_sync_run_raises(monkeypatch):
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr("prefect_census.census_client.asyncio.sleep", no_sleep)
+
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    transport, _ = mock_transport({("GET", api_url): [(500, None)]})
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    msg_match = "There was an error while calling Census API"
+    with pytest.raises(CensusAPIFailureException, match=msg_match):
+        async with AsyncCensusClient(credentials=creds, transport=transport) as client:
+            await client.get_sync_run(sync_run_id=1234567890)
+
+
+async def test_async_get_sync_run_failed_raises():
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    transport, _ = mock_transport(
+        {
+            ("GET", api_url): [
+                (
+                    200,
+                    {
+                        "status": "success",
+                        "data": {"status": "failed", "error_message": "failed!"},
+                    },
+                )
+            ]
+        }
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    with pytest.raises(CensusAPIFailureException, match="Census API failure: failed!"):
+        async with AsyncCensusClient(credentials=creds, transport=transport) as client:
+            await client.get_sync_run(sync_run_id=1234567890)
+
+
+async def test_async_trigger_sync_run_succeed():
+    api_url = "https://app.getcensus.com/api/v1/syncs/1234/trigger"
+    transport, calls = mock_transport(
+        {
+            ("POST", api_url): [
+                (200, {"status": "success", "data": {"sync_run_id": 1234567890}})
+            ]
+        }
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    async with AsyncCensusClient(credentials=creds, transport=transport) as client:
+        response = await client.trigger_sync_run(sync_id=1234, force_full_sync=True)
+
+    assert response == {"status": "success", "data": {"sync_run_id": 1234567890}}
+    assert calls == [("POST", f"{api_url}?force_full_sync=true")]
+
+
+async def test_async_trigger_sync_run_with_wait_succeed(monkeypatch):
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr("prefect_census.census_client.asyncio.sleep", no_sleep)
+
+    trigger_sync_api_url = "https://app.getcensus.com/api/v1/syncs/1234/trigger"
+    sync_run_api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    transport, calls = mock_transport(
+        {
+            ("POST", trigger_sync_api_url): [
+                (200, {"status": "success", "data": {"sync_run_id": 1234567890}})
+            ],
+            ("GET", sync_run_api_url): [
+                (200, {"status": "success", "data": {"status": "working"}}),
+                (
+                    200,
+                    {
+                        "status": "success",
+                        "data": {"status": "completed", "records_processed": 1},
+                    },
+                ),
+            ],
+        }
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    async with AsyncCensusClient(credentials=creds, transport=transport) as client:
+        response = await client.trigger_sync_run(
+            sync_id=1234, wait_for_sync_run_completed=True
+        )
+
+    assert response == {
+        "status": "success",
+        "data": {"status": "completed", "records_processed": 1},
+    }
+    assert len(calls) == 3
+
+
+@responses.activate
+def test_trigger_sync_run_with_wait_sleeps_on_any_non_terminal_status(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("prefect_census.census_client.sleep", sleeps.append)
+
+    sync_run_api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.POST,
+        url="https://app.getcensus.com/api/v1/syncs/1234/trigger",
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 1234567890}},
+    )
+    for status in ["queued", "working", "working"]:
+        responses.add(
+            method=responses.GET,
+            url=sync_run_api_url,
+            status=200,
+            json={"status": "success", "data": {"status": status}},
+        )
+    responses.add(
+        method=responses.GET,
+        url=sync_run_api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(
+        credentials=creds,
+        polling_strategy=ExponentialBackoffPolling(initial_interval=2, jitter=False),
+    )
+    response = client.trigger_sync_run(sync_id=1234, wait_for_sync_run_completed=True)
+
+    assert response["data"]["status"] == "completed"
+    assert sleeps == [2, 4, 8]
+    assert responses.assert_call_count(sync_run_api_url, 4) is True
+
+
+@responses.activate
+def test_wait_for_sync_run_learns_sync_durations(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("prefect_census.census_client.sleep", sleeps.append)
+
+    for sync_run_id, statuses in [(1, ["working"]), (2, ["working", "working"])]:
+        for status in statuses + ["completed"]:
+            data = {"id": sync_run_id, "sync_id": 1234, "status": status}
+            if status == "completed":
+                data["created_at"] = "2021-10-20T02:50:00Z"
+                data["completed_at"] = "2021-10-20T02:55:00Z"
+            responses.add(
+                method=responses.GET,
+                url=f"https://app.getcensus.com/api/v1/sync_runs/{sync_run_id}",
+                status=200,
+                json={"status": "success", "data": data},
+            )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    strategy = EstimatedDurationPolling(max_interval=60)
+    client = CensusClient(credentials=creds, polling_strategy=strategy)
+
+    # no past run: the fallback strategy checks the status after 1 second
+    client.wait_for_sync_run(sync_run_id=1)
+    assert sleeps == [1]
+    assert strategy.estimator.get_estimate(1234) == (300, 150)
+
+    # the sync run is not expected to complete before 150 seconds
+    client.wait_for_sync_run(sync_run_id=2)
+    assert sleeps == [1, 60, 60]
+
+    # a resumed wait for a sync run created 200 seconds ago, within the window
+    for status in ["working", "completed"]:
+        responses.add(
+            method=responses.GET,
+            url="https://app.getcensus.com/api/v1/sync_runs/3",
+            status=200,
+            json={
+                "status": "success",
+                "data": {
+                    "id": 3,
+                    "sync_id": 1234,
+                    "status": status,
+                    "created_at": "2021-10-20T02:50:00Z",
+                    "updated_at": "2021-10-20T02:53:20Z",
+                },
+            },
+        )
+    client.wait_for_sync_run(sync_run_id=3)
+    assert sleeps == [1, 60, 60, 22.5]
+
+
+@responses.activate
+def test_wait_for_sync_run_timeout_raises(monkeypatch):
+    clock = [0.0]
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+
+    monkeypatch.setattr("prefect_census.census_client.sleep", fake_sleep)
+    monkeypatch.setattr("prefect_census.census_client.monotonic", lambda: clock[0])
+    monkeypatch.setattr("prefect_census.polling.monotonic", lambda: clock[0])
+
+    responses.add(
+        method=responses.GET,
+        url="https://app.getcensus.com/api/v1/sync_runs/1234567890",
+        status=200,
+        json={"status": "success", "data": {"status": "working"}},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+    strategy = FixedIntervalPolling(interval=10, timeout=25)
+
+    msg_match = "did not complete in time, last known status: working"
+    with pytest.raises(CensusSyncRunTimeoutException, match=msg_match):
+        client.wait_for_sync_run(sync_run_id=1234567890, polling_strategy=strategy)
+
+    assert clock[0] == 25
+
+
+@responses.activate
+def test_trigger_sync_runs_reports_per_sync_results():
+    for sync_id in [1, 2]:
+        responses.add(
+            method=responses.POST,
+            url=f"https://app.getcensus.com/api/v1/syncs/{sync_id}/trigger",
+            status=200,
+            json={"status": "success", "data": {"sync_run_id": sync_id * 10}},
+        )
+    responses.add(
+        method=responses.POST,
+        url="https://app.getcensus.com/api/v1/syncs/3/trigger",
+        status=500,
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+
+    results = client.trigger_sync_runs(sync_ids=[1, 2, 3], max_concurrency=2)
+
+    assert list(results) == [1, 2, 3]
+    assert results[1] == {"status": "success", "data": {"sync_run_id": 10}}
+    assert results[2] == {"status": "success", "data": {"sync_run_id": 20}}
+    assert results[3]["status"] == "error"
+    assert "There was an error while calling Census API" in results[3]["message"]
+
+
+async def test_async_trigger_sync_runs_reports_per_sync_results():
+    transport, calls = mock_transport(
+        {
+            ("POST", "https://app.getcensus.com/api/v1/syncs/1/trigger"): [
+                (200, {"status": "success", "data": {"sync_run_id": 10}})
+            ],
+            ("POST", "https://app.getcensus.com/api/v1/syncs/2/trigger"): [
+                (200, {"status": "error", "message": "panic!"})
+            ],
+        }
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    async with AsyncCensusClient(credentials=creds, transport=transport) as client:
+        results = await client.trigger_sync_runs(sync_ids=[1, 2], max_concurrency=1)
+
+    assert results == {
+        1: {"status": "success", "data": {"sync_run_id": 10}},
+        2: {"status": "error", "message": "Census API responded with error: panic!"},
+    }
+    assert len(calls) == 2
+
+
+@responses.activate
+def test_census_clients_share_rate_limiter_by_access_token(monkeypatch):
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.GET,
+        url=api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+
+    first = CensusClient(
+        credentials=CensusCredentials(access_token=SecretStr("shared")),
+        requests_per_second=5,
+    )
+    second = CensusClient(
+        credentials=CensusCredentials(access_token=SecretStr("shared")),
+        requests_per_second=5,
+    )
+    other = CensusClient(
+        credentials=CensusCredentials(access_token=SecretStr("other")),
+        requests_per_second=5,
+    )
+    unlimited = CensusClient(
+        credentials=CensusCredentials(access_token=SecretStr("shared"))
+    )
+
+    assert first.rate_limiter is second.rate_limiter
+    assert other.rate_limiter is not first.rate_limiter
+    assert unlimited.rate_limiter is None
+
+    acquired = []
+    monkeypatch.setattr(
+        first.rate_limiter, "acquire", lambda: acquired.append(1) or 0.0
+    )
+    first.get_sync_run(sync_run_id=1234567890)
+    second.get_sync_run(sync_run_id=1234567890)
+
+    assert len(acquired) == 2
+
+
+@responses.activate
+def test_get_sync_run_retries_honoring_retry_after(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("prefect_census.census_client.sleep", sleeps.append)
+
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.GET, url=api_url, status=429, headers={"Retry-After": "7"}
+    )
+    responses.add(method=responses.GET, url=api_url, status=503)
+    responses.add(
+        method=responses.GET,
+        url=api_url,
+        body=requests.exceptions.ConnectionError("connection reset"),
+    )
+    responses.add(
+        method=responses.GET,
+        url=api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+    response = client.get_sync_run(sync_run_id=1234567890)
+
+    assert response["data"]["status"] == "completed"
+    assert sleeps == [7, 1, 2]
+
+
+@responses.activate
+def test_get_sync_run_gives_up_after_max_retries(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("prefect_census.census_client.sleep", sleeps.append)
+
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(method=responses.GET, url=api_url, status=502)
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds, retry_policy=RetryPolicy(max_retries=2))
+
+    msg_match = "There was an error while calling Census API"
+    with pytest.raises(CensusAPIFailureException, match=msg_match):
+        client.get_sync_run(sync_run_id=1234567890)
+
+    assert sleeps == [0.5, 1]
+    assert responses.assert_call_count(api_url, 3) is True
+
+
+@responses.activate
+def test_trigger_sync_run_is_not_retried_when_it_may_have_been_processed(
+    monkeypatch,
+):
+    monkeypatch.setattr("prefect_census.census_client.sleep", lambda seconds: None)
+
+    api_url = "https://app.getcensus.com/api/v1/syncs/1234/trigger"
+    responses.add(method=responses.POST, url=api_url, status=503)
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+
+    with pytest.raises(CensusAPIFailureException):
+        client.trigger_sync_run(sync_id=1234)
+
+    responses.replace(
+        method_or_response=responses.POST,
+        url=api_url,
+        body=requests.exceptions.ReadTimeout("read timed out"),
+    )
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client.trigger_sync_run(sync_id=1234)
+
+    assert responses.assert_call_count(api_url, 2) is True
+
+
+@responses.activate
+def test_trigger_sync_run_is_retried_when_it_was_not_processed(monkeypatch):
+    monkeypatch.setattr("prefect_census.census_client.sleep", lambda seconds: None)
+
+    api_url = "https://app.getcensus.com/api/v1/syncs/1234/trigger"
+    responses.add(method=responses.POST, url=api_url, status=429)
+    responses.add(
+        method=responses.POST,
+        url=api_url,
+        body=requests.exceptions.ConnectTimeout("connect timed out"),
+    )
+    responses.add(
+        method=responses.POST,
+        url=api_url,
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 1234567890}},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+    response = client.trigger_sync_run(sync_id=1234)
+
+    assert response == {"status": "success", "data": {"sync_run_id": 1234567890}}
+    assert responses.assert_call_count(api_url, 3) is True
+
+
+async def test_async_trigger_sync_run_retries(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("prefect_census.census_client.asyncio.sleep", fake_sleep)
+
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        if len(attempts) == 2:
+            return httpx.Response(status_code=429, headers={"Retry-After": "3"})
+        if len(attempts) == 3:
+            return httpx.Response(status_code=503)
+        return httpx.Response(
+            status_code=200, json={"status": "success", "data": {"sync_run_id": 1}}
+        )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    async with AsyncCensusClient(
+        credentials=creds, transport=httpx.MockTransport(handler)
+    ) as client:
+        with pytest.raises(CensusAPIFailureException):
+            await client.trigger_sync_run(sync_id=1234)
+
+        response = await client.trigger_sync_run(sync_id=1234)
+
+    assert response == {"status": "success", "data": {"sync_run_id": 1}}
+    assert sleeps == [0.5, 3]
+    assert len(attempts) == 4
+
+
+@responses.activate
+def test_api_calls_use_connect_and_read_timeouts():
+    api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.GET,
+        url=api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds, connect_timeout=3, read_timeout=30)
+    client.get_sync_run(sync_run_id=1234567890)
+    client.get_sync_run(sync_run_id=1234567890, timeout=5)
+
+    assert responses.calls[0].request.req_kwargs["timeout"] == (3, 30)
+    connect_timeout, read_timeout = responses.calls[1].request.req_kwargs["timeout"]
+    assert connect_timeout == 3
+    assert 4 < read_timeout <= 5
+
+
+@responses.activate
+def test_trigger_sync_run_timeout_reports_last_known_status(monkeypatch):
+    clock = [0.0]
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+
+    monkeypatch.setattr("prefect_census.census_client.sleep", fake_sleep)
+    monkeypatch.setattr("prefect_census.census_client.monotonic", lambda: clock[0])
+
+    sync_run_api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.POST,
+        url="https://app.getcensus.com/api/v1/syncs/1234/trigger",
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 1234567890}},
+    )
+    responses.add(
+        method=responses.GET,
+        url=sync_run_api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "working"}},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(
+        credentials=creds, polling_strategy=FixedIntervalPolling(interval=20)
+    )
+
+    msg_match = "Sync run 1234567890 did not complete in time, last known status: work"
+    with pytest.raises(CensusSyncRunTimeoutException, match=msg_match) as exc_info:
+        client.trigger_sync_run(
+            sync_id=1234, wait_for_sync_run_completed=True, timeout=50
+        )
+
+    assert exc_info.value.sync_run_id == 1234567890
+    assert exc_info.value.last_response["data"]["status"] == "working"
+    assert clock[0] == 50
+    assert responses.assert_call_count(sync_run_api_url, 3) is True
+
+
+@responses.activate
+def test_wait_for_sync_run_does_not_retry_past_the_deadline(monkeypatch):
+    clock = [0.0]
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+
+    monkeypatch.setattr("prefect_census.census_client.sleep", fake_sleep)
+    monkeypatch.setattr("prefect_census.census_client.monotonic", lambda: clock[0])
+
+    sync_run_api_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.GET,
+        url=sync_run_api_url,
+        status=200,
+        json={"status": "success", "data": {"status": "queued"}},
+    )
+    responses.add(
+        method=responses.GET,
+        url=sync_run_api_url,
+        status=503,
+        headers={"Retry-After": "120"},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(
+        credentials=creds, polling_strategy=FixedIntervalPolling(interval=10)
+    )
+
+    msg_match = "last known status: queued"
+    with pytest.raises(CensusSyncRunTimeoutException, match=msg_match):
+        client.wait_for_sync_run(sync_run_id=1234567890, timeout=60)
+
+    assert clock[0] == 10
+    assert responses.assert_call_count(sync_run_api_url, 2) is True
+
+
+@responses.activate
+def test_trigger_sync_run_does_not_wait_for_rate_limit_past_the_deadline(
+    monkeypatch,
+):
+    clock = [0.0]
+    monkeypatch.setattr("prefect_census.census_client.monotonic", lambda: clock[0])
+
+    trigger_sync_run_api_url = "https://app.getcensus.com/api/v1/syncs/1234/trigger"
+    responses.add(
+        method=responses.POST,
+        url=trigger_sync_run_api_url,
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 1234567890}},
+    )
+
+    client = CensusClient(
+        credentials=CensusCredentials(access_token=SecretStr("foo")),
+        requests_per_second=1,
+    )
+
+    def slow_acquire():
+        clock[0] += 90
+        return 90.0
+
+    monkeypatch.setattr(client.rate_limiter, "acquire", slow_acquire)
+
+    with pytest.raises(CensusSyncRunTimeoutException, match="deadline"):
+        client.trigger_sync_run(sync_id=1234, timeout=60)
+
+    assert responses.assert_call_count(trigger_sync_run_api_url, 0) is True
+
+
+async def test_async_trigger_sync_run_timeout_raises():
+    def handler(request):
+        raise httpx.ReadTimeout("read timed out", request=request)
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    async with AsyncCensusClient(
+        credentials=creds, transport=httpx.MockTransport(handler)
+    ) as client:
+        with pytest.raises(CensusSyncRunTimeoutException, match="deadline"):
+            await client.trigger_sync_run(sync_id=1234, timeout=0)
+
+
+def add_paginated_responses(api_url, pages, params=None):
+    for page, items in enumerate(pages, start=1):
+        next_page = page + 1 if page < len(pages) else None
+        responses.add(
+            method=responses.GET,
+            url=api_url,
+            status=200,
+            match=[matchers.query_param_matcher({**(params or {}), "page": page})],
+            json={
+                "status": "success",
+                "pagination": {"page": page, "next_page": next_page},
+                "data": items,
+            },
+        )
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+@responses.activate
+def test_iter_syncs_walks_all_pages(prefetch):
+    api_url = "https://app.getcensus.com/api/v1/syncs"
+    add_paginated_responses(
+        api_url,
+        [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]],
+        params={"per_page": 2},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+    syncs = client.iter_syncs(per_page=2, prefetch=prefetch)
+
+    assert [sync["id"] for sync in syncs] == [1, 2, 3, 4, 5]
+    assert responses.assert_call_count(f"{api_url}?per_page=2&page=3", 1) is True
+
+
+@responses.activate
+def test_iter_sync_runs_stops_at_since():
+    api_url = "https://app.getcensus.com/api/v1/syncs/1234/sync_runs"
+    add_paginated_responses(
+        api_url,
+        [
+            [
+                {"id": 3, "created_at": "2022-10-03T00:00:00.000Z"},
+                {"id": 2, "created_at": "2022-10-02T00:00:00.000Z"},
+            ],
+            [
+                {"id": 1, "created_at": "2022-09-30T00:00:00.000Z"},
+                {"id": 0, "created_at": "2022-09-29T00:00:00.000Z"},
+            ],
+            [],
+        ],
+        params={"per_page": 2, "order": "desc"},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+    sync_runs = client.iter_sync_runs(
+        sync_id=1234, since=datetime(2022, 10, 1), per_page=2, prefetch=False
+    )
+
+    assert [sync_run["id"] for sync_run in sync_runs] == [3, 2]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_iter_sync_runs_without_since():
+    api_url = "https://app.getcensus.com/api/v1/syncs/1234/sync_runs"
+    add_paginated_responses(
+        api_url,
+        [[{"id": 2, "created_at": "2022-10-03T00:00:00Z"}], [{"id": 1}]],
+        params={"per_page": 100, "order": "desc"},
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+
+    assert [run["id"] for run in client.iter_sync_runs(sync_id=1234)] == [2, 1]
+
+
+@responses.activate
+def test_get_sync_run_caches_terminal_states_only():
+    for sync_run_id, status in [(1, "working"), (2, "completed"), (3, "failed")]:
+        responses.add(
+            method=responses.GET,
+            url=f"https://app.getcensus.com/api/v1/sync_runs/{sync_run_id}",
+            status=200,
+            json={
+                "status": "success",
+                "data": {"status": status, "error_message": "failed!"},
+            },
+        )
+
+    cache = SyncRunCache()
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds, sync_run_cache=cache)
+
+    for _ in range(2):
+        client.get_sync_run(sync_run_id=1)
+        client.get_sync_run(sync_run_id=2)
+        with pytest.raises(CensusAPIFailureException, match="failed!"):
+            client.get_sync_run(sync_run_id=3)
+
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_call_api_decodes_the_body_once_with_the_client_codec():
+    responses.add(
+        method=responses.GET,
+        url="https://app.getcensus.com/api/v1/sync_runs/1234567890",
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+
+    class CountingCodec(StdlibJSONCodec):
+        calls = 0
+
+        def loads(self, data):
+            CountingCodec.calls += 1
+            return super().loads(data)
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds, json_codec=CountingCodec())
+    response = client.get_sync_run(sync_run_id=1234567890)
+
+    assert response == {"status": "success", "data": {"status": "completed"}}
+    assert CountingCodec.calls == 1
+
+
+@responses.activate
+def test_census_client_returns_typed_responses():
+    responses.add(
+        method=responses.POST,
+        url="https://app.getcensus.com/api/v1/syncs/1/trigger",
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 10}},
+    )
+    responses.add(
+        method=responses.POST,
+        url="https://app.getcensus.com/api/v1/syncs/2/trigger",
+        status=500,
+    )
+    responses.add(
+        method=responses.GET,
+        url="https://app.getcensus.com/api/v1/sync_runs/10",
+        status=200,
+        json={
+            "status": "success",
+            "data": {"id": 10, "sync_id": 1, "status": "completed"},
+        },
+    )
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds, typed_responses=True)
+
+    sync_run = client.trigger_sync_run(sync_id=1, wait_for_sync_run_completed=True)
+    assert isinstance(sync_run, SyncRun)
+    assert (sync_run.id, sync_run.status) == (10, "completed")
+
+    results = client.trigger_sync_runs(sync_ids=[1, 2])
+    assert results[1] == SyncTriggerResult(status="success", sync_run_id=10)
+    assert not results[2].succeeded
+    assert "There was an error while calling Census API" in results[2].message
+
+
+def test_for_credentials_shares_clients_by_access_token_and_options():
+    client = CensusClient.for_credentials(CensusCredentials(access_token="foo"))
+
+    assert CensusClient.for_credentials(SimpleNamespace(access_token="foo")) is client
+    assert CensusClient.for_credentials("bar") is not client
+    assert CensusClient.for_credentials("foo", pool_maxsize=50) is not client
+    assert CensusClient.for_credentials("foo", pool_maxsize=50).pool_maxsize == 50
+
+    close_shared_clients()
+    assert CensusClient.for_credentials("foo") is not client
+
+
+def test_for_credentials_releases_idle_clients(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("prefect_census.census_client.monotonic", lambda: now[0])
+
+    idle_client = CensusClient.for_credentials("foo")
+    idle_client._CensusClient__get_session()
+    now[0] += 200
+    busy_client = CensusClient.for_credentials("bar")
+    now[0] += 200
+
+    # foo is idle for 400s, bar for 200s
+    assert CensusClient.for_credentials("bar") is busy_client
+    assert idle_client._CensusClient__session is None
+    assert CensusClient.for_credentials("foo") is not idle_client
@@ -0,0 +1,27 @@
+from prefect_census.checkpoints import LocalFileCheckpointStore
+
+
+def test_local_file_checkpoint_store_roundtrip(tmp_path):
+    store = LocalFileCheckpointStore(tmp_path / "checkpoints")
+
+    assert store.get("task-run/1") is None
+
+    store.put("task-run/1", sync_id=1234, sync_run_id=42)
+    store.put("task-run/1", sync_id=1234, sync_run_id=43)
+
+    assert store.get("task-run/1") == {"sync_id": 1234, "sync_run_id": 43}
+    assert [path.name for path in (tmp_path / "checkpoints").iterdir()] == [
+        "task-run_1.json"
+    ]
+
+    store.delete("task-run/1")
+    store.delete("task-run/1")
+
+    assert store.get("task-run/1") is None
+
+
+def test_local_file_checkpoint_store_ignores_corrupted_files(tmp_path):
+    store = LocalFileCheckpointStore(tmp_path)
+    (tmp_path / "key.json").write_text("{")
+
+    assert store.get("key") is None
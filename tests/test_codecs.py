@@ -0,0 +1,41 @@
+import pytest
+
+from prefect_census import codecs
+from prefect_census.codecs import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    get_default_codec,
+)
+
+DOCUMENT = b'{"status": "success", "data": {"id": 1, "status": "completed"}}'
+DECODED = {"status": "success", "data": {"id": 1, "status": "completed"}}
+
+
+def test_stdlib_codec():
+    assert StdlibJSONCodec().loads(DOCUMENT) == DECODED
+
+
+def test_orjson_codec():
+    pytest.importorskip("orjson")
+
+    assert OrjsonCodec().loads(DOCUMENT) == DECODED
+
+
+def test_msgspec_codec():
+    pytest.importorskip("msgspec")
+
+    assert MsgspecCodec().loads(DOCUMENT) == DECODED
+
+
+def test_default_codec_falls_back_to_stdlib(monkeypatch):
+    def unavailable(self):
+        raise ImportError
+
+    monkeypatch.setattr(OrjsonCodec, "__init__", unavailable)
+    monkeypatch.setattr(MsgspecCodec, "__init__", unavailable)
+    get_default_codec.cache_clear()
+    try:
+        assert isinstance(codecs.get_default_codec(), StdlibJSONCodec)
+    finally:
+        get_default_codec.cache_clear()
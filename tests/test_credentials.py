@@ -1,5 +1,6 @@
 from pydantic import SecretStr
 
+from prefect_census.census_client import AsyncCensusClient, CensusClient
 from prefect_census.credentials import CensusCredentials
 
 
@@ -7,3 +8,16 @@ def test_credentials_construction():
     cred = CensusCredentials(access_token=SecretStr("foo"))
 
     assert cred.access_token.get_secret_value() == "foo"
+
+
+def test_credentials_get_client():
+    cred = CensusCredentials(access_token=SecretStr("foo"))
+
+    client = cred.get_client(pool_maxsize=42)
+    async_client = cred.get_async_client(max_connections=7)
+
+    assert isinstance(client, CensusClient)
+    assert client.credentials is cred
+    assert client.pool_maxsize == 42
+    assert isinstance(async_client, AsyncCensusClient)
+    assert async_client.max_connections == 7
@@ -0,0 +1,29 @@
+import pytest
+from pydantic import SecretStr
+
+from prefect_census.credentials import CensusCredentials
+from prefect_census.exceptions import CensusSyncGraphFailedException
+from prefect_census.flows import run_sync_graph
+
+
+def test_run_sync_graph(fake_census_server):
+    result = run_sync_graph(
+        credentials=CensusCredentials(access_token=SecretStr("foo")),
+        graph={3: [1, 2]},
+        poll_interval=0.02,
+    )
+
+    assert result["statuses"] == {1: "completed", 2: "completed", 3: "completed"}
+    assert result["critical_path"][1:] == [3]
+    assert result["critical_path_duration"] <= result["duration"]
+
+
+def test_run_sync_graph_with_failed_sync_raises(fake_census_server):
+    fake_census_server.add_sync(1, lifecycle=[("failed", 0)])
+
+    with pytest.raises(CensusSyncGraphFailedException, match=r"\[1\] failed"):
+        run_sync_graph(
+            credentials=CensusCredentials(access_token=SecretStr("foo")),
+            graph={3: [1, 2]},
+            poll_interval=0.02,
+        )
@@ -0,0 +1,98 @@
+import pytest
+
+from prefect_census.census_client import CensusClient
+from prefect_census.graph import SyncGraph
+from prefect_census.polling import FixedIntervalPolling
+
+FAILED_LIFECYCLE = [("working", 0.1), ("failed", 0)]
+
+
+@pytest.fixture
+def client(fake_census_server):
+    for sync_id in [4, 5]:
+        fake_census_server.add_sync(sync_id)
+    return CensusClient(
+        credentials="foo",
+        base_url=fake_census_server.url,
+        polling_strategy=FixedIntervalPolling(interval=0.02),
+    )
+
+
+def test_sync_graph_sorts_syncs():
+    graph = SyncGraph({3: [1, 2], 4: [3], 5: []})
+
+    assert len(graph) == 5
+    assert graph.order.index(3) > max(graph.order.index(1), graph.order.index(2))
+    assert graph.order.index(4) > graph.order.index(3)
+    assert graph.downstreams[1] == [3]
+
+
+def test_sync_graph_with_cycle_raises():
+    with pytest.raises(ValueError, match=r"cycle between syncs \[2, 3\]"):
+        SyncGraph({2: [1, 3], 3: [2]})
+
+
+def test_sync_graph_runs_syncs_after_their_upstreams(client):
+    result = SyncGraph({3: [1, 2], 4: [3]}).run(client)
+
+    assert result.statuses == {
+        1: "completed",
+        2: "completed",
+        3: "completed",
+        4: "completed",
+    }
+    # 1 and 2 run concurrently, 3 and 4 as soon as their upstreams completed
+    assert result.started_at[2] < result.finished_at[1]
+    assert result.started_at[3] >= max(result.finished_at[1], result.finished_at[2])
+    assert result.started_at[4] >= result.finished_at[3]
+    assert result.critical_path[1:] == [3, 4]
+    assert 0.3 <= result.critical_path_duration <= result.duration < 1.5
+
+
+def test_sync_graph_respects_max_concurrency(client):
+    result = SyncGraph({1: [], 2: [], 3: [], 4: []}).run(client, max_concurrency=2)
+
+    for instant in result.started_at.values():
+        running = [
+            sync_id
+            for sync_id in result.started_at
+            if result.started_at[sync_id] <= instant < result.finished_at[sync_id]
+        ]
+        assert len(running) <= 2
+    assert result.duration >= 0.2
+
+
+def test_sync_graph_skips_downstreams_of_failed_syncs(fake_census_server, client):
+    fake_census_server.add_sync(2, lifecycle=FAILED_LIFECYCLE)
+
+    result = SyncGraph({3: [1, 2], 4: [3], 5: [1], 42: []}).run(client)
+
+    assert result.statuses == {
+        1: "completed",
+        2: "failed",
+        3: "skipped",
+        4: "skipped",
+        5: "completed",
+        42: "failed",
+    }
+    assert result.failed == [2, 42]
+    assert result.skipped == [3, 4]
+    assert result.responses[2]["data"]["error_message"]
+    assert result.responses[42]["status"] == "error"
+    assert fake_census_server.request_counts["POST /syncs/{id}/trigger"] == 4
+
+
+def test_sync_graph_fails_syncs_that_time_out(fake_census_server, client):
+    fake_census_server.add_sync(2, lifecycle=[("working", 5), ("completed", 0)])
+    polling_strategy = FixedIntervalPolling(interval=0.02, timeout=0.5)
+
+    result = SyncGraph({3: [2], 4: [1]}).run(client, polling_strategy=polling_strategy)
+
+    assert result.statuses == {
+        1: "completed",
+        2: "failed",
+        3: "skipped",
+        4: "completed",
+    }
+    assert "did not complete in time" in result.responses[2]["message"]
+    assert result.finished_at[2] < 2
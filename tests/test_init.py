@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+import pytest
+
+import prefect_census
+
+
+def test_import_does_not_run_subprocesses():
+    code = (
+        "import subprocess\n"
+        "def fail(*args, **kwargs):\n"
+        "    raise AssertionError('subprocess called at import time')\n"
+        "subprocess.Popen = fail\n"
+        "import prefect_census\n"
+        "assert '__version__' not in vars(prefect_census)\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_version_is_resolved_lazily():
+    version = prefect_census.__version__
+
+    assert isinstance(version, str)
+    assert vars(prefect_census)["__version__"] == version
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        prefect_census.foo
+
+
+def test_core_modules_do_not_import_prefect():
+    code = (
+        "import sys\n"
+        "import prefect_census.census_client\n"
+        "import prefect_census.watcher\n"
+        "heavy = [m for m in sys.modules if m.split('.')[0] in ('prefect', 'httpx')]\n"
+        "assert not heavy, heavy\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,206 @@
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+import responses
+from pydantic import SecretStr
+
+from prefect_census.census_client import CensusClient
+from prefect_census.credentials import CensusCredentials
+from prefect_census.exceptions import CensusAPIFailureException
+from prefect_census.metrics import (
+    MetricsSink,
+    OpenTelemetryMetricsSink,
+    PrometheusMetricsSink,
+)
+from prefect_census.polling import FixedIntervalPolling
+from prefect_census.watcher import SyncRunWatcher
+
+
+class RecordingSink(MetricsSink):
+    def __init__(self):
+        self.requests = []
+        self.retries = []
+        self.sleeps = []
+        self.waits = []
+
+    def observe_request(self, http_method, endpoint, status, duration):
+        self.requests.append((http_method, endpoint, status))
+
+    def increment_retries(self, http_method, endpoint):
+        self.retries.append((http_method, endpoint))
+
+    def observe_sleep(self, reason, duration):
+        self.sleeps.append((reason, duration))
+
+    def observe_sync_run_wait(self, polls, duration, outcome):
+        self.waits.append((polls, outcome))
+
+
+@responses.activate
+def test_client_reports_requests_retries_and_polls(monkeypatch):
+    monkeypatch.setattr("prefect_census.census_client.sleep", lambda _: None)
+
+    trigger_url = "https://app.getcensus.com/api/v1/syncs/1234/trigger"
+    responses.add(
+        method=responses.POST,
+        url=trigger_url,
+        status=429,
+        headers={"Retry-After": "3"},
+    )
+    responses.add(
+        method=responses.POST,
+        url=trigger_url,
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 42}},
+    )
+    sync_run_url = "https://app.getcensus.com/api/v1/sync_runs/42"
+    responses.add(
+        method=responses.GET,
+        url=sync_run_url,
+        body=requests.exceptions.ConnectionError("connection reset"),
+    )
+    for status in ("working", "completed"):
+        responses.add(
+            method=responses.GET,
+            url=sync_run_url,
+            status=200,
+            json={"status": "success", "data": {"status": status}},
+        )
+
+    sink = RecordingSink()
+    client = CensusClient(
+        credentials=CensusCredentials(access_token=SecretStr("foo")),
+        polling_strategy=FixedIntervalPolling(interval=5),
+        metrics_sink=sink,
+    )
+    client.trigger_sync_run(sync_id=1234, wait_for_sync_run_completed=True)
+
+    assert sink.requests == [
+        ("POST", "/syncs/{id}/trigger", "429"),
+        ("POST", "/syncs/{id}/trigger", "200"),
+        ("GET", "/sync_runs/{id}", "error"),
+        ("GET", "/sync_runs/{id}", "200"),
+        ("GET", "/sync_runs/{id}", "200"),
+    ]
+    assert sink.retries == [
+        ("POST", "/syncs/{id}/trigger"),
+        ("GET", "/sync_runs/{id}"),
+    ]
+    assert sink.sleeps == [("retry", 3), ("retry", 0.5), ("poll", 5)]
+    assert sink.waits == [(2, "completed")]
+
+
+@responses.activate
+def test_client_reports_failed_wait():
+    responses.add(
+        method=responses.GET,
+        url="https://app.getcensus.com/api/v1/sync_runs/42",
+        status=200,
+        json={"status": "success", "data": {"status": "failed", "error_message": "!"}},
+    )
+
+    sink = RecordingSink()
+    client = CensusClient(credentials="foo", metrics_sink=sink)
+    with pytest.raises(CensusAPIFailureException):
+        client.wait_for_sync_run(sync_run_id=42)
+
+    assert sink.waits == [(1, "failed")]
+
+
+@responses.activate
+def test_watcher_reports_polls_per_run(monkeypatch):
+    monkeypatch.setattr("prefect_census.watcher.sleep", lambda _: None)
+    for status in ("working", "working", "completed"):
+        responses.add(
+            method=responses.GET,
+            url="https://app.getcensus.com/api/v1/sync_runs/42",
+            status=200,
+            json={"status": "success", "data": {"status": status}},
+        )
+
+    sink = RecordingSink()
+    client = CensusClient(credentials="foo", metrics_sink=sink)
+    watcher = SyncRunWatcher(
+        client=client,
+        sync_run_ids=[42],
+        polling_strategy=FixedIntervalPolling(interval=0),
+    )
+    watcher.wait()
+
+    assert sink.waits == [(3, "completed")]
+
+
+def test_prometheus_sink_renders_text_exposition():
+    sink = PrometheusMetricsSink(latency_buckets=(0.1, 1), poll_buckets=(1, 5))
+    sink.observe_request("GET", "/sync_runs/{id}", "200", 0.05)
+    sink.observe_request("GET", "/sync_runs/{id}", "200", 0.5)
+    sink.observe_request("GET", "/sync_runs/{id}", "503", 2)
+    sink.increment_retries("GET", "/sync_runs/{id}")
+    sink.observe_sleep("poll", 10)
+    sink.observe_sleep("poll", 2.5)
+    sink.observe_sync_run_wait(polls=3, duration=12.5, outcome="completed")
+
+    rendered = sink.render()
+
+    labels = 'endpoint="/sync_runs/{id}",method="GET"'
+    assert "# TYPE census_api_request_duration_seconds histogram" in rendered
+    assert f'census_api_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in (
+        rendered
+    )
+    assert f'census_api_request_duration_seconds_bucket{{{labels},le="1"}} 2' in (
+        rendered
+    )
+    assert f'census_api_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in (
+        rendered
+    )
+    assert f"census_api_request_duration_seconds_sum{{{labels}}} 2.55" in rendered
+    assert f"census_api_request_duration_seconds_count{{{labels}}} 3" in rendered
+    assert f'census_api_requests_total{{{labels},status="200"}} 2' in rendered
+    assert f'census_api_requests_total{{{labels},status="503"}} 1' in rendered
+    assert f"census_api_retries_total{{{labels}}} 1" in rendered
+    assert 'census_sleep_seconds_total{reason="poll"} 12.5' in rendered
+    assert 'census_sync_run_polls_bucket{outcome="completed",le="1"} 0' in rendered
+    assert 'census_sync_run_polls_bucket{outcome="completed",le="5"} 1' in rendered
+    assert rendered.endswith("\n")
+
+
+def test_prometheus_sink_escapes_label_values():
+    sink = PrometheusMetricsSink(namespace="test")
+    sink.observe_sleep('a"b\\c', 1)
+
+    assert 'test_sleep_seconds_total{reason="a\\"b\\\\c"} 1' in sink.render()
+
+
+def test_opentelemetry_sink_records_on_instruments():
+    meter = MagicMock()
+    instruments = {}
+    meter.create_histogram.side_effect = lambda name, **_: instruments.setdefault(
+        name, MagicMock()
+    )
+    meter.create_counter.side_effect = lambda name, **_: instruments.setdefault(
+        name, MagicMock()
+    )
+
+    sink = OpenTelemetryMetricsSink(meter=meter)
+    sink.observe_request("POST", "/syncs/{id}/trigger", "200", 0.2)
+    sink.observe_sleep("retry", 1.5)
+    sink.observe_sync_run_wait(polls=4, duration=30, outcome="timeout")
+
+    instruments["census.api.request.duration"].record.assert_called_once_with(
+        0.2, attributes={"method": "POST", "endpoint": "/syncs/{id}/trigger"}
+    )
+    instruments["census.api.requests"].add.assert_called_once_with(
+        1,
+        attributes={
+            "method": "POST",
+            "endpoint": "/syncs/{id}/trigger",
+            "status": "200",
+        },
+    )
+    instruments["census.sleep.duration"].add.assert_called_once_with(
+        1.5, attributes={"reason": "retry"}
+    )
+    instruments["census.sync_run.polls"].record.assert_called_once_with(
+        4, attributes={"outcome": "timeout"}
+    )
@@ -0,0 +1,71 @@
+import pickle
+from datetime import datetime, timezone
+
+from prefect_census.models import SyncRun, SyncTriggerResult
+
+SYNC_RUN_RESPONSE = {
+    "status": "success",
+    "data": {
+        "id": 94,
+        "sync_id": 52,
+        "source_record_count": 1,
+        "records_processed": 1,
+        "records_updated": 1,
+        "records_failed": 0,
+        "records_invalid": 0,
+        "created_at": "2021-10-20T02:51:07.546Z",
+        "updated_at": "2021-10-20T02:52:29.236Z",
+        "completed_at": "2021-10-20T02:52:29.234Z",
+        "scheduled_execution_time": None,
+        "error_code": None,
+        "error_message": None,
+        "error_detail": None,
+        "status": "completed",
+        "canceled": False,
+        "full_sync": True,
+        "sync_trigger_reason": {"ui_tag": "Manual"},
+    },
+}
+
+
+def test_sync_run_exposes_fields_as_attributes():
+    sync_run = SyncRun.from_response(SYNC_RUN_RESPONSE)
+
+    assert sync_run.id == 94
+    assert sync_run.status == "completed"
+    assert sync_run.records_processed == 1
+    assert sync_run.records_failed == 0
+    assert sync_run.created_at == datetime(
+        2021, 10, 20, 2, 51, 7, 546000, tzinfo=timezone.utc
+    )
+    assert sync_run.duration == 81.688
+    assert not hasattr(sync_run, "__dict__")
+
+
+def test_sync_run_round_trips_to_dict():
+    sync_run = SyncRun.from_response(SYNC_RUN_RESPONSE)
+
+    assert sync_run.to_dict() == SYNC_RUN_RESPONSE
+    assert pickle.loads(pickle.dumps(sync_run)) == sync_run
+
+
+def test_sync_run_in_progress_has_no_duration():
+    sync_run = SyncRun({"id": 1, "status": "working", "created_at": None})
+
+    assert sync_run.completed_at is None
+    assert sync_run.duration is None
+
+
+def test_sync_trigger_result_round_trips_to_dict():
+    success = {"status": "success", "data": {"sync_run_id": 1234567890}}
+    error = {"status": "error", "message": "Not Found"}
+
+    result = SyncTriggerResult.from_response(success)
+    assert result.succeeded
+    assert result.sync_run_id == 1234567890
+    assert result.to_dict() == success
+
+    result = SyncTriggerResult.from_response(error)
+    assert not result.succeeded
+    assert result.message == "Not Found"
+    assert result.to_dict() == error
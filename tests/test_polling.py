@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+from itertools import islice
+
+import pytest
+
+from prefect_census.models import SyncRun
+from prefect_census.polling import (
+    EstimatedDurationPolling,
+    ExponentialBackoffPolling,
+    FixedIntervalPolling,
+    SyncDurationEstimator,
+)
+
+
+def test_polling_strategy_deadline(monkeypatch):
+    monkeypatch.setattr("prefect_census.polling.monotonic", lambda: 100.0)
+
+    assert FixedIntervalPolling().get_deadline() is None
+    assert FixedIntervalPolling(timeout=30).get_deadline() == 130.0
+
+
+def test_fixed_interval_polling():
+    intervals = FixedIntervalPolling(interval=5).intervals()
+
+    assert list(islice(intervals, 3)) == [5, 5, 5]
+
+
+def test_exponential_backoff_polling_without_jitter():
+    strategy = ExponentialBackoffPolling(
+        initial_interval=1, multiplier=3, max_interval=20, jitter=False
+    )
+
+    assert list(islice(strategy.intervals(), 5)) == [1, 3, 9, 20, 20]
+
+
+def test_exponential_backoff_polling_with_jitter():
+    strategy = ExponentialBackoffPolling(initial_interval=2, max_interval=8)
+    intervals = list(islice(strategy.intervals(), 5))
+
+    for interval, upper_bound in zip(intervals, [2, 4, 8, 8, 8]):
+        assert 0 <= interval <= upper_bound
+
+
+def make_sync_run(sync_run_id, duration, status="completed", sync_id=1):
+    created_at = datetime(2021, 10, 20, 2, 50)
+    return {
+        "id": sync_run_id,
+        "sync_id": sync_id,
+        "status": status,
+        "created_at": created_at.isoformat(),
+        "completed_at": (created_at + timedelta(seconds=duration)).isoformat(),
+    }
+
+
+def test_polling_strategy_refine_intervals_keeps_intervals():
+    strategy = FixedIntervalPolling(interval=5)
+    intervals = strategy.intervals()
+
+    assert strategy.refine_intervals(intervals, sync_run={"sync_id": 1}) is intervals
+    strategy.observe(make_sync_run(1, duration=60))
+
+
+def test_sync_duration_estimator_moving_average():
+    estimator = SyncDurationEstimator(smoothing=0.5)
+    assert estimator.get_estimate(1) is None
+
+    estimator.record(sync_id=1, duration=100)
+    assert estimator.get_estimate(1) == (100, 50)
+
+    estimator.record(sync_id=1, duration=200)
+    assert estimator.get_estimate(1) == (150, 75)
+    assert len(estimator) == 1
+
+
+def test_sync_duration_estimator_invalid_smoothing():
+    with pytest.raises(ValueError, match="smoothing must be between 0 and 1"):
+        SyncDurationEstimator(smoothing=0)
+
+
+def test_sync_duration_estimator_observe():
+    estimator = SyncDurationEstimator(smoothing=0.5)
+    estimator.observe_many(
+        [
+            make_sync_run(1, duration=120),
+            # observed twice, e.g. by two waiters of the same sync run
+            make_sync_run(1, duration=120),
+            make_sync_run(2, duration=600, status="failed"),
+            {"id": 3, "sync_id": 1, "status": "completed"},
+            SyncRun(make_sync_run(4, duration=240)),
+        ]
+    )
+
+    assert estimator.get_estimate(1) == (180, 90)
+
+
+def test_estimated_duration_polling_without_estimate():
+    strategy = EstimatedDurationPolling(min_interval=1, max_interval=8)
+    intervals = strategy.intervals()
+
+    assert list(islice(intervals, 3)) == [1, 2, 4]
+    refined = strategy.refine_intervals(intervals, sync_run={"sync_id": 1})
+    assert list(islice(refined, 3)) == [8, 8, 8]
+
+
+def test_estimated_duration_polling_around_expected_completion():
+    strategy = EstimatedDurationPolling(
+        estimator=SyncDurationEstimator(smoothing=1), max_interval=60
+    )
+    strategy.observe(make_sync_run(1, duration=300))
+    strategy.observe(make_sync_run(2, duration=340))
+    # expected completion window: 340 +/- 40 seconds
+    assert strategy.estimator.get_estimate(1) == (340, 40)
+
+    intervals = strategy.refine_intervals(
+        strategy.intervals(), sync_run={"sync_id": 1}, elapsed=10
+    )
+
+    # sparse checks until the window, 10 checks within it, then backoff
+    assert list(islice(intervals, 19)) == (
+        [60, 60, 60, 60, 50] + [8] * 10 + [16, 32, 60, 60]
+    )
+
+
+def test_estimated_duration_polling_resumed_sync_run():
+    strategy = EstimatedDurationPolling(
+        estimator=SyncDurationEstimator(smoothing=1), max_interval=60
+    )
+    strategy.estimator.record(sync_id=1, duration=300)
+    strategy.estimator.record(sync_id=1, duration=340)
+
+    # the sync run was created 290 seconds before its last update:
+    # its expected completion window starts 10 seconds later
+    sync_run = {
+        "sync_id": 1,
+        "created_at": "2021-10-20T02:50:00Z",
+        "updated_at": "2021-10-20T02:54:50Z",
+    }
+    intervals = strategy.refine_intervals(strategy.intervals(), sync_run=sync_run)
+    assert list(islice(intervals, 12)) == [10] + [8] * 10 + [16]
+
+    # the time spent waiting counts when the sync run wasn't updated recently
+    intervals = strategy.refine_intervals(
+        strategy.intervals(), sync_run=sync_run, elapsed=380
+    )
+    assert next(intervals) == 16
@@ -0,0 +1,73 @@
+import pytest
+
+from prefect_census.rate_limiter import TokenBucket, get_shared_rate_limiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("prefect_census.rate_limiter.monotonic", lambda: now[0])
+    return now
+
+
+def test_token_bucket_invalid_configuration_raises():
+    with pytest.raises(ValueError, match="requests_per_second"):
+        TokenBucket(requests_per_second=0)
+
+    with pytest.raises(ValueError, match="burst_size"):
+        TokenBucket(requests_per_second=1, burst_size=0)
+
+
+def test_token_bucket_allows_burst_then_spaces_calls(clock):
+    bucket = TokenBucket(requests_per_second=2, burst_size=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert [bucket.reserve() for _ in range(2)] == [0.5, 1.0]
+
+
+def test_token_bucket_refills_over_time(clock):
+    bucket = TokenBucket(requests_per_second=2, burst_size=2)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock[0] = 0.5
+    assert bucket.reserve() == 0
+
+    clock[0] = 100
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0.5]
+
+
+def test_token_bucket_acquire_sleeps(clock, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("prefect_census.rate_limiter.sleep", sleeps.append)
+    bucket = TokenBucket(requests_per_second=4)
+
+    bucket.acquire()
+    bucket.acquire()
+
+    assert sleeps == [0.25]
+
+
+async def test_token_bucket_acquire_async_sleeps(clock, monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("prefect_census.rate_limiter.asyncio.sleep", fake_sleep)
+    bucket = TokenBucket(requests_per_second=4)
+
+    await bucket.acquire_async()
+    await bucket.acquire_async()
+
+    assert sleeps == [0.25]
+
+
+def test_get_shared_rate_limiter_is_keyed():
+    first = get_shared_rate_limiter(key="test-a", requests_per_second=5)
+    second = get_shared_rate_limiter(key="test-a", requests_per_second=10)
+    other = get_shared_rate_limiter(key="test-b", requests_per_second=5)
+
+    assert first is second
+    assert first.requests_per_second == 5
+    assert other is not first
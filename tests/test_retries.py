@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from prefect_census.retries import RetryPolicy
+
+
+@pytest.mark.parametrize(
+    "http_method, status_code, expected",
+    [
+        ("GET", 429, True),
+        ("GET", 503, True),
+        ("GET", 404, False),
+        ("POST", 429, True),
+        ("POST", 503, False),
+        ("POST", 502, False),
+    ],
+)
+def test_should_retry_status_code(http_method, status_code, expected):
+    policy = RetryPolicy()
+
+    assert (
+        policy.should_retry(http_method=http_method, attempt=0, status_code=status_code)
+        is expected
+    )
+
+
+def test_should_retry_connection_errors():
+    policy = RetryPolicy()
+
+    assert policy.should_retry(http_method="GET", attempt=0) is True
+    assert policy.should_retry(http_method="POST", attempt=0) is False
+    assert policy.should_retry(http_method="POST", attempt=0, request_sent=False)
+
+
+def test_should_retry_stops_after_max_retries():
+    policy = RetryPolicy(max_retries=2)
+
+    assert policy.should_retry(http_method="GET", attempt=1, status_code=503)
+    assert not policy.should_retry(http_method="GET", attempt=2, status_code=503)
+
+
+def test_get_delay_exponential_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+
+    assert [policy.get_delay(attempt=attempt) for attempt in range(4)] == [1, 2, 4, 5]
+
+
+def test_get_delay_honors_retry_after_seconds():
+    policy = RetryPolicy(max_backoff=5)
+
+    assert policy.get_delay(attempt=0, retry_after="42") == 42
+    assert policy.get_delay(attempt=0, retry_after="not a date") == 0.5
+    assert RetryPolicy(respect_retry_after=False).get_delay(0, "42") == 0.5
+
+
+def test_get_delay_honors_retry_after_http_date():
+    policy = RetryPolicy()
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+    delay = policy.get_delay(attempt=0, retry_after=format_datetime(retry_at))
+
+    assert 55 <= delay <= 60
+    assert policy.get_delay(attempt=0, retry_after=format_datetime(retry_at, True))
@@ -0,0 +1,248 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from prefect_census.census_client import AsyncCensusClient, CensusClient
+from prefect_census.exceptions import CensusSyncRunTimeoutException
+from prefect_census.singleflight import AsyncSingleFlight, SingleFlight
+from prefect_census.testing import FakeCensusServer
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {"status": "working"}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(single_flight.do, 42, fetch)
+        started.wait()
+        followers = [executor.submit(single_flight.do, 42, fetch) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in [leader] + followers]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert len(single_flight) == 0
+
+
+def test_single_flight_shares_exceptions_with_waiting_callers():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait()
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, 42, fetch)
+        started.wait()
+        follower = executor.submit(single_flight.do, 42, lambda: "unused")
+        release.set()
+
+        with pytest.raises(ValueError, match="boom"):
+            leader.result()
+        with pytest.raises(ValueError, match="boom"):
+            follower.result()
+
+
+def test_single_flight_follower_timeout():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait()
+        return "done"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(single_flight.do, 42, fetch)
+        started.wait()
+        with pytest.raises(TimeoutError):
+            single_flight.do(42, lambda: "unused", timeout=0.01)
+        release.set()
+        assert leader.result() == "done"
+
+
+def test_single_flight_calls_again_on_retry_on_exceptions():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch_with_short_deadline():
+        started.set()
+        release.wait()
+        raise DeadlineExceeded("deadline")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(single_flight.do, 42, fetch_with_short_deadline)
+        started.wait()
+        timer = threading.Timer(0.05, release.set)
+        timer.start()
+        result = single_flight.do(42, lambda: "done", retry_on=(DeadlineExceeded,))
+
+        assert result == "done"
+        with pytest.raises(DeadlineExceeded):
+            leader.result()
+
+
+async def test_async_single_flight_coalesces_concurrent_calls():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"status": "working"}
+
+    results = await asyncio.gather(*[single_flight.do(42, fetch) for _ in range(5)])
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert len(single_flight) == 0
+
+
+async def test_async_single_flight_shares_exceptions():
+    single_flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *[single_flight.do(42, fetch) for _ in range(3)], return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_async_single_flight_calls_again_on_retry_on_exceptions():
+    single_flight = AsyncSingleFlight()
+
+    async def fetch_with_short_deadline():
+        await asyncio.sleep(0.01)
+        raise DeadlineExceeded("deadline")
+
+    async def fetch():
+        return "done"
+
+    results = await asyncio.gather(
+        single_flight.do(42, fetch_with_short_deadline),
+        single_flight.do(42, fetch, retry_on=(DeadlineExceeded,)),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], DeadlineExceeded)
+    assert results[1] == "done"
+
+
+async def test_async_single_flight_cancelled_caller_does_not_cancel_others():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.ensure_future(single_flight.do(42, fetch))
+    await asyncio.sleep(0.01)
+    followers = [asyncio.ensure_future(single_flight.do(42, fetch)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await asyncio.gather(*followers) == ["done", "done"]
+    assert leader.cancelled()
+    # one of the followers made the call again for the other
+    assert len(calls) == 2
+    assert len(single_flight) == 0
+
+
+def test_census_client_coalesces_concurrent_get_sync_run():
+    with FakeCensusServer(sync_ids=[1], latency=0.2) as server:
+        client = CensusClient(credentials="foo", base_url=server.url)
+        sync_run_id = client.trigger_sync_run(sync_id=1)["data"]["sync_run_id"]
+        barrier = threading.Barrier(10)
+
+        def get_sync_run(_):
+            barrier.wait()
+            return client.get_sync_run(sync_run_id)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(get_sync_run, range(10)))
+
+        assert all(result["data"]["id"] == sync_run_id for result in results)
+        assert server.request_counts["GET /sync_runs/{id}"] == 1
+
+
+def test_census_client_waiting_caller_timeout():
+    with FakeCensusServer(sync_ids=[1], latency=0.5) as server:
+        client = CensusClient(credentials="foo", base_url=server.url)
+        sync_run_id = client.trigger_sync_run(sync_id=1)["data"]["sync_run_id"]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(client.get_sync_run, sync_run_id)
+            time.sleep(0.1)
+            with pytest.raises(CensusSyncRunTimeoutException, match="deadline"):
+                client.get_sync_run(sync_run_id, timeout=0.05)
+            assert leader.result()["data"]["id"] == sync_run_id
+
+
+def test_census_client_caller_deadline_is_not_shared():
+    with FakeCensusServer(sync_ids=[1], latency=0.3) as server:
+        client = CensusClient(credentials="foo", base_url=server.url)
+        sync_run_id = client.trigger_sync_run(sync_id=1)["data"]["sync_run_id"]
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(client.get_sync_run, sync_run_id, timeout=0.1)
+            time.sleep(0.02)
+            response = client.get_sync_run(sync_run_id)
+
+            assert response["data"]["id"] == sync_run_id
+            with pytest.raises(CensusSyncRunTimeoutException, match="deadline"):
+                leader.result()
+
+
+async def test_async_census_client_caller_deadline_is_not_shared():
+    with FakeCensusServer(sync_ids=[1], latency=0.3) as server:
+        async with AsyncCensusClient(credentials="foo", base_url=server.url) as client:
+            response = await client.trigger_sync_run(sync_id=1)
+            sync_run_id = response["data"]["sync_run_id"]
+            results = await asyncio.gather(
+                client.get_sync_run(sync_run_id, timeout=0.1),
+                client.get_sync_run(sync_run_id),
+                return_exceptions=True,
+            )
+
+        assert isinstance(results[0], CensusSyncRunTimeoutException)
+        assert results[1]["data"]["id"] == sync_run_id
+
+
+async def test_async_census_client_coalesces_concurrent_get_sync_run():
+    with FakeCensusServer(sync_ids=[1], latency=0.1) as server:
+        async with AsyncCensusClient(credentials="foo", base_url=server.url) as client:
+            response = await client.trigger_sync_run(sync_id=1)
+            sync_run_id = response["data"]["sync_run_id"]
+            results = await asyncio.gather(
+                *[client.get_sync_run(sync_run_id) for _ in range(10)]
+            )
+
+        assert all(result["data"]["id"] == sync_run_id for result in results)
+        assert server.request_counts["GET /sync_runs/{id}"] == 1
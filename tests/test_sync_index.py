@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from prefect_census.exceptions import CensusSyncResolutionException
+from prefect_census.sync_index import SyncIndex, get_shared_sync_index
+
+
+def make_sync(sync_id, label, obj="Contact", connection_id=1, updated_at="t0"):
+    return {
+        "id": sync_id,
+        "label": label,
+        "updated_at": updated_at,
+        "destination_attributes": {"connection_id": connection_id, "object": obj},
+    }
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.iter_syncs.side_effect = lambda: iter(client.syncs)
+    client.syncs = [
+        make_sync(1, "Contacts to Salesforce"),
+        make_sync(2, "Accounts to Salesforce", obj="Account"),
+        make_sync(3, "Contacts to Hubspot", connection_id=2),
+    ]
+    return client
+
+
+@pytest.fixture
+def mock_monotonic(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("prefect_census.sync_index.monotonic", lambda: now[0])
+    return now
+
+
+def test_resolve_identifiers_without_loading(client):
+    index = SyncIndex()
+
+    assert index.resolve(client, 42) == 42
+    assert index.resolve(client, "42") == 42
+    client.iter_syncs.assert_not_called()
+
+
+def test_resolve_by_label_and_object(client, mock_monotonic):
+    index = SyncIndex()
+
+    assert index.resolve(client, "Accounts to Salesforce") == 2
+    assert index.resolve(client, "Account") == 2
+    assert index.resolve(client, "2:Contact") == 3
+    assert client.iter_syncs.call_count == 1
+
+
+def test_resolve_ambiguous_raises(client, mock_monotonic):
+    index = SyncIndex()
+
+    with pytest.raises(CensusSyncResolutionException, match=r"Several.*\[1, 3\]"):
+        index.resolve(client, "Contact")
+
+
+def test_resolve_unknown_refreshes_then_raises(client, mock_monotonic):
+    index = SyncIndex()
+    index.refresh(client)
+    client.syncs.append(make_sync(4, "Leads to Salesforce", obj="Lead"))
+
+    assert index.resolve(client, "Lead") == 4
+    with pytest.raises(CensusSyncResolutionException, match="No Census sync"):
+        index.resolve(client, "Opportunity")
+    assert client.iter_syncs.call_count == 3
+
+
+def test_refresh_after_ttl_is_incremental(client, mock_monotonic):
+    index = SyncIndex(ttl=60)
+    assert index.resolve(client, "Contacts to Hubspot") == 3
+
+    client.syncs = [
+        client.syncs[0],
+        make_sync(2, "Accounts to Pipedrive", obj="Account", updated_at="t1"),
+    ]
+    mock_monotonic[0] = 30
+    assert index.resolve(client, "Accounts to Salesforce") == 2
+
+    mock_monotonic[0] = 61
+    assert index.resolve(client, "Accounts to Pipedrive") == 2
+    assert index.resolve(client, "Contact") == 1
+    assert len(index) == 2
+    assert index.get(client, 3) is None
+    with pytest.raises(CensusSyncResolutionException):
+        index.resolve(client, "Accounts to Salesforce")
+
+
+def test_get_shared_sync_index():
+    sync_index = get_shared_sync_index("test-shared-sync-index", ttl=10)
+
+    assert get_shared_sync_index("test-shared-sync-index", ttl=20) is sync_index
+    assert sync_index.ttl == 10
@@ -1,11 +1,22 @@
+import asyncio
+
 import pytest
 import responses
 from prefect import flow
 from pydantic import SecretStr
+from responses import matchers
 
+from prefect_census.checkpoints import LocalFileCheckpointStore
 from prefect_census.credentials import CensusCredentials
 from prefect_census.exceptions import CensusAPIFailureException
-from prefect_census.tasks import trigger_sync_run
+from prefect_census.models import SyncTriggerResult
+from prefect_census.polling import FixedIntervalPolling
+from prefect_census.tasks import (
+    trigger_sync_run,
+    trigger_sync_run_async,
+    trigger_sync_runs,
+    trigger_sync_runs_async,
+)
 
 
 def test_trigger_sync_run_raises():
@@ -38,6 +49,25 @@ def test_trigger_sync_no_wait_succeed():
     assert response == {"status": "success", "data": {"sync_run_id": 1234567890}}
 
 
+@responses.activate
+def test_trigger_sync_no_wait_typed_response():
+    responses.add(
+        method=responses.POST,
+        url="https://app.getcensus.com/api/v1/syncs/1234/trigger",
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 1234567890}},
+    )
+
+    @flow(name="no_wait_typed_flow")
+    def test_flow():
+        creds = CensusCredentials(access_token=SecretStr("foo"))
+        return trigger_sync_run(credentials=creds, sync_id=1234, typed_response=True)
+
+    result = test_flow()
+
+    assert result == SyncTriggerResult(status="success", sync_run_id=1234567890)
+
+
 @responses.activate
 def test_trigger_sync_with_wait_succeed():
     sync_id = 1234
@@ -83,3 +113,173 @@ def test_trigger_sync_with_wait_succeed():
         "status": "success",
         "data": {"status": "completed", "records_processed": 1},
     }
+
+
+@responses.activate
+def test_trigger_sync_runs_succeed():
+    responses.add(
+        method=responses.POST,
+        url="https://app.getcensus.com/api/v1/syncs/1/trigger",
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 10}},
+    )
+    responses.add(
+        method=responses.POST,
+        url="https://app.getcensus.com/api/v1/syncs/2/trigger",
+        status=200,
+        json={"status": "error", "message": "panic!"},
+    )
+
+    @flow(name="bulk_trigger_flow")
+    def test_flow():
+        creds = CensusCredentials(access_token=SecretStr("foo"))
+        return trigger_sync_runs(credentials=creds, sync_ids=[1, 2])
+
+    response = test_flow()
+
+    assert response == {
+        1: {"status": "success", "data": {"sync_run_id": 10}},
+        2: {"status": "error", "message": "Census API responded with error: panic!"},
+    }
+
+
+@responses.activate
+def test_trigger_sync_run_by_label_succeed():
+    responses.add(
+        method=responses.GET,
+        url="https://app.getcensus.com/api/v1/syncs",
+        status=200,
+        match=[matchers.query_param_matcher({"per_page": 100, "page": 1})],
+        json={
+            "status": "success",
+            "data": [{"id": 4321, "label": "Contacts to Salesforce"}],
+            "pagination": {"next_page": None},
+        },
+    )
+    responses.add(
+        method=responses.POST,
+        url="https://app.getcensus.com/api/v1/syncs/4321/trigger",
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 1234567890}},
+    )
+
+    @flow(name="trigger_by_label_success_flow")
+    def test_flow():
+        creds = CensusCredentials(access_token=SecretStr("by-label"))
+        return trigger_sync_run(credentials=creds, sync_id="Contacts to Salesforce")
+
+    response = test_flow()
+
+    assert response == {"status": "success", "data": {"sync_run_id": 1234567890}}
+
+
+def test_trigger_sync_run_async_gathered_in_flow(fake_census_server):
+    fake_census_server.add_sync(4, label="Contacts to Salesforce")
+
+    @flow(name="async_gather_flow")
+    async def test_flow():
+        creds = CensusCredentials(access_token=SecretStr("foo"))
+        return await asyncio.gather(
+            *[
+                trigger_sync_run_async(
+                    credentials=creds,
+                    sync_id=sync_id,
+                    wait_for_sync_run_completed=True,
+                    polling_strategy=FixedIntervalPolling(interval=0.05),
+                )
+                for sync_id in [1, 2, 3, "Contacts to Salesforce"]
+            ]
+        )
+
+    results = asyncio.run(test_flow())
+
+    assert [result["data"]["sync_id"] for result in results] == [1, 2, 3, 4]
+    assert all(result["data"]["status"] == "completed" for result in results)
+
+
+def test_trigger_sync_runs_async_succeed(fake_census_server):
+    @flow(name="async_trigger_many_flow")
+    async def test_flow():
+        creds = CensusCredentials(access_token=SecretStr("foo"))
+        return await trigger_sync_runs_async(credentials=creds, sync_ids=[1, 2, 42])
+
+    response = asyncio.run(test_flow())
+
+    assert response[1]["status"] == "success"
+    assert response[2]["status"] == "success"
+    assert response[42]["status"] == "error"
+    assert fake_census_server.request_counts["POST /syncs/{id}/trigger"] == 3
+
+
+@responses.activate
+def test_trigger_sync_run_retry_resumes_waiting(monkeypatch, tmp_path):
+    monkeypatch.setattr("prefect_census.census_client.sleep", lambda _: None)
+
+    trigger_url = "https://app.getcensus.com/api/v1/syncs/1234/trigger"
+    sync_run_url = "https://app.getcensus.com/api/v1/sync_runs/1234567890"
+    responses.add(
+        method=responses.POST,
+        url=trigger_url,
+        status=200,
+        json={"status": "success", "data": {"sync_run_id": 1234567890}},
+    )
+    responses.add(method=responses.GET, url=sync_run_url, status=400)
+    responses.add(
+        method=responses.GET,
+        url=sync_run_url,
+        status=200,
+        json={"status": "success", "data": {"status": "completed"}},
+    )
+    checkpoint_store = LocalFileCheckpointStore(tmp_path)
+
+    @flow(name="resume_wait_flow")
+    def test_flow():
+        creds = CensusCredentials(access_token=SecretStr("foo"))
+        return trigger_sync_run.with_options(retries=1)(
+            credentials=creds,
+            sync_id=1234,
+            wait_for_sync_run_completed=True,
+            checkpoint_store=checkpoint_store,
+        )
+
+    response = test_flow()
+
+    assert response == {"status": "success", "data": {"status": "completed"}}
+    assert responses.assert_call_count(trigger_url, 1) is True
+    assert list(tmp_path.iterdir()) == []
+
+
+@responses.activate
+def test_trigger_sync_run_retry_after_failed_sync_run_triggers_again(tmp_path):
+    trigger_url = "https://app.getcensus.com/api/v1/syncs/1234/trigger"
+    for sync_run_id, status in ((1, "failed"), (2, "completed")):
+        responses.add(
+            method=responses.POST,
+            url=trigger_url,
+            status=200,
+            json={"status": "success", "data": {"sync_run_id": sync_run_id}},
+        )
+        responses.add(
+            method=responses.GET,
+            url=f"https://app.getcensus.com/api/v1/sync_runs/{sync_run_id}",
+            status=200,
+            json={
+                "status": "success",
+                "data": {"status": status, "error_message": "failed!"},
+            },
+        )
+
+    @flow(name="retry_failed_sync_run_flow")
+    def test_flow():
+        creds = CensusCredentials(access_token=SecretStr("foo"))
+        return trigger_sync_run.with_options(retries=1)(
+            credentials=creds,
+            sync_id=1234,
+            wait_for_sync_run_completed=True,
+            checkpoint_store=LocalFileCheckpointStore(tmp_path),
+        )
+
+    response = test_flow()
+
+    assert response["data"]["status"] == "completed"
+    assert responses.assert_call_count(trigger_url, 2) is True
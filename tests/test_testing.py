@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+import pytest
+
+from prefect_census.census_client import AsyncCensusClient, CensusClient
+from prefect_census.exceptions import (
+    CensusAPIFailureException,
+    CensusSyncRunFailedException,
+)
+from prefect_census.polling import FixedIntervalPolling
+from prefect_census.retries import RetryPolicy
+from prefect_census.testing import FakeCensusServer
+
+QUEUED_LIFECYCLE = [("queued", 0.05), ("working", 0.1), ("completed", 0)]
+
+
+def test_fake_server_runs_scripted_lifecycle(fake_census_server):
+    fake_census_server.add_sync(1, lifecycle=QUEUED_LIFECYCLE)
+    client = CensusClient(
+        credentials="foo",
+        base_url=fake_census_server.url,
+        polling_strategy=FixedIntervalPolling(interval=0.02),
+    )
+
+    with client:
+        sync_run_id = client.trigger_sync_run(sync_id=1)["data"]["sync_run_id"]
+        assert client.get_sync_run(sync_run_id)["data"]["status"] == "queued"
+        response = client.wait_for_sync_run(sync_run_id)
+
+    assert response["data"]["status"] == "completed"
+    assert response["data"]["sync_id"] == 1
+    assert fake_census_server.request_counts["POST /syncs/{id}/trigger"] == 1
+    assert fake_census_server.request_counts["GET /sync_runs/{id}"] >= 3
+
+
+def test_fake_server_failed_lifecycle(fake_census_server):
+    fake_census_server.add_sync(3, lifecycle=[("working", 0.01), ("failed", 0)])
+    client = CensusClient(
+        credentials="foo",
+        base_url=fake_census_server.url,
+        polling_strategy=FixedIntervalPolling(interval=0.02),
+    )
+
+    with pytest.raises(CensusSyncRunFailedException, match="fake Census server"):
+        client.trigger_sync_run(sync_id=3, wait_for_sync_run_completed=True)
+
+
+def test_fake_server_unknown_sync_raises(fake_census_server):
+    client = CensusClient(credentials="foo", base_url=fake_census_server.url)
+
+    with pytest.raises(CensusAPIFailureException, match="Not Found"):
+        client.trigger_sync_run(sync_id=42)
+
+
+def test_fake_server_injected_errors_are_retried(fake_census_server):
+    fake_census_server.inject_errors(
+        status_code=503, count=2, endpoint="/sync_runs/{id}"
+    )
+    fake_census_server.inject_errors(status_code=429, retry_after=0)
+    client = CensusClient(
+        credentials="foo",
+        base_url=fake_census_server.url,
+        retry_policy=RetryPolicy(backoff_factor=0.01),
+    )
+
+    sync_run_id = client.trigger_sync_run(sync_id=1)["data"]["sync_run_id"]
+    client.get_sync_run(sync_run_id)
+
+    assert fake_census_server.request_counts["POST /syncs/{id}/trigger"] == 2
+    assert fake_census_server.request_counts["GET /sync_runs/{id}"] == 3
+
+
+def test_fake_server_rate_limits():
+    with FakeCensusServer(sync_ids=[1], requests_per_second=2, burst_size=2) as server:
+        client = CensusClient(
+            credentials="foo",
+            base_url=server.url,
+            retry_policy=RetryPolicy(max_retries=0),
+        )
+        client.trigger_sync_run(sync_id=1)
+        client.trigger_sync_run(sync_id=1)
+
+        with pytest.raises(CensusAPIFailureException, match="Too Many Requests"):
+            client.trigger_sync_run(sync_id=1)
+
+
+def test_fake_server_latency():
+    with FakeCensusServer(sync_ids=[1], latency=0.1) as server:
+        client = CensusClient(credentials="foo", base_url=server.url)
+        started_at = time.perf_counter()
+        client.trigger_sync_run(sync_id=1)
+
+    assert time.perf_counter() - started_at >= 0.1
+
+
+def test_fake_server_lists_syncs_and_sync_runs(fake_census_server):
+    fake_census_server.add_sync(3, label="Contacts", destination_object="Contact")
+    client = CensusClient(credentials="foo", base_url=fake_census_server.url)
+    sync_run_ids = [
+        client.trigger_sync_run(sync_id=3)["data"]["sync_run_id"] for _ in range(3)
+    ]
+
+    syncs = list(client.iter_syncs(per_page=2))
+    sync_runs = list(client.iter_sync_runs(sync_id=3, per_page=2))
+
+    assert [sync["id"] for sync in syncs] == [1, 2, 3]
+    assert syncs[2]["label"] == "Contacts"
+    assert [sync_run["id"] for sync_run in sync_runs] == sync_run_ids[::-1]
+
+
+def test_fake_server_with_async_client(fake_census_server):
+    async def trigger_and_wait():
+        async with AsyncCensusClient(
+            credentials="foo",
+            base_url=fake_census_server.url,
+            polling_strategy=FixedIntervalPolling(interval=0.02),
+        ) as client:
+            return await client.trigger_sync_run(
+                sync_id=2, wait_for_sync_run_completed=True
+            )
+
+    response = asyncio.run(trigger_and_wait())
+
+    assert response["data"]["status"] == "completed"
@@ -0,0 +1,153 @@
+import pytest
+import responses
+from pydantic import SecretStr
+
+from prefect_census.census_client import CensusClient
+from prefect_census.credentials import CensusCredentials
+from prefect_census.models import SyncRun
+from prefect_census.polling import ExponentialBackoffPolling, FixedIntervalPolling
+from prefect_census.watcher import SyncRunWatcher
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+
+    def fake_sleep(seconds):
+        now[0] += seconds
+
+    monkeypatch.setattr("prefect_census.watcher.sleep", fake_sleep)
+    monkeypatch.setattr("prefect_census.watcher.monotonic", lambda: now[0])
+    monkeypatch.setattr("prefect_census.polling.monotonic", lambda: now[0])
+    return now
+
+
+def add_sync_run_responses(sync_run_id, statuses):
+    for status in statuses:
+        data = {"status": status}
+        if status == "failed":
+            data["error_message"] = "failed!"
+        responses.add(
+            method=responses.GET,
+            url=f"https://app.getcensus.com/api/v1/sync_runs/{sync_run_id}",
+            status=200,
+            json={"status": "success", "data": data},
+        )
+
+
+@responses.activate
+def test_watcher_yields_runs_in_completion_order(clock):
+    add_sync_run_responses(1, ["working", "working", "completed"])
+    add_sync_run_responses(2, ["completed"])
+    add_sync_run_responses(3, ["working", "failed"])
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+    watcher = SyncRunWatcher(
+        client=client,
+        sync_run_ids=[1, 2, 3],
+        polling_strategy=ExponentialBackoffPolling(initial_interval=1, jitter=False),
+    )
+
+    assert len(watcher) == 3
+    results = list(watcher.watch())
+
+    assert [sync_run_id for sync_run_id, _ in results] == [2, 3, 1]
+    assert results[1][1]["data"]["status"] == "failed"
+    assert results[2][1]["data"]["status"] == "completed"
+    assert len(watcher) == 0
+    # first checks after 1s, then 2s, then 4s: run 1 completes at t=7
+    assert clock[0] == 7
+    assert len(responses.calls) == 6
+
+
+@responses.activate
+def test_watcher_accepts_runs_added_while_watching(clock):
+    add_sync_run_responses(1, ["completed"])
+    add_sync_run_responses(2, ["working", "completed"])
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(
+        credentials=creds, polling_strategy=FixedIntervalPolling(interval=5)
+    )
+    watcher = SyncRunWatcher(client=client, sync_run_ids=[1])
+
+    seen = []
+    for sync_run_id, _ in watcher.watch():
+        seen.append(sync_run_id)
+        if sync_run_id == 1:
+            watcher.add(2)
+            watcher.add(2)
+
+    assert seen == [1, 2]
+    assert clock[0] == 15
+
+
+@responses.activate
+def test_watcher_yields_timed_out_runs(clock):
+    add_sync_run_responses(1, ["working"])
+    add_sync_run_responses(2, ["working", "working", "completed"])
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds)
+    watcher = SyncRunWatcher(
+        client=client,
+        sync_run_ids=[1, 2],
+        polling_strategy=FixedIntervalPolling(interval=10, timeout=25),
+    )
+
+    results = list(watcher.watch())
+
+    # run 1 times out at t=25, run 2 is still watched and completes
+    # on its last check
+    assert [sync_run_id for sync_run_id, _ in results] == [1, 2]
+    assert results[0][1]["status"] == "error"
+    msg = "Sync run 1 did not complete in time, last known status: working"
+    assert results[0][1]["message"] == msg
+    assert results[1][1]["data"]["status"] == "completed"
+    assert clock[0] == 25
+    assert len(watcher) == 0
+
+
+@responses.activate
+def test_watcher_yields_runs_whose_status_cannot_be_checked(clock):
+    responses.add(
+        method=responses.GET,
+        url="https://app.getcensus.com/api/v1/sync_runs/1",
+        status=404,
+        json={"status": "not_found", "message": "Sync run not found"},
+    )
+    add_sync_run_responses(2, ["working", "completed"])
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(
+        credentials=creds, polling_strategy=FixedIntervalPolling(interval=5)
+    )
+    watcher = SyncRunWatcher(client=client, sync_run_ids=[1, 2])
+
+    results = watcher.wait()
+
+    assert results[1]["status"] == "error"
+    assert results[2]["data"]["status"] == "completed"
+    assert len(watcher) == 0
+    # the bookkeeping of both sync runs is released
+    assert watcher._polls == {} and watcher._started_at == {}
+
+
+@responses.activate
+def test_watcher_returns_typed_responses(clock):
+    add_sync_run_responses(1, ["working", "completed"])
+    add_sync_run_responses(2, ["failed"])
+
+    creds = CensusCredentials(access_token=SecretStr("foo"))
+    client = CensusClient(credentials=creds, typed_responses=True)
+    watcher = SyncRunWatcher(
+        client=client,
+        sync_run_ids=[1, 2],
+        polling_strategy=FixedIntervalPolling(interval=1),
+    )
+
+    results = watcher.wait()
+
+    assert results[1] == SyncRun({"status": "completed"})
+    assert results[2].error_message == "failed!"
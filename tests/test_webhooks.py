@@ -0,0 +1,157 @@
+import json
+from threading import Timer
+from time import monotonic
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from prefect_census.census_client import AsyncCensusClient, CensusClient
+from prefect_census.polling import FixedIntervalPolling
+from prefect_census.testing import FakeCensusServer
+from prefect_census.watcher import SyncRunWatcher
+from prefect_census.webhooks import SyncRunWebhookReceiver, parse_sync_run_event
+
+LIFECYCLE = [("working", 0.3), ("completed", 0)]
+
+
+def post(url, body):
+    request = Request(url, data=body, method="POST")
+    try:
+        with urlopen(request, timeout=5) as response:
+            return response.status
+    except HTTPError as exc:
+        return exc.code
+
+
+@pytest.fixture
+def receiver():
+    with SyncRunWebhookReceiver(
+        polling_strategy=FixedIntervalPolling(interval=30)
+    ) as receiver:
+        yield receiver
+
+
+@pytest.mark.parametrize(
+    "event, expected",
+    [
+        ({"event": "sync_run.completed", "data": {"sync_run_id": 1}}, (1, "completed")),
+        ({"payload": {"sync_run_id": "2", "status": "failed"}}, (2, "failed")),
+        ({"sync_run_id": 3, "status": "completed"}, (3, "completed")),
+        ({"event": "sync_run.working", "data": {"sync_run_id": 4}}, None),
+        ({"event": "sync.completed", "data": {"sync_id": 5}}, None),
+    ],
+)
+def test_parse_sync_run_event(event, expected):
+    assert parse_sync_run_event(event) == expected
+
+
+def test_receiver_records_webhooks():
+    with SyncRunWebhookReceiver(token="s3cret") as receiver:
+        body = json.dumps({"event": "sync_run.completed", "data": {"sync_run_id": 1}})
+
+        assert post(receiver.url.split("?")[0], body.encode()) == 401
+        assert post(receiver.url.replace("webhooks", "other"), body.encode()) == 404
+        assert post(receiver.url, b"not json") == 400
+        assert receiver.get_status(1) is None
+
+        assert post(receiver.url, body.encode()) == 204
+        assert receiver.get_status(1) == "completed"
+        assert receiver.wait(1, timeout=0) == "completed"
+        assert receiver.wait(2, timeout=0.01) is None
+
+
+async def test_receiver_wakes_async_waiters(receiver):
+    body = json.dumps({"sync_run_id": 1, "status": "failed"}).encode()
+    Timer(0.05, post, args=(receiver.url, body)).start()
+
+    assert await receiver.wait_async(1, timeout=5) == "failed"
+    assert await receiver.wait_async(2, timeout=0.01) is None
+
+
+def test_wait_for_sync_run_completes_on_webhook(receiver):
+    with FakeCensusServer(
+        sync_ids=[1], lifecycle=LIFECYCLE, webhook_url=receiver.url
+    ) as server:
+        client = CensusClient(
+            credentials="foo", base_url=server.url, webhook_receiver=receiver
+        )
+        started_at = monotonic()
+        response = client.trigger_sync_run(sync_id=1, wait_for_sync_run_completed=True)
+
+        assert response["data"]["status"] == "completed"
+        # the receiver polls every 30 seconds: only the webhook can explain this
+        assert monotonic() - started_at < 5
+        assert server.request_counts["GET /sync_runs/{id}"] == 2
+
+
+async def test_async_wait_for_sync_run_completes_on_webhook(receiver):
+    with FakeCensusServer(
+        sync_ids=[1], lifecycle=LIFECYCLE, webhook_url=receiver.url
+    ) as server:
+        async with AsyncCensusClient(
+            credentials="foo", base_url=server.url, webhook_receiver=receiver
+        ) as client:
+            response = await client.trigger_sync_run(
+                sync_id=1, wait_for_sync_run_completed=True
+            )
+
+        assert response["data"]["status"] == "completed"
+        assert server.request_counts["GET /sync_runs/{id}"] == 2
+
+
+def test_wait_for_sync_run_trusts_webhook_once():
+    polling_strategy = FixedIntervalPolling(interval=0.2)
+    with SyncRunWebhookReceiver(polling_strategy=polling_strategy) as receiver:
+        with FakeCensusServer(sync_ids=[1], lifecycle=LIFECYCLE) as server:
+            client = CensusClient(
+                credentials="foo", base_url=server.url, webhook_receiver=receiver
+            )
+            sync_run_id = client.trigger_sync_run(sync_id=1)["data"]["sync_run_id"]
+            # received before the API shows the sync run as completed
+            receiver.notify(sync_run_id, "completed")
+            response = client.wait_for_sync_run(sync_run_id=sync_run_id)
+
+            assert response["data"]["status"] == "completed"
+            # one check on the webhook, then one every 0.2 seconds
+            assert server.request_counts["GET /sync_runs/{id}"] <= 5
+
+
+async def test_async_wait_for_sync_run_trusts_webhook_once():
+    polling_strategy = FixedIntervalPolling(interval=0.2)
+    with SyncRunWebhookReceiver(polling_strategy=polling_strategy) as receiver:
+        with FakeCensusServer(sync_ids=[1], lifecycle=LIFECYCLE) as server:
+            async with AsyncCensusClient(
+                credentials="foo", base_url=server.url, webhook_receiver=receiver
+            ) as client:
+                response = await client.trigger_sync_run(sync_id=1)
+                sync_run_id = response["data"]["sync_run_id"]
+                receiver.notify(sync_run_id, "completed")
+                response = await client.wait_for_sync_run(sync_run_id=sync_run_id)
+
+            assert response["data"]["status"] == "completed"
+            assert server.request_counts["GET /sync_runs/{id}"] <= 5
+
+
+def test_watcher_checks_sync_runs_on_webhook(receiver):
+    lifecycle = [("working", 0.2), ("failed", 0)]
+    with FakeCensusServer(lifecycle=LIFECYCLE, webhook_url=receiver.url) as server:
+        server.add_sync(1)
+        server.add_sync(2, lifecycle=lifecycle)
+        client = CensusClient(
+            credentials="foo", base_url=server.url, webhook_receiver=receiver
+        )
+        sync_run_ids = [
+            client.trigger_sync_run(sync_id=sync_id)["data"]["sync_run_id"]
+            for sync_id in [1, 2, 1]
+        ]
+
+        started_at = monotonic()
+        results = SyncRunWatcher(client=client, sync_run_ids=sync_run_ids).wait()
+
+        assert monotonic() - started_at < 5
+        assert [results[i]["data"]["status"] for i in sync_run_ids] == [
+            "completed",
+            "failed",
+            "completed",
+        ]